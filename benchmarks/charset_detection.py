@@ -0,0 +1,92 @@
+"""Benchmark the declared/sniffed charset path against statistical detection.
+
+Usage:
+    uv run python benchmarks/charset_detection.py [URL or page.html ...]
+
+URLs are fetched once and keep the charset from their ``Content-Type`` header;
+saved pages rely on BOM and ``<meta charset>`` sniffing. Without arguments a
+synthetic corpus in several encodings is used.
+"""
+
+import argparse
+import statistics
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+import httpx
+
+from kabigon.loaders import utils
+
+Page = tuple[str, bytes, str | None]
+
+
+def fetch_page(url: str) -> Page:
+    response = httpx.get(url, follow_redirects=True, timeout=30.0)
+    response.raise_for_status()
+    return url, response.content, response.charset_encoding
+
+
+def synthetic_corpus() -> list[Page]:
+    texts = {
+        "utf-8": "Kabigon loads web pages — “quoted” café text. ",
+        "big5": "自由時報即時新聞 政治與社會焦點 ",
+        "shift_jis": "日本語のニュース記事の本文です。",
+        "cp1252": "Café crème “déjà vu” naïve. ",
+    }
+    corpus: list[Page] = []
+    for encoding, text in texts.items():
+        body = "".join(f"<p>{index} {text * 8}</p>" for index in range(4000))
+        head = f'<html><head><meta charset="{encoding}"><title>Bench</title></head>'
+        content = f"{head}<body>{body}</body></html>".encode(encoding)
+        corpus.append((f"synthetic-{encoding}", content, None))
+        corpus.append((f"synthetic-{encoding}+header", content, encoding))
+    return corpus
+
+
+def detect_then_convert(content: bytes, declared: str | None) -> str:
+    # The previous behaviour: always run statistical detection first.
+    return utils._decode_to_markdown(content, utils._detect_encoding(content), errors="replace")
+
+
+def measure(convert: Callable[[bytes, str | None], str], page: Page, repeat: int) -> tuple[float, str]:
+    _, content, declared = page
+    durations = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = convert(content, declared)
+        durations.append(time.perf_counter() - start)
+    return statistics.median(durations), result
+
+
+def fast_path(content: bytes, declared: str | None) -> str:
+    return utils.html_to_markdown(content, encoding=declared)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("pages", nargs="*", help="URLs or saved HTML files")
+    parser.add_argument("--repeat", type=int, default=5, help="runs per page; the median is reported")
+    args = parser.parse_args()
+
+    corpus = [
+        fetch_page(page) if page.startswith(("http://", "https://")) else (page, Path(page).read_bytes(), None)
+        for page in args.pages
+    ] or synthetic_corpus()
+
+    # "same" reports whether both paths produced identical markdown; a mismatch
+    # means statistical detection picked a different (usually wrong) charset.
+    print(f"{'page':<40} {'size':>9} {'detect':>9} {'fast path':>9} {'speedup':>8} {'same':>5}")
+    total_before = total_after = 0.0
+    for page in corpus:
+        before, expected = measure(detect_then_convert, page, args.repeat)
+        after, result = measure(fast_path, page, args.repeat)
+        total_before += before
+        total_after += after
+        same = "yes" if result == expected else "no"
+        print(f"{page[0][-40:]:<40} {len(page[1]):>9} {before:>8.3f}s {after:>8.3f}s {before / after:>7.2f}x {same:>5}")
+    print(f"{'total':<40} {'':>9} {total_before:>8.3f}s {total_after:>8.3f}s {total_before / total_after:>7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
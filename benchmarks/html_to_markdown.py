@@ -0,0 +1,66 @@
+"""Benchmark ``html_to_markdown`` against the previous markdownify pipeline.
+
+Usage:
+    uv run python benchmarks/html_to_markdown.py [page.html ...]
+
+Without arguments a synthetic ~2 MB article page is used. Pass saved pages
+(raw bytes as served) to measure a real corpus.
+"""
+
+import argparse
+import statistics
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+import charset_normalizer
+from markdownify import markdownify
+
+from kabigon.loaders.utils import html_to_markdown
+from kabigon.loaders.utils import normalize_whitespace
+
+
+def markdownify_pipeline(content: bytes) -> str:
+    text = str(charset_normalizer.from_bytes(content).best())
+    return normalize_whitespace(markdownify(text, strip=["a", "img"]))
+
+
+def synthetic_page(paragraphs: int = 4000) -> bytes:
+    sections = []
+    for index in range(paragraphs):
+        sections.append(
+            f"<h2>Section {index}</h2>"
+            f"<p>Paragraph {index} with <b>bold</b>, <i>italic</i>, <a href='/p/{index}'>a link</a> "
+            f"and <code>inline_code()</code>. 自由時報 content for multi-byte text.</p>"
+            f"<ul><li>first item</li><li>second <em>item</em></li></ul>"
+        )
+        if index % 50 == 0:
+            sections.append("<table><tr><th>A</th><th>B</th></tr><tr><td>1</td><td>2</td></tr></table>")
+    return f"<html><head><title>Bench</title></head><body>{''.join(sections)}</body></html>".encode()
+
+
+def measure(convert: Callable[[bytes], str], content: bytes, repeat: int) -> float:
+    durations = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        convert(content)
+        durations.append(time.perf_counter() - start)
+    return statistics.median(durations)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("pages", nargs="*", type=Path, help="HTML files to convert")
+    parser.add_argument("--repeat", type=int, default=5, help="runs per page; the median is reported")
+    args = parser.parse_args()
+
+    corpus = [(page.name, page.read_bytes()) for page in args.pages] or [("synthetic", synthetic_page())]
+    print(f"{'page':<32} {'size':>10} {'markdownify':>12} {'streaming':>12} {'speedup':>8}")
+    for name, content in corpus:
+        before = measure(markdownify_pipeline, content, args.repeat)
+        after = measure(html_to_markdown, content, args.repeat)
+        print(f"{name[:32]:<32} {len(content):>10} {before:>11.3f}s {after:>11.3f}s {before / after:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""Benchmark the compiled Pipeline matcher against a linear walk of the catalog.
+
+Usage:
+    uv run python benchmarks/pipeline_matching.py [--urls 1000000] [--known-ratio 0.2]
+
+The corpus is synthetic: mostly article URLs on many unrelated hosts, which
+is what batches usually contain, mixed with URLs for the catalog's sources.
+Every URL is distinct, so no per-URL parse cache helps either side. Both
+matchers are checked to return the same Pipeline for every URL.
+"""
+
+import argparse
+import random
+import time
+from collections import Counter
+from collections.abc import Callable
+
+from kabigon.pipelines.catalog import Pipeline
+from kabigon.pipelines.catalog import _match_pipeline_linear
+from kabigon.pipelines.catalog import match_pipeline
+
+KNOWN_TEMPLATES = (
+    "https://www.ptt.cc/bbs/Gossiping/M.{n}.A.FFC.html",
+    "https://x.com/user/status/{n}",
+    "https://www.reddit.com/r/python/comments/{n}/example/",
+    "https://www.youtube.com/watch?v={n:011d}",
+    "https://www.instagram.com/reel/{n}/",
+    "https://github.com/owner/repo/blob/main/file{n}.py",
+    "https://www.bbc.com/news/articles/{n}",
+    "https://edition.cnn.com/2026/01/01/world/story-{n}",
+    "https://news.ltn.com.tw/news/world/breakingnews/{n}",
+    "https://openai.com/index/post-{n}",
+    "https://arxiv.org/pdf/{n}",
+    "https://example.org/papers/{n}.pdf",
+)
+
+
+def build_corpus(size: int, known_ratio: float, seed: int) -> list[str]:
+    rng = random.Random(seed)
+    urls = []
+    for n in range(size):
+        if rng.random() < known_ratio:
+            urls.append(rng.choice(KNOWN_TEMPLATES).format(n=n))
+        else:
+            host = f"site{rng.randrange(5000)}.example.com"
+            urls.append(f"https://{host}/articles/{n}?ref=feed")
+    return urls
+
+
+def measure(match: Callable[[str], Pipeline | None], urls: list[str]) -> tuple[float, list[Pipeline | None]]:
+    start = time.perf_counter()
+    results = [match(url) for url in urls]
+    return time.perf_counter() - start, results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--urls", type=int, default=1_000_000, help="number of URLs to match")
+    parser.add_argument("--known-ratio", type=float, default=0.2, help="share of URLs on a catalog source")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    urls = build_corpus(args.urls, args.known_ratio, args.seed)
+    linear, expected = measure(_match_pipeline_linear, urls)
+    compiled, results = measure(match_pipeline, urls)
+
+    mismatches = sum(result != reference for result, reference in zip(results, expected, strict=True))
+    matched = Counter(result.name if result else "-" for result in results)
+    print(f"{'matcher':<10} {'total':>9} {'per URL':>10}")
+    for name, seconds in (("linear", linear), ("compiled", compiled)):
+        print(f"{name:<10} {seconds:>8.3f}s {seconds / len(urls) * 1e9:>8.0f}ns")
+    print(f"speedup {linear / compiled:.2f}x, mismatches {mismatches}")
+    print("matched:", ", ".join(f"{name}={count}" for name, count in sorted(matched.items())))
+
+
+if __name__ == "__main__":
+    main()
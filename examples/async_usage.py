@@ -19,10 +19,13 @@ async def main() -> None:
     ]
 
     print(f"Loading {len(urls)} URLs in parallel...")
-    results = await asyncio.gather(*[kabigon.load_url(url) for url in urls])
+    results = await kabigon.load_urls(urls, concurrency=4, per_host_limit=2)
 
-    for url, content in zip(urls, results, strict=True):
-        print(f"{url}: {len(content)} chars")
+    for result in results:
+        if result.ok:
+            print(f"{result.url}: {len(result.text or '')} chars")
+        else:
+            print(f"{result.url}: failed ({result.error})")
 
 
 if __name__ == "__main__":
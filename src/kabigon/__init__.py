@@ -1,15 +1,39 @@
 import logging
 
+from .api import BatchResult
+from .api import ExecutionMode
+from .api import TimingEvent
 from .api import available_loaders
+from .api import collect_timings
 from .api import explain_plan
+from .api import explain_plans
+from .api import iter_load_urls
 from .api import load_url
 from .api import load_url_sync
+from .api import load_url_with_timings
+from .api import load_url_with_timings_sync
+from .api import load_urls
+from .api import load_urls_sync
+from .api import loader_session
+from .api import timing_hook
 
 __all__ = [
+    "BatchResult",
+    "ExecutionMode",
+    "TimingEvent",
     "available_loaders",
+    "collect_timings",
     "explain_plan",
+    "explain_plans",
+    "iter_load_urls",
     "load_url",
     "load_url_sync",
+    "load_url_with_timings",
+    "load_url_with_timings_sync",
+    "load_urls",
+    "load_urls_sync",
+    "loader_session",
+    "timing_hook",
 ]
 
 logger = logging.getLogger(__name__)
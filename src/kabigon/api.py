@@ -1,16 +1,63 @@
 """Public Python interface for loading URL content."""
 
+from collections.abc import Iterable
+from collections.abc import Iterator
+
+from kabigon.batch import BatchResult
+from kabigon.batch import iter_load_urls
+from kabigon.batch import load_urls
+from kabigon.batch import load_urls_sync
+from kabigon.cache import ContentCache
+from kabigon.load_chain import LoadChainPlanner
 from kabigon.load_chain import explain_load_chain
 from kabigon.load_chain import resolve_load_chain
 from kabigon.loader_registry import list_loader_names
+from kabigon.loaders.session import loader_session
+from kabigon.pipelines.catalog import ExecutionMode
+from kabigon.timing import TimingEvent
+from kabigon.timing import collect_timings
+from kabigon.timing import timing_hook
+
+
+def load_url_sync(
+    url: str,
+    *,
+    cache: ContentCache | None = None,
+    execution_mode: ExecutionMode | None = None,
+) -> str:
+    return resolve_load_chain(url, cache=cache, execution_mode=execution_mode).load_sync()
+
 
+async def load_url(
+    url: str,
+    *,
+    cache: ContentCache | None = None,
+    execution_mode: ExecutionMode | None = None,
+) -> str:
+    return await resolve_load_chain(url, cache=cache, execution_mode=execution_mode).load()
 
-def load_url_sync(url: str) -> str:
-    return resolve_load_chain(url).load_sync()
 
+async def load_url_with_timings(
+    url: str,
+    *,
+    cache: ContentCache | None = None,
+    execution_mode: ExecutionMode | None = None,
+) -> tuple[str, list[TimingEvent]]:
+    """Load ``url`` and return its text with the timing events of every stage."""
+    with collect_timings() as timings:
+        text = await load_url(url, cache=cache, execution_mode=execution_mode)
+    return text, timings
 
-async def load_url(url: str) -> str:
-    return await resolve_load_chain(url).load()
+
+def load_url_with_timings_sync(
+    url: str,
+    *,
+    cache: ContentCache | None = None,
+    execution_mode: ExecutionMode | None = None,
+) -> tuple[str, list[TimingEvent]]:
+    with collect_timings() as timings:
+        text = load_url_sync(url, cache=cache, execution_mode=execution_mode)
+    return text, timings
 
 
 def available_loaders() -> list[str]:
@@ -21,4 +68,32 @@ def explain_plan(url: str) -> dict[str, object]:
     return explain_load_chain(url).as_dict()
 
 
-__all__ = ["available_loaders", "explain_plan", "load_url", "load_url_sync"]
+def explain_plans(urls: Iterable[str]) -> Iterator[dict[str, object]]:
+    """Yield ``explain_plan`` for each URL, sharing parsing and requirement checks.
+
+    URLs are planned lazily, so large inputs can be streamed through. A URL
+    that cannot be planned, such as a malformed one, yields
+    ``{"url": ..., "error": ...}`` and the remaining URLs are still planned.
+    """
+    for explanation in LoadChainPlanner().explain_all(urls):
+        yield explanation.as_dict()
+
+
+__all__ = [
+    "BatchResult",
+    "ExecutionMode",
+    "TimingEvent",
+    "available_loaders",
+    "collect_timings",
+    "explain_plan",
+    "explain_plans",
+    "iter_load_urls",
+    "load_url",
+    "load_url_sync",
+    "load_url_with_timings",
+    "load_url_with_timings_sync",
+    "load_urls",
+    "load_urls_sync",
+    "loader_session",
+    "timing_hook",
+]
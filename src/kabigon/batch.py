@@ -0,0 +1,265 @@
+"""Batch loading for many URLs on one event loop.
+
+Each URL resolves its own Load chain; the batch only bounds how many chains run
+at once, globally and per host, so a large crawl neither serializes nor starts
+hundreds of browsers at the same time.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import itertools
+import logging
+from collections import deque
+from collections.abc import AsyncIterator
+from collections.abc import Iterable
+from dataclasses import dataclass
+from urllib.parse import urlparse
+
+import kabigon.loader_registry as loader_names
+from kabigon.cache import ContentCache
+from kabigon.executors import run_io
+from kabigon.load_chain import resolve_load_chain
+from kabigon.loader_stats import default_loader_stats
+from kabigon.loaders.firecrawl import FirecrawlBatchScraper
+from kabigon.loaders.firecrawl import firecrawl_batch_session
+from kabigon.loaders.session import loader_session
+from kabigon.pipelines.catalog import ExecutionMode
+from kabigon.pipelines.catalog import match_pipeline
+
+DEFAULT_CONCURRENCY = 16
+DEFAULT_PER_HOST_LIMIT = 4
+_INVALID_CONCURRENCY = "concurrency must be at least 1."
+_INVALID_PER_HOST_LIMIT = "per_host_limit must be at least 1."
+
+# Input is consumed lazily so a 200k-URL batch is not read up front. URLs
+# waiting for a busy host are queued per host, outside the running tasks, and
+# reading only pauses once this many URLs per slot are queued.
+_QUEUED_PER_SLOT = 1024
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class BatchResult:
+    index: int
+    url: str
+    text: str | None = None
+    error: Exception | None = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+class _HostQueues:
+    """URLs waiting to start, one queue per host, handed out round-robin among hosts under their limit."""
+
+    def __init__(self, limit: int) -> None:
+        self.limit = limit
+        self.queued = 0
+        self._waiting: dict[str, deque[tuple[int, str]]] = {}
+        self._running: dict[str, int] = {}
+        # Hosts with waiting URLs and a free slot; each appears at most once.
+        self._ready: deque[str] = deque()
+
+    def push(self, index: int, url: str) -> None:
+        host = _queue_key(url)
+        waiting = self._waiting.get(host)
+        if waiting is None:
+            waiting = self._waiting[host] = deque()
+            if self._running.get(host, 0) < self.limit:
+                self._ready.append(host)
+        waiting.append((index, url))
+        self.queued += 1
+
+    def pop(self) -> tuple[str, int, str] | None:
+        if not self._ready:
+            return None
+        host = self._ready.popleft()
+        waiting = self._waiting[host]
+        index, url = waiting.popleft()
+        self.queued -= 1
+        running = self._running[host] = self._running.get(host, 0) + 1
+        if not waiting:
+            del self._waiting[host]
+        elif running < self.limit:
+            self._ready.append(host)
+        return host, index, url
+
+    def release(self, host: str) -> None:
+        running = self._running[host] - 1
+        if running:
+            self._running[host] = running
+        else:
+            del self._running[host]
+        if running == self.limit - 1 and host in self._waiting:
+            self._ready.append(host)
+
+
+def _host_key(url: str) -> str:
+    return urlparse(url).netloc.lower()
+
+
+def _queue_key(url: str) -> str:
+    try:
+        return _host_key(url)
+    except ValueError:
+        # Malformed URL; its own chain reports the error.
+        return ""
+
+
+def _targets_firecrawl(url: str) -> bool:
+    try:
+        pipeline = match_pipeline(url)
+    except ValueError:
+        # Malformed URL; its own chain reports the error.
+        return False
+    return pipeline is not None and pipeline.targeted_loaders[:1] == (loader_names.FIRECRAWL,)
+
+
+def _uncached(cache: ContentCache, urls: list[str]) -> list[str]:
+    return [url for url in urls if cache.get(url) is None]
+
+
+async def _submit_firecrawl_batch(
+    firecrawl: FirecrawlBatchScraper | None,
+    chunk: list[tuple[int, str]],
+    cache: ContentCache | None,
+) -> None:
+    if firecrawl is None:
+        return
+    urls = [url for _index, url in chunk if _targets_firecrawl(url)]
+    if cache is not None and urls:
+        urls = await run_io(_uncached, cache, urls)
+    firecrawl.submit(urls)
+
+
+def _validate_limits(concurrency: int, per_host_limit: int) -> None:
+    if concurrency < 1:
+        raise ValueError(_INVALID_CONCURRENCY)
+    if per_host_limit < 1:
+        raise ValueError(_INVALID_PER_HOST_LIMIT)
+
+
+async def _load_one(
+    index: int,
+    url: str,
+    cache: ContentCache | None,
+    execution_mode: ExecutionMode | None,
+) -> BatchResult:
+    try:
+        text = await resolve_load_chain(url, cache=cache, execution_mode=execution_mode).load()
+    except Exception as e:  # noqa: BLE001 - one bad URL must not abort the batch
+        logger.debug("Batch item %s failed: %s: %s", index, url, e)
+        return BatchResult(index=index, url=url, error=e)
+    return BatchResult(index=index, url=url, text=text)
+
+
+async def iter_load_urls(
+    urls: Iterable[str],
+    *,
+    concurrency: int = DEFAULT_CONCURRENCY,
+    per_host_limit: int = DEFAULT_PER_HOST_LIMIT,
+    cache: ContentCache | None = None,
+    execution_mode: ExecutionMode | None = None,
+) -> AsyncIterator[BatchResult]:
+    """Load URLs concurrently and yield each result as soon as it finishes.
+
+    Failures are yielded as results carrying the exception (usually a
+    ``LoaderError`` with per-loader details, or a ``ValueError`` for a
+    malformed URL) instead of aborting the batch.
+    """
+    _validate_limits(concurrency, per_host_limit)
+    queues = _HostQueues(per_host_limit)
+    max_queued = concurrency * _QUEUED_PER_SLOT
+    indexed_urls = enumerate(urls)
+    exhausted = False
+    running: dict[asyncio.Task[BatchResult], str] = {}
+
+    # One loader session for the whole batch so every chain shares pooled clients;
+    # Firecrawl-targeted URLs read together are scraped as one batch job.
+    async with loader_session(), firecrawl_batch_session() as firecrawl:
+        try:
+            while True:
+                # Fill free slots from hosts under their limit, reading more input only
+                # when every queued URL is waiting on a busy host.
+                while len(running) < concurrency:
+                    item = queues.pop()
+                    if item is None:
+                        if exhausted or queues.queued >= max_queued:
+                            break
+                        chunk = list(itertools.islice(indexed_urls, concurrency))
+                        exhausted = len(chunk) < concurrency
+                        await _submit_firecrawl_batch(firecrawl, chunk, cache)
+                        for index, url in chunk:
+                            queues.push(index, url)
+                        continue
+                    host, index, url = item
+                    running[asyncio.create_task(_load_one(index, url, cache, execution_mode))] = host
+                if not running:
+                    return
+                done, _pending = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    queues.release(running.pop(task))
+                    yield task.result()
+        finally:
+            for task in running:
+                task.cancel()
+            await asyncio.gather(*running, return_exceptions=True)
+            # Chains flush statistics at most every flush_interval; write what is left once per batch.
+            stats = default_loader_stats()
+            if stats is not None:
+                await run_io(stats.flush)
+
+
+async def load_urls(
+    urls: Iterable[str],
+    *,
+    concurrency: int = DEFAULT_CONCURRENCY,
+    per_host_limit: int = DEFAULT_PER_HOST_LIMIT,
+    cache: ContentCache | None = None,
+    execution_mode: ExecutionMode | None = None,
+) -> list[BatchResult]:
+    """Load URLs concurrently and return one result per URL in input order."""
+    results = [
+        result
+        async for result in iter_load_urls(
+            urls,
+            concurrency=concurrency,
+            per_host_limit=per_host_limit,
+            cache=cache,
+            execution_mode=execution_mode,
+        )
+    ]
+    results.sort(key=lambda result: result.index)
+    return results
+
+
+def load_urls_sync(
+    urls: Iterable[str],
+    *,
+    concurrency: int = DEFAULT_CONCURRENCY,
+    per_host_limit: int = DEFAULT_PER_HOST_LIMIT,
+    cache: ContentCache | None = None,
+    execution_mode: ExecutionMode | None = None,
+) -> list[BatchResult]:
+    return asyncio.run(
+        load_urls(
+            urls,
+            concurrency=concurrency,
+            per_host_limit=per_host_limit,
+            cache=cache,
+            execution_mode=execution_mode,
+        )
+    )
+
+
+__all__ = [
+    "DEFAULT_CONCURRENCY",
+    "DEFAULT_PER_HOST_LIMIT",
+    "BatchResult",
+    "iter_load_urls",
+    "load_urls",
+    "load_urls_sync",
+]
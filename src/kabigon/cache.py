@@ -0,0 +1,310 @@
+"""Content cache consulted by Load chains before any Loader runs.
+
+Entries are keyed on a normalized URL, expire after a TTL chosen by the
+Pipeline's content type, and remember which Loader produced them. Two backends
+are provided: an in-memory LRU and a SQLite file that survives restarts. Both
+evict least-recently-used entries once a size bound is exceeded.
+"""
+
+from __future__ import annotations
+
+import sqlite3
+import threading
+import time
+from abc import ABC
+from abc import abstractmethod
+from collections import OrderedDict
+from collections.abc import Callable
+from collections.abc import Mapping
+from dataclasses import dataclass
+from pathlib import Path
+from urllib.parse import parse_qsl
+from urllib.parse import urlencode
+from urllib.parse import urlsplit
+from urllib.parse import urlunsplit
+
+from kabigon.pipelines.catalog import ContentType
+
+Clock = Callable[[], float]
+
+MINUTE = 60.0
+HOUR = 60 * MINUTE
+DAY = 24 * HOUR
+
+DEFAULT_CACHE_TTLS: Mapping[ContentType, float] = {
+    ContentType.DOCUMENT_PDF: 7 * DAY,
+    ContentType.CODE_CONTENT: DAY,
+    ContentType.YOUTUBE_VIDEO: 7 * DAY,
+    ContentType.NEWS_ARTICLE: HOUR,
+    ContentType.GENERIC_WEB: 15 * MINUTE,
+    ContentType.SOCIAL_POST: 5 * MINUTE,
+}
+
+DEFAULT_MAX_ENTRIES = 1024
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+_TRACKING_QUERY_PREFIXES = ("utm_",)
+_TRACKING_QUERY_KEYS = frozenset({"fbclid", "gclid", "mc_cid", "mc_eid"})
+_DEFAULT_PORTS = {"http": 80, "https": 443}
+
+
+def normalize_cache_key(url: str) -> str:
+    """Normalize a URL so trivially different spellings share one cache entry.
+
+    Lower-cases scheme and host, drops default ports, fragments, and tracking
+    query parameters, and sorts the remaining query. Local file paths are
+    returned unchanged.
+    """
+    parts = urlsplit(url)
+    scheme = parts.scheme.lower()
+    if scheme not in _DEFAULT_PORTS:
+        return url
+
+    host = (parts.hostname or "").lower()
+    if parts.port is not None and parts.port != _DEFAULT_PORTS[scheme]:
+        host = f"{host}:{parts.port}"
+
+    query = sorted(
+        (key, value)
+        for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if key not in _TRACKING_QUERY_KEYS and not key.startswith(_TRACKING_QUERY_PREFIXES)
+    )
+    return urlunsplit((scheme, host, parts.path or "/", urlencode(query), ""))
+
+
+@dataclass(frozen=True)
+class CacheEntry:
+    key: str
+    text: str
+    loader: str
+    content_type: ContentType
+    created_at: float
+    expires_at: float
+
+    @property
+    def size(self) -> int:
+        return len(self.text.encode("utf-8"))
+
+
+class ContentCache(ABC):
+    def __init__(self, *, ttls: Mapping[ContentType, float] | None = None, clock: Clock = time.time) -> None:
+        self.ttls = dict(DEFAULT_CACHE_TTLS if ttls is None else ttls)
+        self.clock = clock
+
+    def ttl_for(self, content_type: ContentType) -> float:
+        return self.ttls.get(content_type, 0.0)
+
+    def get(self, url: str) -> CacheEntry | None:
+        key = normalize_cache_key(url)
+        entry = self._get(key)
+        if entry is None:
+            return None
+        if entry.expires_at <= self.clock():
+            self._delete(key)
+            return None
+        return entry
+
+    def put(self, url: str, text: str, *, loader: str, content_type: ContentType) -> CacheEntry | None:
+        """Store ``text`` for ``url``; content types with no positive TTL are not cached."""
+        ttl = self.ttl_for(content_type)
+        if ttl <= 0:
+            return None
+
+        now = self.clock()
+        entry = CacheEntry(
+            key=normalize_cache_key(url),
+            text=text,
+            loader=loader,
+            content_type=content_type,
+            created_at=now,
+            expires_at=now + ttl,
+        )
+        self._set(entry)
+        return entry
+
+    @abstractmethod
+    def clear(self) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def _get(self, key: str) -> CacheEntry | None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def _set(self, entry: CacheEntry) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def _delete(self, key: str) -> None:
+        raise NotImplementedError
+
+
+class MemoryCache(ContentCache):
+    """In-process LRU bounded by entry count and total text size."""
+
+    def __init__(
+        self,
+        *,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        ttls: Mapping[ContentType, float] | None = None,
+        clock: Clock = time.time,
+    ) -> None:
+        super().__init__(ttls=ttls, clock=clock)
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries: OrderedDict[str, tuple[CacheEntry, int]] = OrderedDict()
+        self._total_bytes = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def total_bytes(self) -> int:
+        return self._total_bytes
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._total_bytes = 0
+
+    def _get(self, key: str) -> CacheEntry | None:
+        with self._lock:
+            stored = self._entries.get(key)
+            if stored is None:
+                return None
+            self._entries.move_to_end(key)
+            return stored[0]
+
+    def _set(self, entry: CacheEntry) -> None:
+        size = entry.size
+        with self._lock:
+            self._pop(entry.key)
+            if size > self.max_bytes:
+                return
+            self._entries[entry.key] = (entry, size)
+            self._total_bytes += size
+            while len(self._entries) > self.max_entries or self._total_bytes > self.max_bytes:
+                oldest_key = next(iter(self._entries))
+                self._pop(oldest_key)
+
+    def _delete(self, key: str) -> None:
+        with self._lock:
+            self._pop(key)
+
+    def _pop(self, key: str) -> None:
+        stored = self._entries.pop(key, None)
+        if stored is not None:
+            self._total_bytes -= stored[1]
+
+
+_SQLITE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    key TEXT PRIMARY KEY,
+    text TEXT NOT NULL,
+    loader TEXT NOT NULL,
+    content_type TEXT NOT NULL,
+    created_at REAL NOT NULL,
+    expires_at REAL NOT NULL,
+    accessed_at REAL NOT NULL,
+    size INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS entries_accessed_at ON entries (accessed_at);
+"""
+
+
+class SQLiteCache(ContentCache):
+    """On-disk cache in a single SQLite file, bounded by total text size."""
+
+    def __init__(
+        self,
+        path: str | Path,
+        *,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        ttls: Mapping[ContentType, float] | None = None,
+        clock: Clock = time.time,
+    ) -> None:
+        super().__init__(ttls=ttls, clock=clock)
+        self.path = Path(path).expanduser()
+        self.max_bytes = max_bytes
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(_SQLITE_SCHEMA)
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM entries")
+
+    def _get(self, key: str) -> CacheEntry | None:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT key, text, loader, content_type, created_at, expires_at FROM entries WHERE key = ?",
+                (key,),
+            ).fetchone()
+            if row is None:
+                return None
+            self._conn.execute("UPDATE entries SET accessed_at = ? WHERE key = ?", (self.clock(), key))
+        return CacheEntry(
+            key=row[0],
+            text=row[1],
+            loader=row[2],
+            content_type=ContentType(row[3]),
+            created_at=row[4],
+            expires_at=row[5],
+        )
+
+    def _set(self, entry: CacheEntry) -> None:
+        size = entry.size
+        with self._lock:
+            if size > self.max_bytes:
+                self._conn.execute("DELETE FROM entries WHERE key = ?", (entry.key,))
+                return
+            self._conn.execute(
+                "INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    entry.key,
+                    entry.text,
+                    entry.loader,
+                    str(entry.content_type),
+                    entry.created_at,
+                    entry.expires_at,
+                    entry.created_at,
+                    size,
+                ),
+            )
+            self._evict()
+
+    def _delete(self, key: str) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM entries WHERE key = ?", (key,))
+
+    def _evict(self) -> None:
+        self._conn.execute("DELETE FROM entries WHERE expires_at <= ?", (self.clock(),))
+        (total,) = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()
+        if total <= self.max_bytes:
+            return
+
+        stale_keys: list[str] = []
+        for key, size in self._conn.execute("SELECT key, size FROM entries ORDER BY accessed_at"):
+            if total <= self.max_bytes:
+                break
+            stale_keys.append(key)
+            total -= size
+        self._conn.executemany("DELETE FROM entries WHERE key = ?", [(key,) for key in stale_keys])
+
+
+__all__ = [
+    "DEFAULT_CACHE_TTLS",
+    "CacheEntry",
+    "ContentCache",
+    "MemoryCache",
+    "SQLiteCache",
+    "normalize_cache_key",
+]
@@ -1,12 +1,19 @@
 from __future__ import annotations
 
 import argparse
+import json
 import logging
+import sys
 from collections.abc import Callable
+from collections.abc import Iterable
+from collections.abc import Iterator
 from collections.abc import Sequence
+from pathlib import Path
+from typing import TextIO
 from typing import cast
 
 from kabigon import loader_registry
+from kabigon.api import explain_plans
 from kabigon.api import load_url_sync
 from kabigon.core.loader import Loader
 from kabigon.load_chain import resolve_explicit_load_chain
@@ -40,6 +47,7 @@ LOADER_DEFS: list[LoaderDef] = [
     for name in CLI_VISIBLE_LOADERS
 ]
 
+PLAN_COMMAND = "plan"
 LOG_FORMAT = "%(asctime)s | %(levelname)s | %(name)s:%(lineno)d - %(message)s"
 
 
@@ -52,7 +60,10 @@ def _loader_requirements() -> dict[str, tuple[str, ...]]:
 
 
 def _build_parser() -> argparse.ArgumentParser:
-    parser = argparse.ArgumentParser(prog="kabigon")
+    parser = argparse.ArgumentParser(
+        prog="kabigon",
+        epilog=f"Run 'kabigon {PLAN_COMMAND} [FILE]' to print the plans of many URLs without loading them.",
+    )
     parser.add_argument("url", nargs="?", metavar="URL")
     parser.add_argument("--loader", help="Comma-separated loader names")
     parser.add_argument("--list", action="store_true", dest="list_", help="List supported loaders")
@@ -60,6 +71,15 @@ def _build_parser() -> argparse.ArgumentParser:
     return parser
 
 
+def _build_plan_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog=f"kabigon {PLAN_COMMAND}",
+        description="Print the Load chain plan of every URL as one JSON line, without loading anything.",
+    )
+    parser.add_argument("file", nargs="?", default="-", metavar="FILE", help="One URL per line (default: stdin)")
+    return parser
+
+
 def _parse_loader_names(raw: str, parser: argparse.ArgumentParser) -> list[str]:
     names = [name.strip() for name in raw.split(",") if name.strip()]
     if not names:
@@ -88,11 +108,49 @@ def _load_with_loader_names(url: str, loader_names: list[str]) -> str:
     return resolve_explicit_load_chain(url, loader_names, registry.__getitem__, requirements.__getitem__).load_sync()
 
 
+def _read_urls(lines: Iterable[str]) -> Iterator[str]:
+    for line in lines:
+        url = line.strip()
+        if url:
+            yield url
+
+
+def write_plans(lines: Iterable[str], out: TextIO) -> bool:
+    """Write the plan of each URL in ``lines`` to ``out`` as JSON lines; blank lines are skipped.
+
+    A URL that cannot be planned gets a ``{"url": ..., "error": ...}`` line and
+    the rest are still planned. Returns whether every URL was planned.
+    """
+    encode = json.JSONEncoder(separators=(",", ":")).encode
+    ok = True
+    for plan in explain_plans(_read_urls(lines)):
+        ok = ok and "error" not in plan
+        out.write(encode(plan) + "\n")
+    return ok
+
+
+def _plan(argv: Sequence[str]) -> None:
+    args = _build_plan_parser().parse_args(argv)
+    path = cast("str", args.file)
+    if path == "-":
+        ok = write_plans(sys.stdin, sys.stdout)
+    else:
+        with Path(path).open(encoding="utf-8") as f:
+            ok = write_plans(f, sys.stdout)
+    if not ok:
+        sys.exit(1)
+
+
 def run(url: str) -> None:
     print(load_url_sync(url))
 
 
 def main(argv: Sequence[str] | None = None) -> None:
+    argv = sys.argv[1:] if argv is None else list(argv)
+    if argv[:1] == [PLAN_COMMAND]:
+        _plan(argv[1:])
+        return
+
     parser = _build_parser()
     args = parser.parse_args(argv)
     url = cast("str | None", args.url)
@@ -100,3 +100,12 @@ class LoaderContentError(KabigonError):
         if suggestion:
             message += f"\nSuggestion: {suggestion}"
         super().__init__(message)
+
+
+class ExecutorSaturatedError(KabigonError):
+    """Raised when an executor already has its maximum number of calls waiting."""
+
+    def __init__(self, kind: str, max_queue: int) -> None:
+        self.kind = kind
+        self.max_queue = max_queue
+        super().__init__(f"{kind} executor is saturated ({max_queue} calls already waiting)")
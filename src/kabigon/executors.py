@@ -0,0 +1,211 @@
+"""Sized executors for blocking work done on behalf of loaders.
+
+CPU-bound work (Whisper, PDF parsing, large markdown conversions) and blocking
+I/O (SDK clients without async support) run in separate thread pools, so a
+burst of transcriptions cannot starve transcript API calls, and neither can
+flood the default executor. Each pool admits at most ``workers`` calls per
+event loop; further callers wait on the loop rather than in the executor
+queue, and once ``max_queue`` calls are waiting new ones fail fast with
+``ExecutorSaturatedError`` so the Load chain can fall through.
+
+The spawn-based process pool used to spread work across cores lives here too.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import functools
+import logging
+import multiprocessing
+import os
+import threading
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from enum import StrEnum
+from weakref import WeakKeyDictionary
+
+from kabigon.core.errors import ExecutorSaturatedError
+
+_INVALID_WORKERS = "executor workers must be at least 1."
+
+logger = logging.getLogger(__name__)
+
+
+class ExecutorKind(StrEnum):
+    CPU = "cpu"
+    IO = "io"
+
+
+@dataclass(frozen=True)
+class ExecutorConfig:
+    workers: int
+    # Calls allowed to wait for a worker before new ones are rejected; None waits without bound.
+    max_queue: int | None = None
+
+
+DEFAULT_EXECUTOR_CONFIGS: dict[ExecutorKind, ExecutorConfig] = {
+    ExecutorKind.CPU: ExecutorConfig(workers=min(4, os.cpu_count() or 1)),
+    ExecutorKind.IO: ExecutorConfig(workers=32),
+}
+
+
+@dataclass(frozen=True)
+class ExecutorStats:
+    kind: ExecutorKind
+    workers: int
+    running: int
+    queued: int
+    completed: int
+    rejected: int
+
+    @property
+    def saturated(self) -> bool:
+        return self.running >= self.workers
+
+
+class _Ticket:
+    def __init__(self) -> None:
+        self.started = False
+        self.abandoned = False
+
+
+class _Pool:
+    def __init__(self, kind: ExecutorKind, config: ExecutorConfig) -> None:
+        self.kind = kind
+        self.config = config
+        self.executor = ThreadPoolExecutor(max_workers=config.workers, thread_name_prefix=f"kabigon-{kind}")
+        self._lock = threading.Lock()
+        self._admission: WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore] = WeakKeyDictionary()
+        self._running = 0
+        self._queued = 0
+        self._completed = 0
+        self._rejected = 0
+
+    def stats(self) -> ExecutorStats:
+        with self._lock:
+            return ExecutorStats(
+                kind=self.kind,
+                workers=self.config.workers,
+                running=self._running,
+                queued=self._queued,
+                completed=self._completed,
+                rejected=self._rejected,
+            )
+
+    def _semaphore(self, loop: asyncio.AbstractEventLoop) -> asyncio.Semaphore:
+        # Semaphores belong to one event loop; sync wrappers run a fresh loop per call.
+        with self._lock:
+            semaphore = self._admission.get(loop)
+            if semaphore is None:
+                semaphore = self._admission[loop] = asyncio.Semaphore(self.config.workers)
+            return semaphore
+
+    def _enqueue(self) -> _Ticket:
+        with self._lock:
+            if self.config.max_queue is not None and self._queued >= self.config.max_queue:
+                self._rejected += 1
+                raise ExecutorSaturatedError(str(self.kind), self.config.max_queue)
+            self._queued += 1
+        return _Ticket()
+
+    def _abandon(self, ticket: _Ticket) -> None:
+        with self._lock:
+            if not ticket.started:
+                ticket.abandoned = True
+                self._queued -= 1
+
+    def _call[T](self, ticket: _Ticket, func: Callable[[], T]) -> T:
+        with self._lock:
+            ticket.started = True
+            if not ticket.abandoned:
+                self._queued -= 1
+            self._running += 1
+        try:
+            return func()
+        finally:
+            with self._lock:
+                self._running -= 1
+                self._completed += 1
+
+    async def run[T](self, func: Callable[[], T]) -> T:
+        loop = asyncio.get_running_loop()
+        ticket = self._enqueue()
+        try:
+            async with self._semaphore(loop):
+                # Copy the context so timing hooks and sessions follow the call into the worker.
+                call = functools.partial(contextvars.copy_context().run, func)
+                return await loop.run_in_executor(self.executor, self._call, ticket, call)
+        finally:
+            self._abandon(ticket)
+
+
+_configs = dict(DEFAULT_EXECUTOR_CONFIGS)
+_pools: dict[ExecutorKind, _Pool] = {}
+_pools_lock = threading.Lock()
+_process_pool: ProcessPoolExecutor | None = None
+
+
+def configure_executors(*, cpu: ExecutorConfig | None = None, io: ExecutorConfig | None = None) -> None:
+    """Resize the executors; calls already running finish on the old pools."""
+    with _pools_lock:
+        for kind, config in ((ExecutorKind.CPU, cpu), (ExecutorKind.IO, io)):
+            if config is None:
+                continue
+            if config.workers < 1:
+                raise ValueError(_INVALID_WORKERS)
+            _configs[kind] = config
+            pool = _pools.pop(kind, None)
+            if pool is not None:
+                pool.executor.shutdown(wait=False)
+
+
+def _pool(kind: ExecutorKind) -> _Pool:
+    with _pools_lock:
+        pool = _pools.get(kind)
+        if pool is None:
+            pool = _pools[kind] = _Pool(kind, _configs[kind])
+        return pool
+
+
+async def run_cpu[T](func: Callable[..., T], /, *args: object, **kwargs: object) -> T:
+    """Run CPU-bound ``func`` in the CPU pool without blocking the event loop."""
+    return await _pool(ExecutorKind.CPU).run(functools.partial(func, *args, **kwargs))
+
+
+async def run_io[T](func: Callable[..., T], /, *args: object, **kwargs: object) -> T:
+    """Run blocking I/O ``func`` in the I/O pool without blocking the event loop."""
+    return await _pool(ExecutorKind.IO).run(functools.partial(func, *args, **kwargs))
+
+
+def executor_stats() -> dict[ExecutorKind, ExecutorStats]:
+    """Queue depth and throughput of each executor."""
+    return {kind: _pool(kind).stats() for kind in ExecutorKind}
+
+
+def process_pool() -> ProcessPoolExecutor:
+    """Shared process pool for work that must run on several cores at once."""
+    global _process_pool
+    with _pools_lock:
+        if _process_pool is None:
+            # spawn, not fork: the parent runs an event loop and worker threads.
+            _process_pool = ProcessPoolExecutor(
+                max_workers=os.cpu_count(),
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return _process_pool
+
+
+__all__ = [
+    "DEFAULT_EXECUTOR_CONFIGS",
+    "ExecutorConfig",
+    "ExecutorKind",
+    "ExecutorStats",
+    "configure_executors",
+    "executor_stats",
+    "process_pool",
+    "run_cpu",
+    "run_io",
+]
@@ -4,21 +4,41 @@ import asyncio
 import logging
 import os
 from collections.abc import Callable
+from collections.abc import Iterable
+from collections.abc import Iterator
 from collections.abc import Sequence
 from dataclasses import dataclass
+from dataclasses import replace
 
 from kabigon import loader_registry
+from kabigon.cache import ContentCache
 from kabigon.core.errors import LoaderContentError
 from kabigon.core.errors import LoaderError
 from kabigon.core.errors import LoaderNotApplicableError
 from kabigon.core.errors import LoaderTimeoutError
 from kabigon.core.errors import MissingRequirementError
 from kabigon.core.loader import Loader
+from kabigon.executors import run_io
+from kabigon.loader_registry import get_loader_applicability
 from kabigon.loader_registry import get_loader_factory
 from kabigon.loader_registry import get_loader_requirements
+from kabigon.loader_registry import loader_applies
+from kabigon.loader_stats import LoaderStats
+from kabigon.loader_stats import default_loader_stats
+from kabigon.loaders.content_guard import ensure_usable_content
+from kabigon.loaders.session import loader_session
+from kabigon.pipelines.catalog import DEFAULT_HEDGE_DELAY
+from kabigon.pipelines.catalog import DEFAULT_RACE_WIDTH
+from kabigon.pipelines.catalog import CatalogMatch
 from kabigon.pipelines.catalog import ContentType
+from kabigon.pipelines.catalog import ExecutionMode
 from kabigon.pipelines.catalog import FallbackPolicy
-from kabigon.pipelines.catalog import match_pipeline
+from kabigon.pipelines.catalog import Matcher
+from kabigon.pipelines.catalog import Pipeline
+from kabigon.pipelines.catalog import catalog_matchers
+from kabigon.pipelines.catalog import match_catalog
+from kabigon.timing import TimingStage
+from kabigon.timing import timed
 
 LoaderFactory = Callable[[], Loader]
 _EMPTY_EXECUTION_PLAN = "Load chain execution plan cannot be empty."
@@ -55,6 +75,11 @@ class LoadChainExplanation:
     execution_plan: tuple[str, ...]
     requirements: tuple[str, ...] = ()
     missing_requirements: tuple[str, ...] = ()
+    execution_mode: ExecutionMode = ExecutionMode.SEQUENTIAL
+    hedge_delay: float = DEFAULT_HEDGE_DELAY
+    race_width: int = DEFAULT_RACE_WIDTH
+    # Fallback loaders left out because they keep failing on this host.
+    pruned_loaders: tuple[str, ...] = ()
 
     def as_dict(self) -> dict[str, object]:
         return {
@@ -66,48 +91,64 @@ class LoadChainExplanation:
             "execution_plan": list(self.execution_plan),
             "requirements": list(self.requirements),
             "missing_requirements": list(self.missing_requirements),
+            "execution_mode": self.execution_mode,
+            "hedge_delay": self.hedge_delay,
+            "race_width": self.race_width,
+            "pruned_loaders": list(self.pruned_loaders),
         }
 
 
+@dataclass(frozen=True)
+class LoadChainPlanError:
+    """A URL that could not be planned, e.g. because it is malformed."""
+
+    url: str
+    error: str
+
+    def as_dict(self) -> dict[str, object]:
+        return {"url": self.url, "error": self.error}
+
+
 @dataclass(frozen=True)
 class LoadChain:
     get_factory: Callable[[str], LoaderFactory]
     explanation: LoadChainExplanation
+    cache: ContentCache | None = None
+    stats: LoaderStats | None = None
+    # Checked before a loader is built, so inapplicable loaders never pay for construction.
+    applies: Callable[[str, str], bool] | None = None
 
     async def load(self) -> str:
+        url = self.explanation.url
+        if self.cache is not None:
+            entry = await run_io(self.cache.get, url)
+            if entry is not None:
+                logger.info("[%s] Cache hit for URL: %s", entry.loader, url)
+                return entry.text
+
+        try:
+            async with loader_session():
+                loader_name, result = await self._load_in_session()
+        finally:
+            if self.stats is not None:
+                await run_io(self.stats.flush_if_due)
+
+        if self.cache is not None:
+            await run_io(self.cache.put, url, result, loader=loader_name, content_type=self.explanation.content_type)
+        return result
+
+    async def _load_in_session(self) -> tuple[str, str]:
         errors: list[str] = []
 
-        for planned_loader_name in self.explanation.execution_plan:
-            loader_name = planned_loader_name
-            try:
-                loader = self.get_factory(planned_loader_name)()
-                loader_name = loader.__class__.__name__
-                logger.debug("[%s] Attempting to load URL: %s", loader_name, self.explanation.url)
-                result = await loader.load(self.explanation.url)
-            except LoaderNotApplicableError as e:
-                logger.debug("[%s] Not applicable: %s", loader_name, e.reason)
-                errors.append(f"{loader_name}: Not applicable ({e.reason})")
-                continue
-            except LoaderTimeoutError as e:
-                logger.warning("[%s] Timeout after %ss: %s", loader_name, e.timeout, e.url)
-                errors.append(f"{loader_name}: Timeout after {e.timeout}s")
-                continue
-            except LoaderContentError as e:
-                logger.warning("[%s] Content extraction failed: %s", loader_name, e.reason)
-                errors.append(f"{loader_name}: Content extraction failed - {e.reason}")
-                continue
-            except Exception as e:  # noqa: BLE001
-                logger.info("[%s] Failed with error: %s: %s", loader_name, type(e).__name__, e)
-                errors.append(f"{loader_name}: {type(e).__name__}: {e!s}")
-                continue
-
-            if not result:
-                logger.info("[%s] Got empty result", loader_name)
-                errors.append(f"{loader_name}: Empty result")
-                continue
-
-            logger.info("[%s] Successfully loaded URL: %s", loader_name, self.explanation.url)
-            return result
+        if self.explanation.execution_mode == ExecutionMode.SEQUENTIAL:
+            for planned_loader_name in self.explanation.execution_plan:
+                result = await self._attempt(planned_loader_name, errors)
+                if result is not None:
+                    return planned_loader_name, result
+        else:
+            loaded = await self._load_concurrently(errors)
+            if loaded is not None:
+                return loaded
 
         if errors:
             error_details = "\n  - ".join(errors)
@@ -117,6 +158,102 @@ class LoadChain:
 
         raise LoaderError(self.explanation.url, details=errors)
 
+    async def _attempt(self, planned_loader_name: str, errors: list[str], *, validate: bool = False) -> str | None:
+        result = await self._try_loader(planned_loader_name, errors, validate=validate)
+        if self.stats is not None:
+            self.stats.record(self.explanation.url, planned_loader_name, success=result is not None)
+        return result
+
+    async def _try_loader(self, planned_loader_name: str, errors: list[str], *, validate: bool) -> str | None:
+        if self.applies is not None and not self.applies(planned_loader_name, self.explanation.url):
+            logger.debug("[%s] Not applicable to URL: %s", planned_loader_name, self.explanation.url)
+            errors.append(f"{planned_loader_name}: Not applicable (URL is outside the loader's source)")
+            return None
+
+        loader_name = planned_loader_name
+        try:
+            with timed(TimingStage.ATTEMPT, url=self.explanation.url, loader=planned_loader_name) as span:
+                loader = self.get_factory(planned_loader_name)()
+                loader_name = loader.__class__.__name__
+                logger.debug("[%s] Attempting to load URL: %s", loader_name, self.explanation.url)
+                result = await loader.load(self.explanation.url)
+                span.record(bytes_out=result)
+                if validate and result:
+                    # Only block/challenge markers: targeted loaders legitimately return short posts.
+                    ensure_usable_content(result, loader_name=loader_name, url=self.explanation.url, min_length=0)
+        except LoaderNotApplicableError as e:
+            logger.debug("[%s] Not applicable: %s", loader_name, e.reason)
+            errors.append(f"{loader_name}: Not applicable ({e.reason})")
+            return None
+        except LoaderTimeoutError as e:
+            logger.warning("[%s] Timeout after %ss: %s", loader_name, e.timeout, e.url)
+            errors.append(f"{loader_name}: Timeout after {e.timeout}s")
+            return None
+        except LoaderContentError as e:
+            logger.warning("[%s] Content extraction failed: %s", loader_name, e.reason)
+            errors.append(f"{loader_name}: Content extraction failed - {e.reason}")
+            return None
+        except Exception as e:  # noqa: BLE001
+            logger.info("[%s] Failed with error: %s: %s", loader_name, type(e).__name__, e)
+            errors.append(f"{loader_name}: {type(e).__name__}: {e!s}")
+            return None
+
+        if not result:
+            logger.info("[%s] Got empty result", loader_name)
+            errors.append(f"{loader_name}: Empty result")
+            return None
+
+        logger.info("[%s] Successfully loaded URL: %s", loader_name, self.explanation.url)
+        return result
+
+    async def _load_concurrently(self, errors: list[str]) -> tuple[str, str] | None:
+        """Run the plan with overlapping attempts; the first usable result wins.
+
+        ``RACE`` starts the first ``race_width`` loaders together and replaces
+        each failure with the next planned loader. ``HEDGED`` starts one loader
+        and adds the next whenever ``hedge_delay`` passes without a result, or
+        as soon as every running attempt has failed.
+        """
+        plan = self.explanation.execution_plan
+        racing = self.explanation.execution_mode == ExecutionMode.RACE
+        width = max(self.explanation.race_width, 1) if racing else 1
+        hedge_delay = None if racing else self.explanation.hedge_delay
+        running: dict[asyncio.Task[str | None], int] = {}
+        next_index = 0
+
+        def start_next() -> None:
+            nonlocal next_index
+            loader_name = plan[next_index]
+            logger.debug("[%s] Starting concurrent attempt %s/%s", loader_name, next_index + 1, len(plan))
+            running[asyncio.create_task(self._attempt(loader_name, errors, validate=True))] = next_index
+            next_index += 1
+
+        try:
+            while next_index < len(plan) and len(running) < width:
+                start_next()
+
+            while running:
+                timeout = hedge_delay if next_index < len(plan) else None
+                done, _pending = await asyncio.wait(running, timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+                if not done:
+                    start_next()
+                    continue
+
+                for task in sorted(done, key=running.__getitem__):
+                    index = running.pop(task)
+                    result = task.result()
+                    if result is not None:
+                        return plan[index], result
+
+                while next_index < len(plan) and len(running) < width:
+                    start_next()
+        finally:
+            for task in running:
+                task.cancel()
+            await asyncio.gather(*running, return_exceptions=True)
+
+        return None
+
     def load_sync(self) -> str:
         return asyncio.run(self.load())
 
@@ -162,17 +299,36 @@ def _missing_requirements(requirements: tuple[str, ...]) -> tuple[str, ...]:
     return tuple(name for name in requirements if not os.getenv(name))
 
 
+type _ResolvedRequirements = tuple[tuple[str, ...], tuple[str, ...]]
+
+
+def _resolve_requirements(
+    loader_names: tuple[str, ...],
+    get_requirements: Callable[[str], tuple[str, ...]] = get_loader_requirements,
+) -> _ResolvedRequirements:
+    requirements = _requirements_for_loaders(loader_names, get_requirements)
+    return requirements, _missing_requirements(requirements)
+
+
 def _fallback_loaders_for(
+    match: CatalogMatch,
     targeted_loaders: tuple[str, ...],
     fallback_policy: FallbackPolicy,
 ) -> tuple[str, ...]:
     fallback_candidates: tuple[str, ...] = ()
     if fallback_policy == FallbackPolicy.REMAINING_DEFAULT:
-        fallback_candidates = DEFAULT_FALLBACK_LOADERS
+        # Source-specific loaders would only reject URLs outside their source.
+        fallback_candidates = tuple(name for name in DEFAULT_FALLBACK_LOADERS if _applies(name, match))
 
     return _remaining_unique_loaders(targeted_loaders, fallback_candidates)
 
 
+def _applies(loader_name: str, match: CatalogMatch) -> bool:
+    # Source checks are catalog matchers, so the catalog match already has their verdict.
+    applies_to = get_loader_applicability(loader_name)
+    return applies_to is None or match.accepts(applies_to)
+
+
 def _build_explanation(
     url: str,
     *,
@@ -184,7 +340,7 @@ def _build_explanation(
     get_requirements: Callable[[str], tuple[str, ...]] = get_loader_requirements,
 ) -> LoadChainExplanation:
     loaders = (*targeted_loaders, *fallback_loaders) if execution_plan is None else execution_plan
-    requirements = _requirements_for_loaders(loaders, get_requirements)
+    requirements, missing_requirements = _resolve_requirements(loaders, get_requirements)
     return LoadChainExplanation(
         url=url,
         pipeline=pipeline_name,
@@ -193,7 +349,7 @@ def _build_explanation(
         fallback_loaders=fallback_loaders,
         execution_plan=loaders,
         requirements=requirements,
-        missing_requirements=_missing_requirements(requirements),
+        missing_requirements=missing_requirements,
     )
 
 
@@ -204,36 +360,129 @@ def _ensure_requirements(explanation: LoadChainExplanation) -> None:
     raise MissingRequirementError(explanation.missing_requirements)
 
 
-def explain_load_chain(url: str) -> LoadChainExplanation:
-    pipeline = match_pipeline(url)
-
-    pipeline_name: str | None = None
-    content_type = ContentType.GENERIC_WEB
-    targeted_loaders: tuple[str, ...] = ()
-    fallback_policy = FallbackPolicy.REMAINING_DEFAULT
-
-    if pipeline is not None:
-        pipeline_name = pipeline.name
-        content_type = pipeline.content_type
-        targeted_loaders = pipeline.targeted_loaders
-        fallback_policy = pipeline.fallback_policy
-
-    fallback_loaders = _fallback_loaders_for(targeted_loaders, fallback_policy)
-    return _build_explanation(
-        url=url,
-        pipeline_name=pipeline_name,
-        content_type=content_type,
-        targeted_loaders=targeted_loaders,
-        fallback_loaders=fallback_loaders,
+class LoadChainPlanner:
+    """Plans Load chains for many URLs, sharing work between them.
+
+    Each URL is parsed once for both its Pipeline and the applicability of
+    source loaders. Fallback loaders are worked out once per combination of
+    matching sources, and requirements are resolved, and checked against the
+    environment, once per distinct execution plan. A planner therefore does
+    not see environment changes made after it first planned a chain.
+    """
+
+    def __init__(self, *, stats: LoaderStats | None = None) -> None:
+        self.stats = stats or default_loader_stats()
+        self._fallbacks: dict[tuple[Pipeline | None, frozenset[Matcher]], tuple[str, ...]] = {}
+        self._requirements: dict[tuple[str, ...], _ResolvedRequirements] = {}
+        # The cached fallbacks are only exact if every source check has a catalog verdict.
+        self._cache_fallbacks = all(
+            applies_to is None or applies_to in catalog_matchers()
+            for applies_to in map(get_loader_applicability, DEFAULT_FALLBACK_LOADERS)
+        )
+
+    def explain(self, url: str) -> LoadChainExplanation:
+        match = match_catalog(url)
+        pipeline = match.pipeline
+        fallback_loaders = self._fallback_loaders(match)
+        pruned_loaders: tuple[str, ...] = ()
+        if self.stats is not None and fallback_loaders:
+            adaptive = self.stats.plan(url, fallback_loaders)
+            fallback_loaders, pruned_loaders = adaptive.loaders, adaptive.pruned
+
+        targeted_loaders = pipeline.targeted_loaders if pipeline is not None else ()
+        execution_plan = (*targeted_loaders, *fallback_loaders)
+        requirements, missing_requirements = self._resolve_requirements(execution_plan)
+        if pipeline is None:
+            return LoadChainExplanation(
+                url=url,
+                pipeline=None,
+                content_type=ContentType.GENERIC_WEB,
+                targeted_loaders=(),
+                fallback_loaders=fallback_loaders,
+                execution_plan=execution_plan,
+                requirements=requirements,
+                missing_requirements=missing_requirements,
+                pruned_loaders=pruned_loaders,
+            )
+
+        return LoadChainExplanation(
+            url=url,
+            pipeline=pipeline.name,
+            content_type=pipeline.content_type,
+            targeted_loaders=targeted_loaders,
+            fallback_loaders=fallback_loaders,
+            execution_plan=execution_plan,
+            requirements=requirements,
+            missing_requirements=missing_requirements,
+            execution_mode=pipeline.execution_mode,
+            hedge_delay=pipeline.hedge_delay,
+            race_width=pipeline.race_width,
+            pruned_loaders=pruned_loaders,
+        )
+
+    def explain_all(self, urls: Iterable[str]) -> Iterator[LoadChainExplanation | LoadChainPlanError]:
+        """Plan each URL; a URL that cannot be planned yields an error instead of ending the iteration."""
+        for url in urls:
+            try:
+                yield self.explain(url)
+            except ValueError as e:
+                yield LoadChainPlanError(url, str(e))
+
+    def _fallback_loaders(self, match: CatalogMatch) -> tuple[str, ...]:
+        pipeline = match.pipeline
+        key = (pipeline, match.accepted)
+        fallback_loaders = self._fallbacks.get(key)
+        if fallback_loaders is None:
+            if pipeline is None:
+                fallback_loaders = _fallback_loaders_for(match, (), FallbackPolicy.REMAINING_DEFAULT)
+            else:
+                fallback_loaders = _fallback_loaders_for(match, pipeline.targeted_loaders, pipeline.fallback_policy)
+            if self._cache_fallbacks:
+                self._fallbacks[key] = fallback_loaders
+        return fallback_loaders
+
+    def _resolve_requirements(self, loader_names: tuple[str, ...]) -> _ResolvedRequirements:
+        resolved = self._requirements.get(loader_names)
+        if resolved is None:
+            resolved = self._requirements[loader_names] = _resolve_requirements(loader_names)
+        return resolved
+
+
+def explain_load_chain(url: str, *, stats: LoaderStats | None = None) -> LoadChainExplanation:
+    """Plan the Load chain for ``url``.
+
+    Fallback loaders are reordered and pruned by ``stats``, or by the
+    configured loader statistics when none are given.
+    """
+    return LoadChainPlanner(stats=stats).explain(url)
+
+
+def resolve_load_chain(
+    url: str,
+    *,
+    cache: ContentCache | None = None,
+    execution_mode: ExecutionMode | None = None,
+) -> LoadChain:
+    """Resolve the Load chain for ``url``.
+
+    ``execution_mode`` overrides the Pipeline's configured mode, e.g. to hedge
+    generic URLs that have no Pipeline of their own.
+    """
+    stats = default_loader_stats()
+    with timed(TimingStage.PLAN, url=url):
+        explanation = explain_load_chain(url, stats=stats)
+        _ensure_requirements(explanation)
+    if execution_mode is not None:
+        explanation = replace(explanation, execution_mode=execution_mode)
+    return LoadChain(
+        get_factory=get_loader_factory,
+        explanation=explanation,
+        cache=cache,
+        stats=stats,
+        applies=loader_applies,
     )
 
 
-def resolve_load_chain(url: str) -> LoadChain:
-    explanation = explain_load_chain(url)
-    _ensure_requirements(explanation)
-    return LoadChain(get_factory=get_loader_factory, explanation=explanation)
-
-
 def resolve_explicit_load_chain(
     url: str,
     loader_names: Sequence[str],
@@ -256,13 +505,16 @@ def resolve_explicit_load_chain(
     if not execution_plan:
         raise ValueError(_EMPTY_EXECUTION_PLAN)
     _ensure_requirements(explanation)
-    return LoadChain(get_factory=get_factory, explanation=explanation)
+    applies = loader_applies if get_factory is get_loader_factory else None
+    return LoadChain(get_factory=get_factory, explanation=explanation, applies=applies)
 
 
 __all__ = [
     "DEFAULT_FALLBACK_LOADERS",
     "LoadChain",
     "LoadChainExplanation",
+    "LoadChainPlanError",
+    "LoadChainPlanner",
     "explain_load_chain",
     "resolve_explicit_load_chain",
     "resolve_load_chain",
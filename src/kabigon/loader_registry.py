@@ -5,8 +5,20 @@ from dataclasses import dataclass
 
 import kabigon.loaders as loaders
 from kabigon.core.loader import Loader
+from kabigon.sources.applicability import is_bbc_url
+from kabigon.sources.applicability import is_cnn_url
+from kabigon.sources.applicability import is_github_url
+from kabigon.sources.applicability import is_ltn_url
+from kabigon.sources.applicability import is_pdf_target
+from kabigon.sources.applicability import is_ptt_url
+from kabigon.sources.applicability import is_reddit_url
+from kabigon.sources.applicability import is_reel_url
+from kabigon.sources.applicability import is_truthsocial_url
+from kabigon.sources.applicability import is_twitter_url
+from kabigon.sources.applicability import is_youtube_video_url
 
 LoaderFactory = Callable[[], Loader]
+Applicability = Callable[[str], bool]
 
 
 @dataclass(frozen=True)
@@ -15,6 +27,8 @@ class LoaderDef:
     description: str
     factory: LoaderFactory
     requirements: tuple[str, ...] = ()
+    # Plan-time mirror of the loader's own source check; None means any URL.
+    applies_to: Applicability | None = None
 
 
 PTT = "ptt"
@@ -38,22 +52,78 @@ FIRECRAWL = "firecrawl"
 YTDLP = "ytdlp"
 
 LOADER_DEFS: tuple[LoaderDef, ...] = (
-    LoaderDef(PTT, "Taiwan PTT forum posts", lambda: loaders.PttLoader()),
-    LoaderDef(TWITTER, "Extracts Twitter/X post content", lambda: loaders.TwitterLoader()),
-    LoaderDef(TRUTHSOCIAL, "Extracts Truth Social posts", lambda: loaders.TruthSocialLoader()),
-    LoaderDef(REDDIT, "Extracts Reddit posts and comments", lambda: loaders.RedditLoader()),
-    LoaderDef(YOUTUBE, "Extracts YouTube video transcripts", lambda: loaders.YoutubeLoader()),
-    LoaderDef(REEL, "Instagram Reels audio transcription + metadata", lambda: loaders.ReelLoader()),
+    LoaderDef(
+        PTT,
+        "Taiwan PTT forum posts",
+        lambda: loaders.PttLoader(),
+        applies_to=is_ptt_url,
+    ),
+    LoaderDef(
+        TWITTER,
+        "Extracts Twitter/X post content",
+        lambda: loaders.TwitterLoader(),
+        applies_to=is_twitter_url,
+    ),
+    LoaderDef(
+        TRUTHSOCIAL,
+        "Extracts Truth Social posts",
+        lambda: loaders.TruthSocialLoader(),
+        applies_to=is_truthsocial_url,
+    ),
+    LoaderDef(
+        REDDIT,
+        "Extracts Reddit posts and comments",
+        lambda: loaders.RedditLoader(),
+        applies_to=is_reddit_url,
+    ),
+    LoaderDef(
+        YOUTUBE,
+        "Extracts YouTube video transcripts",
+        lambda: loaders.YoutubeLoader(),
+        applies_to=is_youtube_video_url,
+    ),
+    LoaderDef(
+        REEL,
+        "Instagram Reels audio transcription + metadata",
+        lambda: loaders.ReelLoader(),
+        applies_to=is_reel_url,
+    ),
     LoaderDef(
         YOUTUBE_YTDLP,
         "YouTube audio transcription via yt-dlp + Whisper",
         lambda: loaders.YoutubeYtdlpLoader(),
+        applies_to=is_youtube_video_url,
+    ),
+    LoaderDef(
+        PDF,
+        "Extracts text from PDF files",
+        lambda: loaders.PDFLoader(),
+        applies_to=is_pdf_target,
+    ),
+    LoaderDef(
+        GITHUB,
+        "Fetches GitHub pages and file content",
+        lambda: loaders.GitHubLoader(),
+        applies_to=is_github_url,
+    ),
+    LoaderDef(
+        BBC,
+        "BBC article extraction with article-aware parsing",
+        lambda: loaders.BBCLoader(),
+        applies_to=is_bbc_url,
+    ),
+    LoaderDef(
+        CNN,
+        "CNN article extraction with article-aware parsing",
+        lambda: loaders.CNNLoader(),
+        applies_to=is_cnn_url,
+    ),
+    LoaderDef(
+        LTN,
+        "Liberty Times Net article extraction",
+        lambda: loaders.LTNLoader(),
+        applies_to=is_ltn_url,
     ),
-    LoaderDef(PDF, "Extracts text from PDF files", lambda: loaders.PDFLoader()),
-    LoaderDef(GITHUB, "Fetches GitHub pages and file content", lambda: loaders.GitHubLoader()),
-    LoaderDef(BBC, "BBC article extraction with article-aware parsing", lambda: loaders.BBCLoader()),
-    LoaderDef(CNN, "CNN article extraction with article-aware parsing", lambda: loaders.CNNLoader()),
-    LoaderDef(LTN, "Liberty Times Net article extraction", lambda: loaders.LTNLoader()),
     LoaderDef(
         PLAYWRIGHT_NETWORKIDLE,
         "Browser-based scraping with networkidle wait",
@@ -95,6 +165,18 @@ def get_loader_requirements(name: str) -> tuple[str, ...]:
     return _LOADER_DEF_BY_NAME[name].requirements
 
 
+def get_loader_applicability(name: str) -> Applicability | None:
+    """The URL check of loader ``name``; ``None`` if it takes any URL or is unregistered."""
+    loader_def = _LOADER_DEF_BY_NAME.get(name)
+    return None if loader_def is None else loader_def.applies_to
+
+
+def loader_applies(name: str, url: str) -> bool:
+    """Whether loader ``name`` can handle ``url``; unregistered names are assumed to."""
+    loader_def = _LOADER_DEF_BY_NAME.get(name)
+    return loader_def is None or loader_def.applies_to is None or loader_def.applies_to(url)
+
+
 def list_loader_names() -> list[str]:
     return [loader_def.name for loader_def in LOADER_DEFS]
 
@@ -120,10 +202,13 @@ __all__ = [
     "YOUTUBE",
     "YOUTUBE_YTDLP",
     "YTDLP",
+    "Applicability",
     "LoaderDef",
     "LoaderFactory",
+    "get_loader_applicability",
     "get_loader_description",
     "get_loader_factory",
     "get_loader_requirements",
     "list_loader_names",
+    "loader_applies",
 ]
@@ -0,0 +1,268 @@
+"""Per-host loader statistics that adapt the fallback order of Load chains.
+
+Every attempt a Load chain makes records a success or failure for its loader
+on the URL's host. Counts decay exponentially with ``half_life``, so a site
+that changes its bot protection is re-learned instead of remembered forever.
+When a chain is planned, fallback loaders with a good record on the host move
+to the front, and loaders that keep failing there are pruned. Pruned loaders
+come back once their failures have decayed. Targeted loaders keep their
+Pipeline order.
+
+Statistics are off unless ``configure_loader_stats`` sets them or
+``KABIGON_LOADER_STATS`` names a JSON file to persist them in. The file is
+rewritten at most every ``flush_interval`` seconds while Load chains run, at
+the end of each batch, and when the process exits; a failed write is logged
+and retried later, never raised into a load.
+"""
+
+from __future__ import annotations
+
+import atexit
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from collections.abc import Callable
+from collections.abc import Mapping
+from dataclasses import dataclass
+from pathlib import Path
+from urllib.parse import urlparse
+
+LOADER_STATS_ENV = "KABIGON_LOADER_STATS"
+
+DAY = 24 * 60 * 60.0
+DEFAULT_HALF_LIFE = 7 * DAY
+DEFAULT_FLUSH_INTERVAL = 30.0
+# A loader is pruned for a host only after about three recent failures (counts decay continuously) ...
+PRUNE_MIN_FAILURES = 2.5
+# ... while succeeding less often than this.
+PRUNE_MAX_SUCCESS_RATE = 0.1
+# A loader moves ahead of the static order once it succeeds at least this often.
+PROMOTE_MIN_SUCCESS_RATE = 0.5
+# Records that have decayed below this weight are dropped on flush.
+_MIN_WEIGHT = 0.01
+_FORMAT_VERSION = 1
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class LoaderRecord:
+    successes: float = 0.0
+    failures: float = 0.0
+    updated_at: float = 0.0
+
+    @property
+    def attempts(self) -> float:
+        return self.successes + self.failures
+
+    @property
+    def success_rate(self) -> float:
+        return self.successes / self.attempts if self.attempts else 0.0
+
+    def decayed(self, now: float, half_life: float) -> LoaderRecord:
+        elapsed = max(now - self.updated_at, 0.0)
+        factor = 0.5 ** (elapsed / half_life)
+        return LoaderRecord(self.successes * factor, self.failures * factor, now)
+
+
+@dataclass(frozen=True)
+class AdaptivePlan:
+    loaders: tuple[str, ...]
+    pruned: tuple[str, ...] = ()
+
+
+def stats_host(url: str) -> str:
+    """Host key for ``url``; ``www.`` is ignored so both spellings share a record."""
+    host = (urlparse(url).hostname or "").lower()
+    return host.removeprefix("www.")
+
+
+class LoaderStats:
+    """Decaying success and failure counts per host and loader."""
+
+    def __init__(
+        self,
+        path: str | Path | None = None,
+        *,
+        half_life: float = DEFAULT_HALF_LIFE,
+        flush_interval: float = DEFAULT_FLUSH_INTERVAL,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.path = Path(path).expanduser() if path is not None else None
+        self.half_life = half_life
+        self.flush_interval = flush_interval
+        self.clock = clock
+        self._records: dict[str, dict[str, LoaderRecord]] = {}
+        self._lock = threading.Lock()
+        # Serializes writers so an older snapshot never replaces a newer one.
+        self._flush_lock = threading.Lock()
+        self._dirty = False
+        self._flushed_at: float | None = None
+        if self.path is not None:
+            self._load()
+
+    def record(self, url: str, loader: str, *, success: bool) -> None:
+        host = stats_host(url)
+        if not host:
+            return
+        now = self.clock()
+        with self._lock:
+            loaders = self._records.setdefault(host, {})
+            current = loaders.get(loader, LoaderRecord(updated_at=now)).decayed(now, self.half_life)
+            loaders[loader] = LoaderRecord(
+                successes=current.successes + (1 if success else 0),
+                failures=current.failures + (0 if success else 1),
+                updated_at=now,
+            )
+            self._dirty = True
+
+    def get(self, url: str, loader: str) -> LoaderRecord | None:
+        with self._lock:
+            record = self._records.get(stats_host(url), {}).get(loader)
+        return record.decayed(self.clock(), self.half_life) if record is not None else None
+
+    def plan(self, url: str, loaders: tuple[str, ...]) -> AdaptivePlan:
+        """Reorder and prune ``loaders`` for the host of ``url``."""
+        records = {loader: self.get(url, loader) for loader in loaders}
+        pruned = tuple(loader for loader in loaders if _should_prune(records[loader]))
+        if len(pruned) == len(loaders):
+            # Something has to run; with no usable record the static order is the best guess.
+            return AdaptivePlan(loaders)
+
+        def rank(loader: str) -> tuple[int, float]:
+            record = records[loader]
+            if record is not None and record.successes and record.success_rate >= PROMOTE_MIN_SUCCESS_RATE:
+                return 0, -record.success_rate
+            return 1, 0.0
+
+        kept = [loader for loader in loaders if loader not in pruned]
+        return AdaptivePlan(tuple(sorted(kept, key=rank)), pruned)
+
+    def flush(self) -> None:
+        """Drop decayed records and write the rest to ``path`` if anything changed since the last flush.
+
+        A failed write is logged and leaves the statistics dirty for the next flush.
+        """
+        if not self._dirty:
+            return
+        with self._flush_lock:
+            if not self._dirty:
+                return
+            now = self.clock()
+            with self._lock:
+                self._dirty = False
+                self._records = self._decayed_records(now)
+                hosts = {
+                    host: {
+                        loader: {"successes": record.successes, "failures": record.failures, "updated_at": now}
+                        for loader, record in loaders.items()
+                    }
+                    for host, loaders in self._records.items()
+                }
+            self._flushed_at = now
+            if self.path is None:
+                return
+            try:
+                self._write(self.path, {"version": _FORMAT_VERSION, "hosts": hosts})
+            except OSError as e:
+                logger.warning("[LoaderStats] Could not write loader statistics to %s: %s", self.path, e)
+                self._dirty = True
+
+    def _decayed_records(self, now: float) -> dict[str, dict[str, LoaderRecord]]:
+        """Records decayed to ``now``, without those too light to matter and hosts left empty."""
+        records: dict[str, dict[str, LoaderRecord]] = {}
+        for host, loaders in self._records.items():
+            kept = {
+                loader: decayed
+                for loader, record in loaders.items()
+                if (decayed := record.decayed(now, self.half_life)).attempts >= _MIN_WEIGHT
+            }
+            if kept:
+                records[host] = kept
+        return records
+
+    def flush_if_due(self) -> None:
+        """Flush unless the last write was less than ``flush_interval`` seconds ago."""
+        if self._flushed_at is not None and self.clock() - self._flushed_at < self.flush_interval:
+            return
+        self.flush()
+
+    @staticmethod
+    def _write(path: Path, payload: Mapping[str, object]) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with tempfile.NamedTemporaryFile(
+            "w", encoding="utf-8", dir=path.parent, prefix=".tmp-", suffix=".json", delete=False
+        ) as f:
+            json.dump(payload, f)
+        try:
+            Path(f.name).replace(path)
+        except OSError:
+            Path(f.name).unlink(missing_ok=True)
+            raise
+
+    def _load(self) -> None:
+        if self.path is None:
+            return
+        try:
+            payload = json.loads(self.path.read_text(encoding="utf-8"))
+            hosts = payload["hosts"] if payload.get("version") == _FORMAT_VERSION else {}
+            self._records = {
+                host: {
+                    loader: LoaderRecord(float(r["successes"]), float(r["failures"]), float(r["updated_at"]))
+                    for loader, r in loaders.items()
+                }
+                for host, loaders in hosts.items()
+            }
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError, TypeError, KeyError, AttributeError) as e:
+            logger.warning("Ignoring unreadable loader statistics at %s: %s", self.path, e)
+
+
+def _should_prune(record: LoaderRecord | None) -> bool:
+    return record is not None and record.failures >= PRUNE_MIN_FAILURES and record.success_rate < PRUNE_MAX_SUCCESS_RATE
+
+
+_default_stats: LoaderStats | None = None
+_env_stats: LoaderStats | None = None
+
+
+def configure_loader_stats(stats: LoaderStats | str | Path | None) -> None:
+    """Set the statistics used by Load chains; ``None`` unsets them."""
+    global _default_stats
+    _default_stats = stats if stats is None or isinstance(stats, LoaderStats) else LoaderStats(stats)
+
+
+def default_loader_stats() -> LoaderStats | None:
+    global _env_stats
+    if _default_stats is not None:
+        return _default_stats
+    path = os.getenv(LOADER_STATS_ENV)
+    if not path:
+        return None
+    if _env_stats is None or _env_stats.path != Path(path).expanduser():
+        _env_stats = LoaderStats(path)
+    return _env_stats
+
+
+@atexit.register
+def _flush_configured_stats() -> None:
+    for stats in (_default_stats, _env_stats):
+        if stats is not None:
+            stats.flush()
+
+
+__all__ = [
+    "DEFAULT_FLUSH_INTERVAL",
+    "DEFAULT_HALF_LIFE",
+    "LOADER_STATS_ENV",
+    "AdaptivePlan",
+    "LoaderRecord",
+    "LoaderStats",
+    "configure_loader_stats",
+    "default_loader_stats",
+    "stats_host",
+]
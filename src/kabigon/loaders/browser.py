@@ -1,17 +1,28 @@
 from __future__ import annotations
 
+import asyncio
+import contextlib
 import logging
+from collections.abc import AsyncGenerator
 from collections.abc import Awaitable
 from collections.abc import Callable
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
 from typing import Literal
 
+from playwright.async_api import Browser
+from playwright.async_api import BrowserContext
 from playwright.async_api import Page
+from playwright.async_api import Playwright
 from playwright.async_api import Request
 from playwright.async_api import Route
 from playwright.async_api import TimeoutError
 from playwright.async_api import async_playwright
 
 from kabigon.core.errors import LoaderTimeoutError
+from kabigon.timing import TimingStage
+from kabigon.timing import timed
 
 BrowserPageHook = Callable[[Page], Awaitable[None]]
 BrowserContentExtractor = Callable[[Page], Awaitable[str]]
@@ -25,6 +36,222 @@ DEFAULT_BLOCKED_RESOURCE_TYPES = frozenset({"font", "image", "media"})
 logger = logging.getLogger(__name__)
 
 
+@dataclass(frozen=True)
+class BrowserPoolConfig:
+    max_browsers: int = 1
+    contexts_per_browser: int = 4
+    max_pages_per_context: int = 20
+    headless: bool = True
+
+
+_default_pool_config = BrowserPoolConfig()
+
+
+def configure_browser_pool(config: BrowserPoolConfig) -> None:
+    """Set the configuration used for browser pools created from now on."""
+    global _default_pool_config
+    _default_pool_config = config
+
+
+class _PooledContext:
+    def __init__(self, context: BrowserContext, user_agent: str | None) -> None:
+        self.context = context
+        self.user_agent = user_agent
+        self.pages_served = 0
+
+
+class _BrowserSlot:
+    def __init__(self, browser: Browser) -> None:
+        self.browser = browser
+        self.active = 0
+        self.idle_contexts: list[_PooledContext] = []
+
+
+class BrowserPool:
+    """Long-lived Chromium browsers that hand out pages from recycled contexts.
+
+    Contexts are reused for up to ``max_pages_per_context`` pages with the same
+    user agent and then closed. A browser that disconnects (for example after a
+    crash) is dropped and a fresh one is launched on the next borrow.
+    """
+
+    def __init__(self, config: BrowserPoolConfig | None = None) -> None:
+        self.config = config or _default_pool_config
+        self._playwright: Playwright | None = None
+        self._slots: list[_BrowserSlot] = []
+        self._lock = asyncio.Lock()
+        self._capacity = asyncio.Semaphore(self.config.max_browsers * self.config.contexts_per_browser)
+
+    @asynccontextmanager
+    async def page(self, *, user_agent: str | None = None) -> AsyncGenerator[Page]:
+        async with self._capacity:
+            slot, pooled = await self._checkout(user_agent)
+            page: Page | None = None
+            try:
+                page = await pooled.context.new_page()
+                yield page
+            finally:
+                await self._checkin(slot, pooled, page)
+
+    async def close(self) -> None:
+        async with self._lock:
+            slots, self._slots = self._slots, []
+            for slot in slots:
+                await self._close_browser(slot)
+            if self._playwright is not None:
+                logger.debug("[BrowserPool] Stopping Playwright")
+                await self._playwright.stop()
+                self._playwright = None
+
+    async def _checkout(self, user_agent: str | None) -> tuple[_BrowserSlot, _PooledContext]:
+        async with self._lock:
+            self._drop_disconnected()
+            slot = self._pick_slot()
+            if slot is None:
+                slot = _BrowserSlot(await self._launch())
+                self._slots.append(slot)
+            slot.active += 1
+            pooled = next((ctx for ctx in slot.idle_contexts if ctx.user_agent == user_agent), None)
+            if pooled is not None:
+                slot.idle_contexts.remove(pooled)
+                return slot, pooled
+
+        try:
+            logger.debug("[BrowserPool] Creating browser context (custom user agent=%s)", user_agent is not None)
+            if user_agent is None:
+                context = await slot.browser.new_context()
+            else:
+                context = await slot.browser.new_context(user_agent=user_agent)
+        except BaseException:
+            slot.active -= 1
+            raise
+        return slot, _PooledContext(context, user_agent)
+
+    async def _checkin(self, slot: _BrowserSlot, pooled: _PooledContext, page: Page | None) -> None:
+        slot.active -= 1
+        pooled.pages_served += 1
+        reusable = slot in self._slots and slot.browser.is_connected()
+        if page is not None:
+            try:
+                await page.close()
+            except Exception:  # noqa: BLE001
+                reusable = False
+
+        if (
+            reusable
+            and pooled.pages_served < self.config.max_pages_per_context
+            and len(slot.idle_contexts) < self.config.contexts_per_browser
+        ):
+            slot.idle_contexts.append(pooled)
+            return
+
+        logger.debug("[BrowserPool] Recycling browser context after %s pages", pooled.pages_served)
+        with contextlib.suppress(Exception):
+            await pooled.context.close()
+
+    def _drop_disconnected(self) -> None:
+        connected = [slot for slot in self._slots if slot.browser.is_connected()]
+        if len(connected) != len(self._slots):
+            logger.warning("[BrowserPool] Dropping %s disconnected browser(s)", len(self._slots) - len(connected))
+        self._slots = connected
+
+    def _pick_slot(self) -> _BrowserSlot | None:
+        available = [slot for slot in self._slots if slot.active < self.config.contexts_per_browser]
+        if available:
+            return min(available, key=lambda slot: slot.active)
+        return None
+
+    async def _launch(self) -> Browser:
+        if self._playwright is None:
+            logger.debug("[BrowserPool] Starting Playwright")
+            self._playwright = await async_playwright().start()
+        logger.debug("[BrowserPool] Launching Chromium browser (headless=%s)", self.config.headless)
+        return await self._playwright.chromium.launch(headless=self.config.headless)
+
+    async def _close_browser(self, slot: _BrowserSlot) -> None:
+        for pooled in slot.idle_contexts:
+            with contextlib.suppress(Exception):
+                await pooled.context.close()
+        slot.idle_contexts.clear()
+        logger.debug("[BrowserPool] Closing Chromium browser")
+        with contextlib.suppress(Exception):
+            await slot.browser.close()
+
+
+_session_pool: ContextVar[BrowserPool | None] = ContextVar("kabigon_browser_pool", default=None)
+
+
+@asynccontextmanager
+async def browser_pool_session(config: BrowserPoolConfig | None = None) -> AsyncGenerator[BrowserPool]:
+    """Let ``fetch_browser_html`` borrow pages from one pool inside the block.
+
+    Browsers are launched lazily on the first borrow. Nested sessions without
+    an explicit config reuse the outer pool.
+    """
+    existing = _session_pool.get()
+    if existing is not None and config is None:
+        yield existing
+        return
+
+    pool = BrowserPool(config)
+    token = _session_pool.set(pool)
+    try:
+        yield pool
+    finally:
+        _session_pool.reset(token)
+        await pool.close()
+
+
+async def _render_page(
+    page: Page,
+    url: str,
+    *,
+    loader_name: str,
+    timeout_ms: float | None,
+    timeout_suggestion: str,
+    wait_until: BrowserWaitUntil | None,
+    block_resource_types: frozenset[str],
+    after_goto: BrowserPageHook | None,
+    extract_content: BrowserContentExtractor | None,
+) -> str:
+    if block_resource_types:
+        logger.debug("[%s] Blocking browser resource types: %s", loader_name, sorted(block_resource_types))
+
+        async def route_handler(route: Route, request: Request) -> None:
+            if request.resource_type in block_resource_types:
+                await route.abort()
+                return
+            await route.continue_()
+
+        await page.route("**/*", route_handler)
+
+    try:
+        logger.debug(
+            "[%s] Navigating to URL (timeout_ms=%s, wait_until=%s)",
+            loader_name,
+            timeout_ms,
+            wait_until,
+        )
+        if wait_until is None:
+            await page.goto(url, timeout=timeout_ms)
+        else:
+            await page.goto(url, timeout=timeout_ms, wait_until=wait_until)
+    except TimeoutError as e:
+        timeout_seconds = (timeout_ms or 0) / 1000 if timeout_ms else 30
+        logger.warning("[%s] Browser navigation timed out after %ss", loader_name, timeout_seconds)
+        raise LoaderTimeoutError(loader_name, url, timeout_seconds, timeout_suggestion) from e
+
+    if after_goto is not None:
+        logger.debug("[%s] Running post-navigation hook", loader_name)
+        await after_goto(page)
+
+    if extract_content is not None:
+        logger.debug("[%s] Extracting browser content with custom extractor", loader_name)
+        return await extract_content(page)
+    logger.debug("[%s] Extracting full browser page content", loader_name)
+    return await page.content()
+
+
 async def fetch_browser_html(
     url: str,
     *,
@@ -38,6 +265,28 @@ async def fetch_browser_html(
     after_goto: BrowserPageHook | None = None,
     extract_content: BrowserContentExtractor | None = None,
 ) -> str:
+    async def render(page: Page) -> str:
+        with timed(TimingStage.FETCH) as span:
+            html = await _render_page(
+                page,
+                url,
+                loader_name=loader_name,
+                timeout_ms=timeout_ms,
+                timeout_suggestion=timeout_suggestion,
+                wait_until=wait_until,
+                block_resource_types=block_resource_types,
+                after_goto=after_goto,
+                extract_content=extract_content,
+            )
+            span.record(bytes_out=html)
+        return html
+
+    pool = _session_pool.get()
+    if pool is not None and pool.config.headless == browser_headless:
+        logger.debug("[%s] Borrowing page from browser pool", loader_name)
+        async with pool.page(user_agent=user_agent) as page:
+            return await render(page)
+
     async with async_playwright() as p:
         logger.debug("[%s] Launching Chromium browser (headless=%s)", loader_name, browser_headless)
         browser = await p.chromium.launch(headless=browser_headless)
@@ -50,43 +299,7 @@ async def fetch_browser_html(
                 logger.debug("[%s] Creating browser context with custom user agent", loader_name)
                 context = await browser.new_context(user_agent=user_agent)
             page = await context.new_page()
-
-            if block_resource_types:
-                logger.debug("[%s] Blocking browser resource types: %s", loader_name, sorted(block_resource_types))
-
-                async def route_handler(route: Route, request: Request) -> None:
-                    if request.resource_type in block_resource_types:
-                        await route.abort()
-                        return
-                    await route.continue_()
-
-                await page.route("**/*", route_handler)
-
-            try:
-                logger.debug(
-                    "[%s] Navigating to URL (timeout_ms=%s, wait_until=%s)",
-                    loader_name,
-                    timeout_ms,
-                    wait_until,
-                )
-                if wait_until is None:
-                    await page.goto(url, timeout=timeout_ms)
-                else:
-                    await page.goto(url, timeout=timeout_ms, wait_until=wait_until)
-            except TimeoutError as e:
-                timeout_seconds = (timeout_ms or 0) / 1000 if timeout_ms else 30
-                logger.warning("[%s] Browser navigation timed out after %ss", loader_name, timeout_seconds)
-                raise LoaderTimeoutError(loader_name, url, timeout_seconds, timeout_suggestion) from e
-
-            if after_goto is not None:
-                logger.debug("[%s] Running post-navigation hook", loader_name)
-                await after_goto(page)
-
-            if extract_content is not None:
-                logger.debug("[%s] Extracting browser content with custom extractor", loader_name)
-                return await extract_content(page)
-            logger.debug("[%s] Extracting full browser page content", loader_name)
-            return await page.content()
+            return await render(page)
         finally:
             if context is not None:
                 logger.debug("[%s] Closing browser context", loader_name)
@@ -100,6 +313,10 @@ __all__ = [
     "DEFAULT_BROWSER_USER_AGENT",
     "BrowserContentExtractor",
     "BrowserPageHook",
+    "BrowserPool",
+    "BrowserPoolConfig",
     "BrowserWaitUntil",
+    "browser_pool_session",
+    "configure_browser_pool",
     "fetch_browser_html",
 ]
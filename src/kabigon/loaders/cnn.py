@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import httpx
+
 from kabigon.core.loader import Loader
 from kabigon.sources.applicability import parse_cnn_target
 
@@ -8,10 +10,15 @@ from .news_article import load_news_article
 
 
 class CNNLoader(Loader):
-    def __init__(self, headers: dict[str, str] | None = None) -> None:
+    def __init__(self, headers: dict[str, str] | None = None, client: httpx.AsyncClient | None = None) -> None:
         self.headers = headers or DEFAULT_NEWS_ARTICLE_HEADERS
+        self.client = client
 
     async def load(self, url: str) -> str:
         return await load_news_article(
-            url, loader_name="CNNLoader", validate_url=parse_cnn_target, headers=self.headers
+            url,
+            loader_name="CNNLoader",
+            validate_url=parse_cnn_target,
+            headers=self.headers,
+            client=self.client,
         )
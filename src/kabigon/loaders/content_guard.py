@@ -9,10 +9,22 @@ challenge page.
 
 from __future__ import annotations
 
+import re
+from dataclasses import dataclass
+
 from kabigon.core.errors import LoaderContentError
+from kabigon.timing import TimingStage
+from kabigon.timing import timed
 
 MIN_CONTENT_LENGTH: int = 300
 
+# Block and challenge pages are tiny and state what they are up front, so only
+# the head of the content is scanned; long articles are never copied whole.
+HEAD_WINDOW: int = 4096
+
+# Confidence at or above which content is treated as a block page.
+BLOCK_CONFIDENCE_THRESHOLD: float = 0.5
+
 # Lower-cased substrings that strongly indicate a block, challenge, or
 # upstream error page rather than real content.
 BLOCKED_MARKERS: tuple[str, ...] = (
@@ -28,6 +40,64 @@ BLOCKED_MARKERS: tuple[str, ...] = (
     "cf-error-details",
 )
 
+# Generic HTTP error phrases also show up in real articles, so they weigh less
+# than challenge-specific wording.
+_GENERIC_MARKERS = frozenset({"access denied", "403 forbidden", "502 bad gateway", "503 service"})
+_CHALLENGE_WEIGHT = 0.9
+_GENERIC_WEIGHT = 0.6
+
+_MARKER_PATTERN = re.compile("|".join(re.escape(marker) for marker in BLOCKED_MARKERS), re.IGNORECASE)
+_NON_SPACE = re.compile(r"\S")
+
+
+@dataclass(frozen=True)
+class BlockAssessment:
+    """How confident the guard is that content is a block or challenge page."""
+
+    confidence: float
+    markers: tuple[str, ...] = ()
+
+    @property
+    def blocked(self) -> bool:
+        return self.confidence >= BLOCK_CONFIDENCE_THRESHOLD
+
+
+def assess_block_page(content: str) -> BlockAssessment:
+    """Score ``content`` against the block markers in one pass over its head.
+
+    Each distinct marker contributes its weight, boosted when it sits in the
+    title region (the first line), and weights combine as independent evidence.
+    """
+    window = content[:HEAD_WINDOW]
+    title_end = window.find("\n")
+    if title_end < 0:
+        title_end = len(window)
+
+    weights: dict[str, float] = {}
+    for match in _MARKER_PATTERN.finditer(window):
+        marker = match.group().lower()
+        weight = _GENERIC_WEIGHT if marker in _GENERIC_MARKERS else _CHALLENGE_WEIGHT
+        if match.start() < title_end:
+            weight += (1 - weight) / 2
+        weights[marker] = max(weight, weights.get(marker, 0.0))
+
+    miss = 1.0
+    for weight in weights.values():
+        miss *= 1 - weight
+    markers = tuple(sorted(weights, key=weights.__getitem__, reverse=True))
+    return BlockAssessment(confidence=1 - miss, markers=markers)
+
+
+def _stripped_length(content: str) -> int:
+    # Same as len(content.strip()) without copying the content.
+    match = _NON_SPACE.search(content)
+    if match is None:
+        return 0
+    end = len(content)
+    while content[end - 1].isspace():
+        end -= 1
+    return end - match.start()
+
 
 def ensure_usable_content(
     content: str,
@@ -35,31 +105,42 @@ def ensure_usable_content(
     loader_name: str,
     url: str,
     min_length: int = MIN_CONTENT_LENGTH,
-) -> None:
+) -> BlockAssessment:
     """Validate extracted markdown looks like real content.
 
-    Raises :class:`LoaderContentError` when the content is too short or matches
-    a known block/challenge marker, so the load chain can fall through to the
-    next loader.
+    Raises :class:`LoaderContentError` when the content is too short or its
+    block/challenge confidence reaches ``BLOCK_CONFIDENCE_THRESHOLD``, so the
+    load chain can fall through to the next loader. Returns the assessment of
+    content that passed.
     """
-    stripped_length = len(content.strip())
-    if stripped_length < min_length:
-        raise LoaderContentError(
-            loader_name,
-            url,
-            f"Extracted content too short ({stripped_length} chars < {min_length})",
-            "Page may be JS-heavy or blocking requests; chain will try next loader.",
-        )
-
-    lowered = content.lower()
-    for marker in BLOCKED_MARKERS:
-        if marker in lowered:
+    with timed(TimingStage.GUARD, url=url) as span:
+        span.record(bytes_in=content)
+        stripped_length = _stripped_length(content)
+        if stripped_length < min_length:
+            raise LoaderContentError(
+                loader_name,
+                url,
+                f"Extracted content too short ({stripped_length} chars < {min_length})",
+                "Page may be JS-heavy or blocking requests; chain will try next loader.",
+            )
+
+        assessment = assess_block_page(content)
+        if assessment.blocked:
             raise LoaderContentError(
                 loader_name,
                 url,
-                f"Detected block/challenge marker: {marker!r}",
+                f"Detected block/challenge marker: {assessment.markers[0]!r}",
                 "The site appears to be blocking automated requests.",
             )
+    return assessment
 
 
-__all__ = ["BLOCKED_MARKERS", "MIN_CONTENT_LENGTH", "ensure_usable_content"]
+__all__ = [
+    "BLOCKED_MARKERS",
+    "BLOCK_CONFIDENCE_THRESHOLD",
+    "HEAD_WINDOW",
+    "MIN_CONTENT_LENGTH",
+    "BlockAssessment",
+    "assess_block_page",
+    "ensure_usable_content",
+]
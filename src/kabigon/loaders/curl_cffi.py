@@ -4,25 +4,22 @@
 services (Cloudflare, Akamai, …) check. ``curl_cffi`` wraps libcurl-impersonate
 and sends a request that looks like Chrome down to the JA3/Akamai fingerprint,
 which is often enough to bypass simple WAF rules without spinning up a full
-browser.
+browser. Sessions come from the curl session pool, so repeated fetches reuse
+connections per impersonation profile.
 """
 
 from __future__ import annotations
 
 import logging
-from typing import TYPE_CHECKING
-from typing import cast
-
-from curl_cffi import requests as curl_requests
-
-if TYPE_CHECKING:
-    from curl_cffi.requests.impersonate import BrowserTypeLiteral
 
 from kabigon.core.errors import LoaderContentError
 from kabigon.core.loader import Loader
+from kabigon.timing import TimingStage
+from kabigon.timing import timed
 
 from .content_guard import ensure_usable_content
-from .utils import html_to_markdown
+from .curl_session import borrow_curl_session
+from .utils import html_to_markdown_async
 
 logger = logging.getLogger(__name__)
 
@@ -49,16 +46,16 @@ class CurlCffiLoader(Loader):
         logger.info("[CurlCffiLoader] Processing URL: %s (impersonate=%s)", url, self.impersonate)
 
         try:
-            async with curl_requests.AsyncSession(
-                impersonate=cast("BrowserTypeLiteral", self.impersonate),
-            ) as session:
-                response = await session.get(
-                    url,
-                    headers=self.headers,
-                    timeout=self.timeout,
-                    allow_redirects=True,
-                )
-                response.raise_for_status()
+            async with borrow_curl_session(self.impersonate) as session:
+                with timed(TimingStage.FETCH) as span:
+                    response = await session.get(
+                        url,
+                        headers=self.headers,
+                        timeout=self.timeout,
+                        allow_redirects=True,
+                    )
+                    span.record(bytes_out=response.content)
+                    response.raise_for_status()
         except Exception as e:
             logger.warning("[CurlCffiLoader] HTTP error: %s", e)
             raise LoaderContentError(
@@ -68,7 +65,7 @@ class CurlCffiLoader(Loader):
                 "Check that the URL is valid and reachable.",
             ) from e
 
-        result = html_to_markdown(response.content)
+        result = await html_to_markdown_async(response.content, encoding=response.charset_encoding)
         logger.info("[CurlCffiLoader] Extracted HTML content (%s chars)", len(result))
         ensure_usable_content(result, loader_name="CurlCffiLoader", url=url)
         return result
@@ -0,0 +1,161 @@
+"""Shared ``curl_cffi`` sessions for browser-impersonating fetches.
+
+A ``curl_cffi`` session owns a libcurl multi handle and its connection cache,
+so opening one per request pays handle setup and a fresh TLS handshake every
+time. Inside a curl session pool (opened by every loader session) loaders
+borrow one long-lived session per impersonation profile instead. Each session
+caps connections per host in libcurl, and sessions left unused for
+``idle_timeout`` seconds are closed on the next borrow. Outside a pool a
+loader falls back to a short-lived session of its own.
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+from collections.abc import AsyncGenerator
+from collections.abc import Callable
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+from typing import cast
+
+from curl_cffi import CurlMOpt
+from curl_cffi import requests as curl_requests
+
+if TYPE_CHECKING:
+    from curl_cffi.requests.impersonate import BrowserTypeLiteral
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class CurlSessionPoolConfig:
+    # Concurrent transfers per profile; further requests wait for a free handle.
+    max_clients: int = 32
+    max_connections_per_host: int = 6
+    idle_timeout: float = 60.0
+
+
+_default_config = CurlSessionPoolConfig()
+_session_pool: ContextVar[CurlSessionPool | None] = ContextVar("kabigon_curl_session_pool", default=None)
+
+
+def configure_curl_session_pool(config: CurlSessionPoolConfig) -> None:
+    """Set the configuration used for curl session pools created from now on."""
+    global _default_config
+    _default_config = config
+
+
+def _new_session(impersonate: str, max_clients: int) -> curl_requests.AsyncSession:
+    return curl_requests.AsyncSession(
+        impersonate=cast("BrowserTypeLiteral", impersonate),
+        max_clients=max_clients,
+    )
+
+
+class _PooledSession:
+    def __init__(self, session: curl_requests.AsyncSession, now: float) -> None:
+        self.session = session
+        self.active = 0
+        self.last_used = now
+
+
+class CurlSessionPool:
+    """One long-lived ``AsyncSession`` per impersonation profile."""
+
+    def __init__(
+        self,
+        config: CurlSessionPoolConfig | None = None,
+        *,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.config = config or _default_config
+        self.clock = clock
+        self._sessions: dict[str, _PooledSession] = {}
+
+    def __len__(self) -> int:
+        return len(self._sessions)
+
+    @asynccontextmanager
+    async def session(self, impersonate: str) -> AsyncGenerator[curl_requests.AsyncSession]:
+        await self._evict_idle()
+        pooled = self._sessions.get(impersonate)
+        if pooled is None:
+            pooled = self._sessions[impersonate] = self._open(impersonate)
+        pooled.active += 1
+        try:
+            yield pooled.session
+        finally:
+            pooled.active -= 1
+            pooled.last_used = self.clock()
+
+    async def close(self) -> None:
+        sessions, self._sessions = self._sessions, {}
+        for pooled in sessions.values():
+            await _close_session(pooled.session)
+
+    def _open(self, impersonate: str) -> _PooledSession:
+        logger.debug("[CurlSessionPool] Opening session (impersonate=%s)", impersonate)
+        session = _new_session(impersonate, self.config.max_clients)
+        session.acurl.setopt(CurlMOpt.MAX_HOST_CONNECTIONS, self.config.max_connections_per_host)
+        return _PooledSession(session, self.clock())
+
+    async def _evict_idle(self) -> None:
+        deadline = self.clock() - self.config.idle_timeout
+        idle = [
+            profile for profile, pooled in self._sessions.items() if not pooled.active and pooled.last_used <= deadline
+        ]
+        for profile in idle:
+            logger.debug("[CurlSessionPool] Closing idle session (impersonate=%s)", profile)
+            await _close_session(self._sessions.pop(profile).session)
+
+
+async def _close_session(session: curl_requests.AsyncSession) -> None:
+    try:
+        await session.close()
+    except Exception as e:  # noqa: BLE001
+        logger.debug("[CurlSessionPool] Failed to close session: %s", e)
+
+
+@asynccontextmanager
+async def curl_session_pool_session(config: CurlSessionPoolConfig | None = None) -> AsyncGenerator[CurlSessionPool]:
+    """Let curl_cffi-based loaders inside the block share one session pool.
+
+    Nested sessions without an explicit config reuse the outer pool.
+    """
+    existing = _session_pool.get()
+    if existing is not None and config is None:
+        yield existing
+        return
+
+    pool = CurlSessionPool(config)
+    token = _session_pool.set(pool)
+    try:
+        yield pool
+    finally:
+        _session_pool.reset(token)
+        await pool.close()
+
+
+@asynccontextmanager
+async def borrow_curl_session(impersonate: str) -> AsyncGenerator[curl_requests.AsyncSession]:
+    """Yield the pool's session for ``impersonate``, else a short-lived one."""
+    pool = _session_pool.get()
+    if pool is not None:
+        async with pool.session(impersonate) as session:
+            yield session
+        return
+
+    async with _new_session(impersonate, _default_config.max_clients) as session:
+        yield session
+
+
+__all__ = [
+    "CurlSessionPool",
+    "CurlSessionPoolConfig",
+    "borrow_curl_session",
+    "configure_curl_session_pool",
+    "curl_session_pool_session",
+]
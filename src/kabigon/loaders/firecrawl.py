@@ -1,55 +1,237 @@
+"""Firecrawl loader on the shared async HTTP client.
+
+``FirecrawlClient`` talks to the Firecrawl REST API (``FIRECRAWL_API_URL``,
+defaulting to the hosted service) through the pooled ``httpx`` client, so
+concurrent scrapes share connections instead of each holding a thread.
+
+Batches that include several URLs of a Firecrawl-targeted pipeline submit them
+as one batch-scrape job inside ``firecrawl_batch_session``; the Firecrawl
+loader of each URL then awaits that job instead of starting its own scrape.
+"""
+
+from __future__ import annotations
+
 import asyncio
 import logging
 import os
+from collections.abc import AsyncGenerator
+from collections.abc import Sequence
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
 from typing import Any
 
-from firecrawl import FirecrawlApp
+import httpx
 
 from kabigon.core.errors import FirecrawlAPIKeyNotSetError
 from kabigon.core.errors import LoaderError
 from kabigon.core.loader import Loader
+from kabigon.timing import TimingStage
+from kabigon.timing import timed
+
+from .http_client import borrow_http_client
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_FIRECRAWL_API_URL = "https://api.firecrawl.dev"
+# Scrapes render pages remotely and take far longer than the pooled client's default timeout.
+REQUEST_TIMEOUT = 120.0
+BATCH_POLL_INTERVAL = 2.0
+# How long to poll a batch job before its loaders give up on it and scrape one URL at a time.
+BATCH_TIMEOUT = 300.0
+# A batch job only pays off once it replaces at least this many single scrapes.
+MIN_BATCH_SIZE = 2
 
-class FirecrawlLoader(Loader):
-    def __init__(self, timeout: int | None = None) -> None:
-        self.timeout = timeout
+_batch_scraper: ContextVar[FirecrawlBatchScraper | None] = ContextVar("kabigon_firecrawl_batch", default=None)
 
-        api_key = os.getenv("FIRECRAWL_API_KEY")
-        if not api_key:
-            raise FirecrawlAPIKeyNotSetError
 
-        logger.debug("[FirecrawlLoader] Found FIRECRAWL_API_KEY")
-        self.app: Any = FirecrawlApp(api_key=api_key)
+def _api_key() -> str:
+    api_key = os.getenv("FIRECRAWL_API_KEY")
+    if not api_key:
+        raise FirecrawlAPIKeyNotSetError
+    return api_key
 
-    def load_sync(self, url: str) -> str:
-        logger.info("[FirecrawlLoader] Processing URL: %s", url)
-        scrape_kwargs = {
-            "formats": ["markdown"],
-            "timeout": self.timeout,
-        }
-        if hasattr(self.app, "scrape_url"):
-            logger.info("[FirecrawlLoader] Fetching URL with scrape_url (timeout=%s)", self.timeout)
-            result = self.app.scrape_url(url, **scrape_kwargs)
-        elif hasattr(self.app, "scrape"):
-            logger.info("[FirecrawlLoader] Fetching URL with scrape (timeout=%s)", self.timeout)
-            result = self.app.scrape(url, **scrape_kwargs)
-        else:
-            raise LoaderError(url, ["Firecrawl SDK does not expose scrape methods"])
-
-        success = getattr(result, "success", None)
-        if success is False:
-            logger.warning("[FirecrawlLoader] Firecrawl scrape returned unsuccessful result")
-            raise LoaderError(url, ["Firecrawl scrape returned unsuccessful result"])
-
-        markdown = getattr(result, "markdown", None)
-        if markdown is None and isinstance(result, dict):
-            markdown = result.get("markdown")
+
+class FirecrawlClient:
+    def __init__(
+        self,
+        api_key: str,
+        *,
+        api_url: str | None = None,
+        client: httpx.AsyncClient | None = None,
+        poll_interval: float | None = None,
+        batch_timeout: float | None = None,
+    ) -> None:
+        self.api_url = (api_url or os.getenv("FIRECRAWL_API_URL") or DEFAULT_FIRECRAWL_API_URL).rstrip("/")
+        self.client = client
+        self.poll_interval = BATCH_POLL_INTERVAL if poll_interval is None else poll_interval
+        self.batch_timeout = BATCH_TIMEOUT if batch_timeout is None else batch_timeout
+        self._headers = {"Authorization": f"Bearer {api_key}"}
+
+    async def _request(self, method: str, path: str, target: str, *, json: object = None) -> dict[str, Any]:
+        url = path if path.startswith(("http://", "https://")) else f"{self.api_url}{path}"
+        try:
+            async with borrow_http_client(self.client) as client:
+                with timed(TimingStage.FETCH) as span:
+                    response = await client.request(
+                        method, url, json=json, headers=self._headers, timeout=REQUEST_TIMEOUT
+                    )
+                    span.record(bytes_out=response.content)
+        except httpx.HTTPError as e:
+            raise LoaderError(target, [f"Firecrawl request failed: {e}"]) from e
+
+        try:
+            payload = response.json()
+        except ValueError:
+            payload = None
+        if not isinstance(payload, dict):
+            payload = {}
+        if response.is_error or payload.get("success") is False:
+            error = payload.get("error") or response.reason_phrase
+            raise LoaderError(target, [f"Firecrawl API error ({response.status_code}): {error}"])
+        return payload
+
+    async def scrape(self, url: str, *, timeout_ms: int | None = None) -> str:
+        """Scrape one URL and return its markdown."""
+        body: dict[str, object] = {"url": url, "formats": ["markdown"]}
+        if timeout_ms is not None:
+            body["timeout"] = timeout_ms
+        payload = await self._request("POST", "/v1/scrape", url, json=body)
+        data = payload.get("data")
+        markdown = data.get("markdown") if isinstance(data, dict) else None
         if not isinstance(markdown, str):
             raise LoaderError(url, ["Firecrawl scrape result did not include markdown"])
-        logger.info("[FirecrawlLoader] Extracted markdown content (%s chars)", len(markdown))
         return markdown
 
+    async def batch_scrape(self, urls: Sequence[str]) -> dict[str, str]:
+        """Scrape ``urls`` as one batch job and return markdown keyed by source URL."""
+        target = f"Firecrawl batch of {len(urls)} URLs"
+        job = await self._request(
+            "POST", "/v1/batch/scrape", target, json={"urls": list(urls), "formats": ["markdown"]}
+        )
+        job_id = job.get("id")
+        if not isinstance(job_id, str):
+            raise LoaderError(target, ["Firecrawl batch scrape did not return a job id"])
+        logger.info("[FirecrawlLoader] Started batch scrape %s for %s URLs", job_id, len(urls))
+
+        page = await self._wait_for_batch(f"/v1/batch/scrape/{job_id}", target)
+        results: dict[str, str] = {}
+        while True:
+            _collect_markdown(page, results)
+            next_page = page.get("next")
+            if not isinstance(next_page, str) or not next_page:
+                return results
+            page = await self._request("GET", next_page, target)
+
+    async def _wait_for_batch(self, path: str, target: str) -> dict[str, Any]:
+        try:
+            async with asyncio.timeout(self.batch_timeout):
+                while True:
+                    status = await self._request("GET", path, target)
+                    state = status.get("status")
+                    if state == "completed":
+                        return status
+                    if state in {"failed", "cancelled"}:
+                        raise LoaderError(target, [f"Firecrawl batch scrape {state}"])
+                    await asyncio.sleep(self.poll_interval)
+        except TimeoutError as e:
+            raise LoaderError(target, [f"Firecrawl batch scrape did not finish within {self.batch_timeout}s"]) from e
+
+
+def _collect_markdown(page: dict[str, Any], results: dict[str, str]) -> None:
+    data = page.get("data")
+    for item in data if isinstance(data, list) else ():
+        if not isinstance(item, dict):
+            continue
+        metadata = item.get("metadata")
+        source = metadata.get("sourceURL") if isinstance(metadata, dict) else None
+        markdown = item.get("markdown")
+        if isinstance(source, str) and isinstance(markdown, str):
+            results[source] = markdown
+
+
+class FirecrawlBatchScraper:
+    """Batch-scrape jobs shared by the Firecrawl loaders of one batch."""
+
+    def __init__(self, client: FirecrawlClient) -> None:
+        self.client = client
+        self._jobs: dict[str, asyncio.Task[dict[str, str]]] = {}
+
+    def submit(self, urls: Sequence[str]) -> None:
+        """Start one batch job for the URLs not already submitted, if there are enough of them."""
+        fresh = [url for url in dict.fromkeys(urls) if url not in self._jobs]
+        if len(fresh) < MIN_BATCH_SIZE:
+            return
+        job = asyncio.create_task(self.client.batch_scrape(fresh))
+        for url in fresh:
+            self._jobs[url] = job
+
+    async def markdown_for(self, url: str) -> str | None:
+        """Markdown for ``url`` from its batch job, or ``None`` to scrape it on its own."""
+        job = self._jobs.get(url)
+        if job is None:
+            return None
+        try:
+            # Shielded: one cancelled loader must not cancel the job its neighbours wait on.
+            results = await asyncio.shield(job)
+        except LoaderError as e:
+            logger.warning("[FirecrawlLoader] Batch scrape failed, scraping individually: %s", e)
+            return None
+        return results.get(url)
+
+    async def aclose(self) -> None:
+        jobs = set(self._jobs.values())
+        for job in jobs:
+            job.cancel()
+        await asyncio.gather(*jobs, return_exceptions=True)
+        self._jobs.clear()
+
+
+@asynccontextmanager
+async def firecrawl_batch_session() -> AsyncGenerator[FirecrawlBatchScraper | None]:
+    """Let Firecrawl loaders inside the block share batch-scrape jobs.
+
+    Yields ``None`` when ``FIRECRAWL_API_KEY`` is not set, since no Firecrawl
+    loader could run anyway.
+    """
+    api_key = os.getenv("FIRECRAWL_API_KEY")
+    if not api_key:
+        yield None
+        return
+
+    scraper = FirecrawlBatchScraper(FirecrawlClient(api_key))
+    token = _batch_scraper.set(scraper)
+    try:
+        yield scraper
+    finally:
+        _batch_scraper.reset(token)
+        await scraper.aclose()
+
+
+class FirecrawlLoader(Loader):
+    def __init__(self, timeout: int | None = None, client: httpx.AsyncClient | None = None) -> None:
+        self.timeout = timeout
+        self.api = FirecrawlClient(_api_key(), client=client)
+        logger.debug("[FirecrawlLoader] Found FIRECRAWL_API_KEY")
+
     async def load(self, url: str) -> str:
-        return await asyncio.to_thread(self.load_sync, url)
+        logger.info("[FirecrawlLoader] Processing URL: %s", url)
+        scraper = _batch_scraper.get()
+        if scraper is not None:
+            markdown = await scraper.markdown_for(url)
+            if markdown is not None:
+                logger.info("[FirecrawlLoader] Using batch scrape result (%s chars)", len(markdown))
+                return markdown
+
+        logger.info("[FirecrawlLoader] Fetching URL with scrape (timeout=%s)", self.timeout)
+        markdown = await self.api.scrape(url, timeout_ms=self.timeout)
+        logger.info("[FirecrawlLoader] Extracted markdown content (%s chars)", len(markdown))
+        return markdown
+
+
+__all__ = [
+    "DEFAULT_FIRECRAWL_API_URL",
+    "FirecrawlBatchScraper",
+    "FirecrawlClient",
+    "FirecrawlLoader",
+    "firecrawl_batch_session",
+]
@@ -13,6 +13,7 @@ from kabigon.sources.applicability import parse_github_target
 from kabigon.sources.applicability import require_loader_applicability
 
 from .html_extractors import extract_first_tag_subtree
+from .http_client import borrow_http_client
 from .utils import html_to_markdown
 
 logger = logging.getLogger(__name__)
@@ -44,6 +45,9 @@ def extract_main_html(html: str) -> str:
 
 
 class GitHubLoader(Loader):
+    def __init__(self, client: httpx.AsyncClient | None = None) -> None:
+        self.client = client
+
     async def load(self, url: str) -> str:
         logger.info("[GitHubLoader] Processing URL: %s", url)
         require_loader_applicability("GitHubLoader", url, parse_github_target)
@@ -53,7 +57,7 @@ class GitHubLoader(Loader):
             raw_url = to_raw_github_url(url)
             logger.info("[GitHubLoader] Fetching raw GitHub content: %s", raw_url)
 
-            async with httpx.AsyncClient() as client:
+            async with borrow_http_client(self.client) as client:
                 response = await client.get(
                     raw_url,
                     follow_redirects=True,
@@ -70,7 +74,7 @@ class GitHubLoader(Loader):
             return response.text
 
         logger.info("[GitHubLoader] Fetching GitHub HTML page")
-        async with httpx.AsyncClient() as client:
+        async with borrow_http_client(self.client) as client:
             response = await client.get(
                 url,
                 follow_redirects=True,
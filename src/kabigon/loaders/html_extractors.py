@@ -31,41 +31,38 @@ _JSON_LD_PATTERN = re.compile(
 )
 
 
-class SubtreeHTMLExtractor(HTMLParser):
-    def __init__(self, root_tag: str, ignored_tags: set[str] | None = None) -> None:
-        super().__init__(convert_charrefs=True)
-        self.root_tag = root_tag
-        self.ignored_tags = ignored_tags or set()
-        self._capturing = False
+class _StopParsingError(Exception):
+    """Raised to stop parsing once the highest-priority subtree is captured."""
+
+
+class _Capture:
+    def __init__(self, ignored_tags: set[str]) -> None:
+        self.ignored_tags = ignored_tags
+        self.active = False
+        self.complete = False
         self._depth = 0
         self._ignored_depth = 0
         self._out: list[str] = []
 
-    def get_html(self) -> str:
+    @property
+    def html(self) -> str:
         return "".join(self._out).strip()
 
-    def handle_starttag(self, tag: str, attrs: list[tuple[str, str | None]]) -> None:
-        if tag == self.root_tag and not self._capturing:
-            self._capturing = True
-            self._depth = 1
-            self._out.append(self.get_starttag_text() or f"<{tag}>")
-            return
+    def open(self, text: str) -> None:
+        self.active = True
+        self._depth = 1
+        self._out = [text]
 
-        if not self._capturing:
-            return
-
-        if tag in self.ignored_tags:
-            self._ignored_depth += 1
+    def start(self, tag: str, text: str) -> None:
+        if self._ignored_depth or tag in self.ignored_tags:
+            if tag in self.ignored_tags:
+                self._ignored_depth += 1
             return
-
-        self._out.append(self.get_starttag_text() or f"<{tag}>")
+        self._out.append(text)
         if tag not in _VOID_TAGS:
             self._depth += 1
 
-    def handle_endtag(self, tag: str) -> None:
-        if not self._capturing:
-            return
-
+    def end(self, tag: str) -> None:
         if self._ignored_depth:
             if tag in self.ignored_tags:
                 self._ignored_depth -= 1
@@ -74,31 +71,78 @@ class SubtreeHTMLExtractor(HTMLParser):
         self._out.append(f"</{tag}>")
         if tag not in _VOID_TAGS:
             self._depth -= 1
-
         if self._depth <= 0:
-            self._capturing = False
+            self.active = False
+            self.complete = True
 
-    def handle_startendtag(self, tag: str, attrs: list[tuple[str, str | None]]) -> None:
-        if not self._capturing:
-            return
-        if self._ignored_depth or tag in self.ignored_tags:
+    def startend(self, tag: str, text: str) -> None:
+        if not self._ignored_depth and tag not in self.ignored_tags:
+            self._out.append(text)
+
+    def data(self, data: str) -> None:
+        if not self._ignored_depth:
+            self._out.append(data)
+
+
+class SubtreeHTMLExtractor(HTMLParser):
+    """Capture the first subtree of each root tag in a single parse.
+
+    Root tags are given in priority order. Parsing stops as soon as the subtree
+    of the first root tag closes, since nothing later can outrank it.
+    """
+
+    def __init__(self, root_tags: tuple[str, ...], ignored_tags: set[str] | None = None) -> None:
+        super().__init__(convert_charrefs=True)
+        self.root_tags = root_tags
+        ignored = ignored_tags or set()
+        self._captures = {tag: _Capture(ignored) for tag in root_tags}
+
+    def feed(self, data: str) -> None:
+        try:
+            super().feed(data)
+        except _StopParsingError:
             return
-        self._out.append(self.get_starttag_text() or f"<{tag} />")
+
+    def get_html(self) -> str:
+        """Return the highest-priority subtree found, or ``""`` if none was."""
+        for tag in self.root_tags:
+            html = self._captures[tag].html
+            if html:
+                return html
+        return ""
+
+    def handle_starttag(self, tag: str, attrs: list[tuple[str, str | None]]) -> None:
+        text = self.get_starttag_text() or f"<{tag}>"
+        for root_tag, capture in self._captures.items():
+            if capture.active:
+                capture.start(tag, text)
+            elif tag == root_tag and not capture.complete:
+                capture.open(text)
+
+    def handle_endtag(self, tag: str) -> None:
+        for capture in self._captures.values():
+            if capture.active:
+                capture.end(tag)
+        if self._captures[self.root_tags[0]].complete:
+            raise _StopParsingError
+
+    def handle_startendtag(self, tag: str, attrs: list[tuple[str, str | None]]) -> None:
+        text = self.get_starttag_text() or f"<{tag} />"
+        for capture in self._captures.values():
+            if capture.active:
+                capture.startend(tag, text)
 
     def handle_data(self, data: str) -> None:
-        if not self._capturing or self._ignored_depth:
-            return
-        self._out.append(data)
+        for capture in self._captures.values():
+            if capture.active:
+                capture.data(data)
 
 
 def extract_first_tag_subtree(html: str, tags: tuple[str, ...], ignored_tags: set[str] | None = None) -> str:
-    for tag in tags:
-        parser = SubtreeHTMLExtractor(tag, ignored_tags=ignored_tags)
-        parser.feed(html)
-        extracted = parser.get_html()
-        if extracted:
-            return extracted
-    return html
+    """Return the subtree of the first tag in ``tags`` present in ``html``, else ``html`` itself."""
+    parser = SubtreeHTMLExtractor(tags, ignored_tags=ignored_tags)
+    parser.feed(html)
+    return parser.get_html() or html
 
 
 def _find_article_body(data: object) -> str | None:
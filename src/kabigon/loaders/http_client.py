@@ -0,0 +1,113 @@
+"""Shared ``httpx.AsyncClient`` for httpx-based loaders.
+
+Opening a client per request pays a fresh TCP+TLS handshake every time and
+never reuses keep-alive or HTTP/2 connections. Loaders borrow the client of the
+active HTTP client session instead: a Load chain opens one session for all of
+its attempts, and a batch opens one for every URL in it. Outside a session a
+loader falls back to a short-lived client of its own.
+"""
+
+from __future__ import annotations
+
+import functools
+import importlib.util
+import logging
+from collections.abc import AsyncGenerator
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+
+import httpx
+
+
+@dataclass(frozen=True)
+class HttpClientConfig:
+    max_connections: int = 100
+    max_keepalive_connections: int = 20
+    keepalive_expiry: float = 30.0
+    timeout: float = 5.0
+    http2: bool = True
+
+
+logger = logging.getLogger(__name__)
+
+_default_config = HttpClientConfig()
+_session_client: ContextVar[httpx.AsyncClient | None] = ContextVar("kabigon_http_client", default=None)
+
+
+def _http2_available() -> bool:
+    # httpx only speaks HTTP/2 when the optional ``h2`` package is installed.
+    return importlib.util.find_spec("h2") is not None
+
+
+@functools.cache
+def _warn_http2_unavailable() -> None:
+    logger.warning("[HttpClient] HTTP/2 is configured but the h2 package is missing; falling back to HTTP/1.1")
+
+
+def _use_http2(config: HttpClientConfig) -> bool:
+    if not config.http2:
+        return False
+    if _http2_available():
+        return True
+    _warn_http2_unavailable()
+    return False
+
+
+def configure_http_client(config: HttpClientConfig) -> None:
+    """Set the configuration used for HTTP clients created from now on."""
+    global _default_config
+    _default_config = config
+
+
+def create_http_client(config: HttpClientConfig | None = None) -> httpx.AsyncClient:
+    config = config or _default_config
+    return httpx.AsyncClient(
+        limits=httpx.Limits(
+            max_connections=config.max_connections,
+            max_keepalive_connections=config.max_keepalive_connections,
+            keepalive_expiry=config.keepalive_expiry,
+        ),
+        timeout=config.timeout,
+        http2=_use_http2(config),
+    )
+
+
+@asynccontextmanager
+async def http_client_session(config: HttpClientConfig | None = None) -> AsyncGenerator[httpx.AsyncClient]:
+    """Share one pooled client with every httpx-based loader inside the block.
+
+    Nested sessions without an explicit config reuse the outer client.
+    """
+    existing = _session_client.get()
+    if existing is not None and config is None:
+        yield existing
+        return
+
+    async with create_http_client(config) as client:
+        token = _session_client.set(client)
+        try:
+            yield client
+        finally:
+            _session_client.reset(token)
+
+
+@asynccontextmanager
+async def borrow_http_client(client: httpx.AsyncClient | None = None) -> AsyncGenerator[httpx.AsyncClient]:
+    """Yield the injected client, else the session client, else a short-lived one."""
+    shared = client or _session_client.get()
+    if shared is not None:
+        yield shared
+        return
+
+    async with create_http_client() as owned:
+        yield owned
+
+
+__all__ = [
+    "HttpClientConfig",
+    "borrow_http_client",
+    "configure_http_client",
+    "create_http_client",
+    "http_client_session",
+]
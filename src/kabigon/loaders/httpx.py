@@ -4,9 +4,12 @@ import httpx
 
 from kabigon.core.errors import LoaderContentError
 from kabigon.core.loader import Loader
+from kabigon.timing import TimingStage
+from kabigon.timing import timed
 
 from .content_guard import ensure_usable_content
-from .utils import html_to_markdown
+from .http_client import borrow_http_client
+from .utils import html_to_markdown_async
 
 logger = logging.getLogger(__name__)
 
@@ -28,24 +31,27 @@ def _merge_headers(custom: dict[str, str] | None) -> dict[str, str]:
 
 
 class HttpxLoader(Loader):
-    def __init__(self, headers: dict[str, str] | None = None) -> None:
+    def __init__(self, headers: dict[str, str] | None = None, client: httpx.AsyncClient | None = None) -> None:
         self.headers = _merge_headers(headers)
+        self.client = client
 
     async def load(self, url: str) -> str:
         logger.info("[HttpxLoader] Processing URL: %s", url)
 
         try:
             logger.info("[HttpxLoader] Fetching HTML content")
-            async with httpx.AsyncClient() as client:
-                response = await client.get(url, headers=self.headers, follow_redirects=True)
-                response.raise_for_status()
+            async with borrow_http_client(self.client) as client:
+                with timed(TimingStage.FETCH) as span:
+                    response = await client.get(url, headers=self.headers, follow_redirects=True)
+                    span.record(bytes_out=response.content)
+                    response.raise_for_status()
         except httpx.HTTPError as e:
             logger.warning("[HttpxLoader] HTTP error: %s", e)
             raise LoaderContentError(
                 "HttpxLoader", url, f"HTTP request failed: {e}", "Check that the URL is valid and accessible."
             ) from e
 
-        result = html_to_markdown(response.content)
+        result = await html_to_markdown_async(response.content, encoding=response.charset_encoding)
         logger.info("[HttpxLoader] Extracted HTML content (%s chars)", len(result))
         ensure_usable_content(result, loader_name="HttpxLoader", url=url)
         return result
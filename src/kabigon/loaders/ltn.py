@@ -11,6 +11,7 @@ from kabigon.core.loader import Loader
 from kabigon.sources.applicability import parse_ltn_target
 
 from .html_extractors import extract_article_body_from_json_ld
+from .http_client import borrow_http_client
 from .news_article import DEFAULT_NEWS_ARTICLE_HEADERS
 from .utils import html_to_markdown
 
@@ -117,15 +118,16 @@ def extract_ltn_article_html(html: str) -> str:
 
 
 class LTNLoader(Loader):
-    def __init__(self, headers: dict[str, str] | None = None) -> None:
+    def __init__(self, headers: dict[str, str] | None = None, client: httpx.AsyncClient | None = None) -> None:
         self.headers = headers or DEFAULT_NEWS_ARTICLE_HEADERS
+        self.client = client
 
     async def load(self, url: str) -> str:
         parse_ltn_target(url)
         logger.info("[LTNLoader] Processing URL: %s", url)
 
         try:
-            async with httpx.AsyncClient() as client:
+            async with borrow_http_client(self.client) as client:
                 response = await client.get(url, headers=self.headers, follow_redirects=True)
                 response.raise_for_status()
         except httpx.HTTPError as e:
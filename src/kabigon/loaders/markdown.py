@@ -0,0 +1,389 @@
+"""Single-pass HTML-to-markdown conversion.
+
+``MarkdownConverter`` turns the event stream of ``html.parser.HTMLParser`` into
+markdown lines as it goes. Inline text is collected for the current line only;
+each finished line is whitespace-collapsed, stripped, and dropped when empty, so
+the output needs no separate normalization pass. Input can be fed in chunks,
+which lets callers decode bytes incrementally instead of materializing the
+whole document several times.
+
+The output follows what ``markdownify(..., strip=["a", "img"])`` followed by
+``normalize_whitespace`` produced: underlined ``h1``/``h2``, ATX headings
+below that, ``*``/``+``/``-`` bullets by depth, fenced ``pre`` blocks, pipe
+tables, link text without URLs, and no images.
+"""
+
+from __future__ import annotations
+
+import re
+from html.parser import HTMLParser
+
+_WHITESPACE = re.compile(r"\s+")
+_MARKDOWN_ESCAPES = str.maketrans({"*": r"\*", "_": r"\_"})
+
+_SKIPPED_TAGS = frozenset({"script", "style"})
+_VOID_TAGS = frozenset(
+    {"area", "base", "br", "col", "embed", "hr", "img", "input", "link", "meta", "param", "source", "track", "wbr"}
+)
+_BLOCK_TAGS = frozenset(
+    {
+        "address",
+        "article",
+        "aside",
+        "body",
+        "caption",
+        "center",
+        "details",
+        "dialog",
+        "div",
+        "dl",
+        "fieldset",
+        "figcaption",
+        "figure",
+        "footer",
+        "form",
+        "head",
+        "header",
+        "html",
+        "main",
+        "nav",
+        "p",
+        "section",
+        "summary",
+        "title",
+    }
+)
+_HEADING_LEVELS = {"h1": 1, "h2": 2, "h3": 3, "h4": 4, "h5": 5, "h6": 6}
+_EMPHASIS_MARKERS = {
+    "b": "**",
+    "strong": "**",
+    "i": "*",
+    "em": "*",
+    "del": "~~",
+    "s": "~~",
+    "strike": "~~",
+    "code": "`",
+    "kbd": "`",
+    "samp": "`",
+}
+_CODE_TAGS = frozenset({"code", "kbd", "samp"})
+_TABLE_TAGS = frozenset({"table", "tr", "td", "th"})
+_BULLETS = "*+-"
+
+
+class _List:
+    def __init__(self, ordered: bool, start: int) -> None:
+        self.ordered = ordered
+        self.next_number = start
+
+
+class _Table:
+    def __init__(self) -> None:
+        self.rows_emitted = 0
+        self.row: list[str] | None = None
+        self.row_has_header = False
+        self.cell_start: int | None = None
+
+
+class MarkdownConverter(HTMLParser):
+    """Incremental HTML-to-markdown converter; call ``feed`` then ``close``."""
+
+    def __init__(self) -> None:
+        super().__init__(convert_charrefs=True)
+        self._lines: list[str] = []
+        self._parts: list[str] = []
+        self._inline: list[tuple[str, int]] = []
+        self._lists: list[_List] = []
+        self._tables: list[_Table] = []
+        self._marker = ""
+        self._quote_depth = 0
+        self._skip_depth = 0
+        self._code_depth = 0
+        self._pre_depth = 0
+        self._pre_start = 0
+        self._heading: int | None = None
+
+    def markdown(self) -> str:
+        return "\n".join(self._lines)
+
+    def close(self) -> None:
+        super().close()
+        self._flush()
+
+    # Line assembly
+
+    def _prefix(self) -> str:
+        return "> " * self._quote_depth
+
+    def _emit(self, text: str) -> None:
+        text = text.strip()
+        if text:
+            self._lines.append(f"{self._prefix()}{text}")
+
+    def _flush(self) -> None:
+        # Table cells collect their text until the cell closes.
+        if not self._parts or self._in_cell():
+            return
+        text = _WHITESPACE.sub(" ", "".join(self._parts)).strip()
+        self._parts.clear()
+        self._inline.clear()
+        if not text:
+            return
+        if self._heading is not None:
+            self._emit_heading(text)
+            return
+        self._emit(f"{self._marker}{text}")
+        self._marker = ""
+
+    def _emit_heading(self, text: str) -> None:
+        level = self._heading or 1
+        if level == 1:
+            self._emit(text)
+            self._emit("=" * len(text))
+        elif level == 2:
+            self._emit(text)
+            self._emit("-" * len(text))
+        else:
+            self._emit(f"{'#' * level} {text}")
+
+    def _in_cell(self) -> bool:
+        return bool(self._tables) and self._tables[-1].cell_start is not None
+
+    def _break(self) -> None:
+        # Block boundaries inside a table cell only separate words.
+        if self._in_cell():
+            self._parts.append(" ")
+        else:
+            self._flush()
+
+    # Parser events
+
+    def handle_starttag(self, tag: str, attrs: list[tuple[str, str | None]]) -> None:
+        if self._skipping(tag, opening=True):
+            return
+
+        if tag in _EMPHASIS_MARKERS:
+            self._start_inline(tag)
+        elif tag in _BLOCK_TAGS:
+            self._break()
+        elif tag in _HEADING_LEVELS:
+            self._flush()
+            self._heading = _HEADING_LEVELS[tag]
+        elif tag in _TABLE_TAGS:
+            self._start_table_tag(tag)
+        else:
+            self._start_structure(tag, attrs)
+
+    def handle_endtag(self, tag: str) -> None:
+        if self._skipping(tag, opening=False) or tag in _VOID_TAGS:
+            return
+
+        if tag in _EMPHASIS_MARKERS:
+            self._end_inline(tag)
+        elif tag in _BLOCK_TAGS:
+            self._break()
+        elif tag in _HEADING_LEVELS:
+            self._flush()
+            self._heading = None
+        elif tag in _TABLE_TAGS:
+            self._end_table_tag(tag)
+        else:
+            self._end_structure(tag)
+
+    def handle_data(self, data: str) -> None:
+        if self._skip_depth:
+            return
+        if self._pre_depth:
+            self._parts.append(data)
+            return
+        if not self._code_depth:
+            data = data.translate(_MARKDOWN_ESCAPES)
+        self._parts.append(data)
+
+    def _skipping(self, tag: str, *, opening: bool) -> bool:
+        if tag in _SKIPPED_TAGS:
+            self._skip_depth += 1 if opening else -1
+            self._skip_depth = max(self._skip_depth, 0)
+            return True
+        return bool(self._skip_depth)
+
+    def _start_structure(self, tag: str, attrs: list[tuple[str, str | None]]) -> None:
+        if tag in {"ul", "ol"}:
+            self._flush()
+            self._lists.append(_List(ordered=tag == "ol", start=_int_attr(attrs, "start", 1)))
+        elif tag == "li":
+            self._start_list_item()
+        elif tag in {"dd", "dt"}:
+            self._flush()
+            self._marker = ":   " if tag == "dd" else ""
+        elif tag == "blockquote":
+            self._flush()
+            self._quote_depth += 1
+        elif tag == "pre":
+            self._flush()
+            self._emit("```")
+            self._pre_depth += 1
+            self._pre_start = len(self._parts)
+        elif tag in {"br", "hr"}:
+            self._break()
+            if tag == "hr" and not self._in_cell():
+                self._emit("---")
+
+    def _end_structure(self, tag: str) -> None:
+        if tag in {"ul", "ol"}:
+            self._flush()
+            if self._lists:
+                self._lists.pop()
+        elif tag in {"li", "dd", "dt"}:
+            self._flush()
+            self._marker = ""
+        elif tag == "blockquote":
+            self._flush()
+            self._quote_depth = max(self._quote_depth - 1, 0)
+        elif tag == "pre" and self._pre_depth:
+            self._end_pre()
+
+    # Inline formatting
+
+    def _start_inline(self, tag: str) -> None:
+        if self._pre_depth:
+            return
+        if tag in _CODE_TAGS:
+            self._code_depth += 1
+        self._inline.append((tag, len(self._parts)))
+        self._parts.append(_EMPHASIS_MARKERS[tag])
+
+    def _end_inline(self, tag: str) -> None:
+        if self._pre_depth:
+            return
+        for position in range(len(self._inline) - 1, -1, -1):
+            if self._inline[position][0] == tag:
+                break
+        else:
+            # The opening marker was already flushed with an earlier line.
+            if tag in _CODE_TAGS:
+                self._code_depth = max(self._code_depth - 1, 0)
+            return
+
+        start = self._inline[position][1]
+        del self._inline[position:]
+        if tag in _CODE_TAGS:
+            self._code_depth = max(self._code_depth - 1, 0)
+
+        marker = _EMPHASIS_MARKERS[tag]
+        inner = "".join(self._parts[start + 1 :])
+        del self._parts[start:]
+        content = inner.strip()
+        if not content:
+            self._parts.append(inner)
+            return
+        # Keep surrounding whitespace outside the markers, as markdown requires.
+        leading = " " if inner[:1].isspace() else ""
+        trailing = " " if inner[-1:].isspace() else ""
+        if tag in _CODE_TAGS:
+            content = _WHITESPACE.sub(" ", content)
+        self._parts.append(f"{leading}{marker}{content}{marker}{trailing}")
+
+    # Lists and preformatted text
+
+    def _start_list_item(self) -> None:
+        self._flush()
+        if not self._lists:
+            self._lists.append(_List(ordered=False, start=1))
+        current = self._lists[-1]
+        if current.ordered:
+            self._marker = f"{current.next_number}. "
+            current.next_number += 1
+        else:
+            self._marker = f"{_BULLETS[(len(self._lists) - 1) % len(_BULLETS)]} "
+
+    def _end_pre(self) -> None:
+        self._pre_depth -= 1
+        if self._pre_depth:
+            return
+        raw = "".join(self._parts[self._pre_start :])
+        del self._parts[self._pre_start :]
+        self._flush()
+        for line in raw.splitlines():
+            self._emit(line)
+        self._emit("```")
+
+    # Tables
+
+    def _start_table_tag(self, tag: str) -> None:
+        if tag == "table":
+            self._flush()
+            self._tables.append(_Table())
+        elif not self._tables:
+            return
+        elif tag == "tr":
+            table = self._tables[-1]
+            self._flush()
+            table.row = []
+            table.row_has_header = False
+        elif tag in {"td", "th"}:
+            table = self._tables[-1]
+            self._end_cell(table)
+            if table.row is None:
+                table.row = []
+            table.row_has_header = table.row_has_header or tag == "th"
+            table.cell_start = len(self._parts)
+
+    def _end_table_tag(self, tag: str) -> None:
+        if not self._tables:
+            return
+        table = self._tables[-1]
+        if tag in {"td", "th"}:
+            self._end_cell(table)
+        elif tag == "tr":
+            self._end_row(table)
+        elif tag == "table":
+            self._end_row(table)
+            self._tables.pop()
+
+    def _end_cell(self, table: _Table) -> None:
+        if table.cell_start is None or table.row is None:
+            return
+        cell = _WHITESPACE.sub(" ", "".join(self._parts[table.cell_start :])).strip()
+        del self._parts[table.cell_start :]
+        table.cell_start = None
+        table.row.append(cell)
+
+    def _end_row(self, table: _Table) -> None:
+        self._end_cell(table)
+        if table.row is None:
+            return
+        row = table.row
+        table.row = None
+        if not row:
+            return
+        if table.rows_emitted == 0:
+            # Markdown tables need a header; a table without one gets an empty header row.
+            header = row if table.row_has_header else ["" for _ in row]
+            self._emit_row(header)
+            self._emit_row(["---" for _ in row])
+            if not table.row_has_header:
+                self._emit_row(row)
+        else:
+            self._emit_row(row)
+        table.rows_emitted += 1
+
+    def _emit_row(self, row: list[str]) -> None:
+        self._lines.append(f"{self._prefix()}| {' | '.join(row)} |")
+
+
+def _int_attr(attrs: list[tuple[str, str | None]], name: str, default: int) -> int:
+    for key, value in attrs:
+        if key == name and value is not None and value.strip().lstrip("-").isdigit():
+            return int(value)
+    return default
+
+
+def convert_html(html: str) -> str:
+    converter = MarkdownConverter()
+    converter.feed(html)
+    converter.close()
+    return converter.markdown()
+
+
+__all__ = ["MarkdownConverter", "convert_html"]
@@ -6,9 +6,12 @@ from collections.abc import Callable
 import httpx
 
 from kabigon.core.errors import LoaderContentError
+from kabigon.timing import TimingStage
+from kabigon.timing import timed
 
 from .html_extractors import extract_article_body_from_json_ld
 from .html_extractors import extract_first_tag_subtree
+from .http_client import borrow_http_client
 from .utils import html_to_markdown
 
 logger = logging.getLogger(__name__)
@@ -38,15 +41,18 @@ async def load_news_article(
     loader_name: str,
     validate_url: Callable[[str], object],
     headers: dict[str, str],
+    client: httpx.AsyncClient | None = None,
 ) -> str:
     validate_url(url)
     logger.info("[%s] Processing URL: %s", loader_name, url)
 
     try:
         logger.info("[%s] Fetching article HTML", loader_name)
-        async with httpx.AsyncClient() as client:
-            response = await client.get(url, headers=headers, follow_redirects=True)
-            response.raise_for_status()
+        async with borrow_http_client(client) as http_client:
+            with timed(TimingStage.FETCH) as span:
+                response = await http_client.get(url, headers=headers, follow_redirects=True)
+                span.record(bytes_out=response.text)
+                response.raise_for_status()
     except httpx.HTTPError as e:
         logger.warning("[%s] HTTP error: %s", loader_name, e)
         raise LoaderContentError(loader_name, url, f"HTTP request failed: {e}") from e
@@ -1,5 +1,11 @@
 import io
 import logging
+import math
+import os
+import shutil
+import tempfile
+from collections.abc import Generator
+from contextlib import contextmanager
 from pathlib import Path
 from typing import IO
 from typing import Any
@@ -10,8 +16,14 @@ from pypdf import PdfReader
 from kabigon.core.errors import LoaderContentError
 from kabigon.core.errors import LoaderNotApplicableError
 from kabigon.core.loader import Loader
+from kabigon.executors import process_pool
+from kabigon.executors import run_cpu
 from kabigon.sources.applicability import parse_pdf_target
 from kabigon.sources.applicability import require_loader_applicability
+from kabigon.timing import TimingStage
+from kabigon.timing import timed
+
+from .http_client import borrow_http_client
 
 logger = logging.getLogger(__name__)
 
@@ -20,8 +32,34 @@ DEFAULT_HEADERS = {
     "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/129.0.0.0 Safari/537.36",  # noqa
 }
 
+# Below this many pages, shipping the document to worker processes costs more than it saves.
+PARALLEL_MIN_PAGES = 32
+# Pages per worker task; small enough to balance uneven pages, large enough to amortize re-parsing.
+MIN_PAGES_PER_TASK = 8
+
+# Remote PDFs are spooled in memory up to this size, then spill to a temporary file.
+SPOOL_MAX_MEMORY_BYTES = 8 * 1024 * 1024
+DEFAULT_MAX_PDF_BYTES = 256 * 1024 * 1024
+
 
 class PDFLoader(Loader):
+    def __init__(
+        self,
+        client: httpx.AsyncClient | None = None,
+        *,
+        pages: range | None = None,
+        max_pages: int | None = None,
+        max_bytes: int = DEFAULT_MAX_PDF_BYTES,
+    ) -> None:
+        self.client = client
+        self.pages = pages
+        self.max_pages = max_pages
+        self.max_bytes = max_bytes
+
+    async def _read(self, f: str | Path | IO[Any]) -> str:
+        # Extraction is CPU-bound; keep it off the event loop.
+        return await run_cpu(read_pdf_content, f, pages=self.pages, max_pages=self.max_pages)
+
     async def load(self, url_or_file: str) -> str:  # ty:ignore[invalid-method-override]
         logger.info("[PDFLoader] Processing URL or file: %s", url_or_file)
         require_loader_applicability("PDFLoader", url_or_file, parse_pdf_target)
@@ -31,7 +69,7 @@ class PDFLoader(Loader):
             logger.info("[PDFLoader] Reading local PDF file")
             logger.debug("[PDFLoader] Local PDF path: %s", url_or_file)
             try:
-                result = read_pdf_content(url_or_file)
+                result = await self._read(url_or_file)
             except Exception as e:
                 logger.warning("[PDFLoader] Failed to read local PDF: %s", e)
                 raise LoaderContentError(
@@ -46,25 +84,11 @@ class PDFLoader(Loader):
 
         # Remote URL
         logger.info("[PDFLoader] Fetching remote PDF")
-        async with httpx.AsyncClient() as client:
-            try:
-                resp = await client.get(url_or_file, headers=DEFAULT_HEADERS, follow_redirects=True)
-                resp.raise_for_status()
-            except httpx.HTTPError as e:
-                logger.warning("[PDFLoader] HTTP error: %s", e)
-                raise LoaderContentError(
-                    "PDFLoader", url_or_file, f"HTTP error: {e}", "Check that the URL is accessible and valid."
-                ) from e
-
-            content_type = resp.headers.get("content-type", "")
-            if "application/pdf" not in content_type:
-                logger.debug("[PDFLoader] Not a PDF (content-type: %s)", content_type)
-                raise LoaderNotApplicableError(
-                    "PDFLoader", url_or_file, f"Not a PDF file (content-type: {content_type})"
-                )
-
+        with tempfile.SpooledTemporaryFile(max_size=SPOOL_MAX_MEMORY_BYTES) as spooled:
+            with timed(TimingStage.FETCH) as span:
+                span.record(bytes_out=await self._download(url_or_file, spooled))
             try:
-                result = read_pdf_content(io.BytesIO(resp.content))
+                result = await self._read(spooled)
             except Exception as e:
                 logger.warning("[PDFLoader] Failed to parse PDF: %s", e)
                 raise LoaderContentError(
@@ -77,14 +101,128 @@ class PDFLoader(Loader):
                 logger.info("[PDFLoader] Loaded remote PDF content (%s chars)", len(result))
                 return result
 
+    async def _download(self, url: str, spooled: IO[bytes]) -> int:
+        """Stream the PDF body into ``spooled``, rejecting non-PDFs and oversized bodies from headers first.
+
+        Returns the number of bytes received.
+        """
+        received = 0
+        async with borrow_http_client(self.client) as client:
+            try:
+                async with client.stream("GET", url, headers=DEFAULT_HEADERS, follow_redirects=True) as resp:
+                    resp.raise_for_status()
+
+                    content_type = resp.headers.get("content-type", "")
+                    if "application/pdf" not in content_type:
+                        logger.debug("[PDFLoader] Not a PDF (content-type: %s)", content_type)
+                        raise LoaderNotApplicableError(
+                            "PDFLoader", url, f"Not a PDF file (content-type: {content_type})"
+                        )
+
+                    content_length = resp.headers.get("content-length", "")
+                    if content_length.isdigit():
+                        self._check_size(url, int(content_length))
+
+                    async for chunk in resp.aiter_bytes():
+                        received += len(chunk)
+                        self._check_size(url, received)
+                        spooled.write(chunk)
+            except httpx.HTTPError as e:
+                logger.warning("[PDFLoader] HTTP error: %s", e)
+                raise LoaderContentError(
+                    "PDFLoader", url, f"HTTP error: {e}", "Check that the URL is accessible and valid."
+                ) from e
+
+        logger.debug("[PDFLoader] Downloaded %s bytes", received)
+        spooled.seek(0)
+        return received
+
+    def _check_size(self, url: str, size: int) -> None:
+        if size > self.max_bytes:
+            raise LoaderContentError(
+                "PDFLoader",
+                url,
+                f"PDF exceeds size limit ({size} bytes > {self.max_bytes})",
+                "Pass a larger max_bytes to PDFLoader to load bigger documents.",
+            )
+
+
+def _clean_lines(text: str) -> list[str]:
+    return [stripped for line in text.splitlines() if (stripped := line.strip())]
+
+
+def _extract_page_range(source: str | bytes, start: int, stop: int) -> list[str]:
+    f = io.BytesIO(source) if isinstance(source, bytes) else source
+    with PdfReader(f) as reader:
+        lines: list[str] = []
+        for index in range(start, stop):
+            lines.extend(_clean_lines(reader.pages[index].extract_text(extraction_mode="plain")))
+    return lines
+
+
+def _select_pages(page_count: int, pages: range | None, max_pages: int | None) -> range:
+    selected = range(page_count)[pages.start : pages.stop : pages.step] if pages is not None else range(page_count)
+    if max_pages is not None:
+        selected = selected[:max_pages]
+    return selected
 
-def read_pdf_content(f: str | Path | IO[Any]) -> str:
-    lines = []
+
+def _page_chunks(selected: range, workers: int) -> list[tuple[int, int]]:
+    size = max(MIN_PAGES_PER_TASK, math.ceil(len(selected) / (workers * 2)))
+    return [(start, min(start + size, selected.stop)) for start in range(selected.start, selected.stop, size)]
+
+
+def read_pdf_content(
+    f: str | Path | IO[Any],
+    *,
+    pages: range | None = None,
+    max_pages: int | None = None,
+    parallel: bool = True,
+) -> str:
+    """Extract plain text from a PDF, one stripped non-empty line per line.
+
+    ``pages`` selects 0-based page indexes (a contiguous ``range``) and
+    ``max_pages`` caps how many of them are read. Large documents are split
+    into page ranges that are extracted across a process pool and reassembled
+    in order unless ``parallel`` is false.
+    """
     with PdfReader(f) as reader:
-        for page in reader.pages:
-            text = page.extract_text(extraction_mode="plain")
-            for line in text.splitlines():
-                stripped = line.strip()
-                if stripped:
-                    lines.append(stripped)
-    return "\n".join(lines)
+        selected = _select_pages(len(reader.pages), pages, max_pages)
+        workers = os.cpu_count() or 1
+        if not parallel or workers == 1 or selected.step != 1 or len(selected) < PARALLEL_MIN_PAGES:
+            lines: list[str] = []
+            for index in selected:
+                lines.extend(_clean_lines(reader.pages[index].extract_text(extraction_mode="plain")))
+            return "\n".join(lines)
+
+    chunks = _page_chunks(selected, workers)
+    logger.debug("[PDFLoader] Extracting %s pages in %s chunks", len(selected), len(chunks))
+    executor = process_pool()
+    with _worker_source(f) as source:
+        futures = [executor.submit(_extract_page_range, source, start, stop) for start, stop in chunks]
+        return "\n".join(line for future in futures for line in future.result())
+
+
+@contextmanager
+def _worker_source(f: str | Path | IO[Any]) -> Generator[str | bytes]:
+    """Yield something worker processes can re-open: a path, or the bytes of a small stream.
+
+    Large streams (such as a spooled download that already spilled to disk) are
+    copied to a named temporary file so each worker does not receive its own
+    in-memory copy of the whole document.
+    """
+    if isinstance(f, str | Path):
+        yield str(f)
+        return
+
+    f.seek(0, os.SEEK_END)
+    size = f.tell()
+    f.seek(0)
+    if size <= SPOOL_MAX_MEMORY_BYTES:
+        yield f.read()
+        return
+
+    with tempfile.NamedTemporaryFile(suffix=".pdf") as named:
+        shutil.copyfileobj(f, named)
+        named.flush()
+        yield named.name
@@ -5,7 +5,7 @@ from kabigon.core.loader import Loader
 
 from .browser import fetch_browser_html
 from .content_guard import ensure_usable_content
-from .utils import html_to_markdown
+from .utils import html_to_markdown_async
 
 logger = logging.getLogger(__name__)
 
@@ -41,7 +41,7 @@ class PlaywrightLoader(Loader):
             browser_headless=self.browser_headless,
         )
         logger.debug("[PlaywrightLoader] Loaded browser page")
-        result = html_to_markdown(content)
+        result = await html_to_markdown_async(content)
         logger.info("[PlaywrightLoader] Extracted browser page content (%s chars)", len(result))
         ensure_usable_content(result, loader_name="PlaywrightLoader", url=url)
         return result
@@ -1,4 +1,9 @@
+import asyncio
 import logging
+from collections.abc import Callable
+from collections.abc import Coroutine
+from collections.abc import Iterable
+from enum import StrEnum
 from typing import Any
 from typing import cast
 from urllib.parse import ParseResult
@@ -15,11 +20,30 @@ from kabigon.sources.applicability import parse_reddit_target
 
 from .browser import DEFAULT_BROWSER_USER_AGENT
 from .browser import fetch_browser_html
+from .http_client import borrow_http_client
 from .utils import html_to_markdown
 
 logger = logging.getLogger(__name__)
 USER_AGENT = DEFAULT_BROWSER_USER_AGENT
 REDDIT_SHORT_HOSTS = {"redd.it", "www.redd.it"}
+_NO_STRATEGIES = "RedditLoader needs at least one strategy."
+
+
+class RedditStrategy(StrEnum):
+    RSS = "rss"
+    JSON = "json"
+    OLD_REDDIT = "old_reddit"
+
+
+DEFAULT_REDDIT_STRATEGIES: tuple[RedditStrategy, ...] = (
+    RedditStrategy.RSS,
+    RedditStrategy.JSON,
+    RedditStrategy.OLD_REDDIT,
+)
+# Endpoints that can run side by side, richest result first: JSON carries the full comment tree.
+_FEED_STRATEGIES: tuple[RedditStrategy, ...] = (RedditStrategy.JSON, RedditStrategy.RSS)
+# Seconds a successful feed waits for a richer one that is still in flight.
+_FEED_GRACE_PERIOD = 1.0
 
 
 def _reddit_endpoint_path(parsed: ParseResult) -> str:
@@ -195,16 +219,35 @@ def _rss_to_markdown(xml_text: str, source_url: str) -> str:
 class RedditLoader(Loader):
     """Loader for Reddit posts and comments.
 
-    Prefers Reddit's Atom/RSS feed, then falls back to JSON and old.reddit.com browser extraction.
+    Tries ``strategies`` in order: Reddit's Atom/RSS feed, the JSON endpoint, and
+    old.reddit.com browser extraction by default. With ``concurrent=True`` the
+    RSS and JSON requests run together: a JSON success is returned at once, and
+    an RSS success is returned once JSON has failed or after a short grace
+    period, cancelling the JSON request; the browser only runs once both have
+    failed.
     """
 
-    def __init__(self, timeout: float = 30_000) -> None:
+    def __init__(
+        self,
+        timeout: float = 30_000,
+        client: httpx.AsyncClient | None = None,
+        strategies: Iterable[RedditStrategy | str] = DEFAULT_REDDIT_STRATEGIES,
+        concurrent: bool = False,
+    ) -> None:
         """Initialize RedditLoader.
 
         Args:
             timeout: Timeout in milliseconds for page loading (default: 30 seconds)
+            client: Shared HTTP client for the RSS and JSON endpoints
+            strategies: Strategies to run, in order of preference
+            concurrent: Run the RSS and JSON strategies at the same time
         """
         self.timeout = timeout
+        self.client = client
+        self.strategies = tuple(dict.fromkeys(RedditStrategy(strategy) for strategy in strategies))
+        if not self.strategies:
+            raise ValueError(_NO_STRATEGIES)
+        self.concurrent = concurrent
 
     async def _load_via_json(self, url: str) -> str:
         api_url = to_reddit_json_url(url)
@@ -217,8 +260,8 @@ class RedditLoader(Loader):
         try:
             logger.info("[RedditLoader] Fetching Reddit JSON endpoint")
             logger.debug("[RedditLoader] Reddit JSON URL: %s", api_url)
-            async with httpx.AsyncClient(timeout=timeout_seconds, follow_redirects=True) as client:
-                response = await client.get(api_url, headers=headers)
+            async with borrow_http_client(self.client) as client:
+                response = await client.get(api_url, headers=headers, timeout=timeout_seconds, follow_redirects=True)
                 response.raise_for_status()
                 payload = response.json()
         except httpx.TimeoutException as e:
@@ -252,8 +295,8 @@ class RedditLoader(Loader):
         try:
             logger.info("[RedditLoader] Fetching Reddit RSS endpoint")
             logger.debug("[RedditLoader] Reddit RSS URL: %s", rss_url)
-            async with httpx.AsyncClient(timeout=timeout_seconds, follow_redirects=True) as client:
-                response = await client.get(rss_url)
+            async with borrow_http_client(self.client) as client:
+                response = await client.get(rss_url, timeout=timeout_seconds, follow_redirects=True)
                 response.raise_for_status()
         except httpx.TimeoutException as e:
             raise LoaderTimeoutError(
@@ -288,6 +331,61 @@ class RedditLoader(Loader):
         logger.debug("[RedditLoader] Loaded old Reddit browser page")
         return html_to_markdown(content)
 
+    def _strategy_loader(self, strategy: RedditStrategy) -> Callable[[str], Coroutine[None, None, str]]:
+        return {
+            RedditStrategy.RSS: self._load_via_rss,
+            RedditStrategy.JSON: self._load_via_json,
+            RedditStrategy.OLD_REDDIT: self._load_via_old_reddit,
+        }[strategy]
+
+    async def _load_feeds_concurrently(self, url: str, feeds: list[RedditStrategy]) -> str:
+        tasks = {asyncio.create_task(self._strategy_loader(strategy)(url)): strategy for strategy in feeds}
+        results: dict[RedditStrategy, str] = {}
+        errors: dict[RedditStrategy, LoaderContentError | LoaderTimeoutError] = {}
+        pending = set(tasks)
+        loop = asyncio.get_running_loop()
+        deadline: float | None = None
+        try:
+            while pending:
+                timeout = None if deadline is None else max(0.0, deadline - loop.time())
+                done, pending = await asyncio.wait(pending, timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    strategy = tasks[task]
+                    try:
+                        results[strategy] = task.result()
+                    except (LoaderContentError, LoaderTimeoutError) as e:
+                        logger.warning("[RedditLoader] %s strategy failed: %s", strategy, e)
+                        errors[strategy] = e
+
+                # Take the richest result once every richer feed has failed; a
+                # poorer result only waits out the grace period for the rest.
+                running = {tasks[task] for task in pending}
+                ready = [strategy for strategy in feeds if strategy in results]
+                richer_running = ready and any(strategy in running for strategy in feeds[: feeds.index(ready[0])])
+                if ready and (not richer_running or not done):
+                    logger.info("[RedditLoader] Extracted content via %s (%s chars)", ready[0], len(results[ready[0]]))
+                    return results[ready[0]]
+                if ready and deadline is None:
+                    deadline = loop.time() + _FEED_GRACE_PERIOD
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+        raise errors[feeds[-1]]
+
+    async def _load_in_order(self, url: str, strategies: Iterable[RedditStrategy]) -> str:
+        errors: list[LoaderContentError | LoaderTimeoutError] = []
+        for strategy in strategies:
+            try:
+                result = await self._strategy_loader(strategy)(url)
+            except (LoaderContentError, LoaderTimeoutError) as e:
+                logger.warning("[RedditLoader] %s strategy failed: %s", strategy, e)
+                errors.append(e)
+                continue
+            logger.info("[RedditLoader] Extracted content via %s (%s chars)", strategy, len(result))
+            return result
+        raise errors[-1]
+
     async def load(self, url: str) -> str:
         """Asynchronously load Reddit content from URL.
 
@@ -303,22 +401,25 @@ class RedditLoader(Loader):
         """
         logger.info("[RedditLoader] Processing URL: %s", url)
         parse_reddit_target(url)
+
+        feeds = [strategy for strategy in _FEED_STRATEGIES if strategy in self.strategies]
+        if not self.concurrent or len(feeds) < 2:
+            return await self._load_in_order(url, self.strategies)
+
         try:
-            result = await self._load_via_rss(url)
-        except (LoaderContentError, LoaderTimeoutError) as rss_error:
-            logger.warning("[RedditLoader] RSS endpoint failed, trying JSON fallback: %s", rss_error)
-            try:
-                result = await self._load_via_json(url)
-            except (LoaderContentError, LoaderTimeoutError) as json_error:
-                logger.warning("[RedditLoader] JSON fallback failed, falling back to old Reddit: %s", json_error)
-                result = await self._load_via_old_reddit(url)
-                logger.info(
-                    "[RedditLoader] Extracted content from old Reddit fallback (%s chars)",
-                    len(result),
-                )
-                return result
-            logger.info("[RedditLoader] Extracted content from JSON fallback (%s chars)", len(result))
-            return result
-        else:
-            logger.info("[RedditLoader] Extracted content from RSS endpoint (%s chars)", len(result))
-            return result
+            return await self._load_feeds_concurrently(url, feeds)
+        except (LoaderContentError, LoaderTimeoutError):
+            remaining = [strategy for strategy in self.strategies if strategy not in feeds]
+            if not remaining:
+                raise
+            return await self._load_in_order(url, remaining)
+
+
+__all__ = [
+    "DEFAULT_REDDIT_STRATEGIES",
+    "RedditLoader",
+    "RedditStrategy",
+    "convert_to_old_reddit",
+    "to_reddit_json_url",
+    "to_reddit_rss_url",
+]
@@ -1,6 +1,9 @@
+import asyncio
+import functools
 import logging
 from collections.abc import Callable
 
+from kabigon.core.errors import LoaderError
 from kabigon.core.loader import Loader
 from kabigon.sources.applicability import parse_reel_target
 
@@ -12,24 +15,70 @@ type LoaderFactory = Callable[[], Loader]
 logger = logging.getLogger(__name__)
 
 
+# Both sub-loaders keep no per-call state, so every ReelLoader shares one instance of each.
+@functools.cache
+def shared_ytdlp_loader() -> Loader:
+    return YtdlpLoader()
+
+
+@functools.cache
+def shared_httpx_loader() -> Loader:
+    return HttpxLoader()
+
+
 class ReelLoader(Loader):
+    """Combine the audio transcript and page text of a reel.
+
+    The transcription and the HTML fetch run concurrently. If one of them
+    fails, the other is returned on its own; only when both fail is the reel
+    reported as failed.
+    """
+
     def __init__(
         self,
-        ytdlp_loader_factory: LoaderFactory = YtdlpLoader,
-        httpx_loader_factory: LoaderFactory = HttpxLoader,
+        ytdlp_loader_factory: LoaderFactory = shared_ytdlp_loader,
+        httpx_loader_factory: LoaderFactory = shared_httpx_loader,
     ) -> None:
         self.ytdlp_loader_factory = ytdlp_loader_factory
         self.httpx_loader_factory = httpx_loader_factory
+        self._loaders: dict[str, Loader] = {}
+
+    def _loader(self, part: str, factory: LoaderFactory) -> Loader:
+        # Built on first use so an inapplicable URL never constructs Whisper.
+        loader = self._loaders.get(part)
+        if loader is None:
+            loader = self._loaders[part] = factory()
+        return loader
+
+    async def _load_part(self, part: str, factory: LoaderFactory, url: str) -> str:
+        logger.info("[ReelLoader] Loading %s", part)
+        return await self._loader(part, factory).load(url)
 
     async def load(self, url: str) -> str:
         logger.info("[ReelLoader] Processing URL: %s", url)
         parse_reel_target(url)
 
-        logger.info("[ReelLoader] Loading audio with YtdlpLoader")
-        audio_content = await self.ytdlp_loader_factory().load(url)
-        logger.info("[ReelLoader] Loading HTML with HttpxLoader")
-        html_content = await self.httpx_loader_factory().load(url)
+        parts = ("audio", "html")
+        results = await asyncio.gather(
+            self._load_part("audio", self.ytdlp_loader_factory, url),
+            self._load_part("html", self.httpx_loader_factory, url),
+            return_exceptions=True,
+        )
+
+        contents: list[str] = []
+        errors: list[str] = []
+        for part, result in zip(parts, results, strict=True):
+            if isinstance(result, Exception):
+                logger.warning("[ReelLoader] Failed to load %s: %s: %s", part, type(result).__name__, result)
+                errors.append(f"{part}: {type(result).__name__}: {result!s}")
+            elif isinstance(result, BaseException):
+                raise result
+            elif result:
+                contents.append(result)
+
+        if errors and not contents:
+            raise LoaderError(url, errors)
 
-        result = f"{audio_content}\n\n{html_content}"
+        result = "\n\n".join(contents)
         logger.info("[ReelLoader] Extracted combined reel content (%s chars)", len(result))
         return result
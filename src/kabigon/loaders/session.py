@@ -0,0 +1,33 @@
+"""Loader session: the long-lived resources loaders share while it is open.
+
+A Load chain opens a session around its attempts and a batch opens one around
+all of its URLs. Sessions nest, so the outermost one decides how long the
+shared resources live.
+"""
+
+from __future__ import annotations
+
+from collections.abc import AsyncGenerator
+from contextlib import AsyncExitStack
+from contextlib import asynccontextmanager
+
+from .browser import browser_pool_session
+from .curl_session import curl_session_pool_session
+from .http_client import http_client_session
+
+
+@asynccontextmanager
+async def loader_session() -> AsyncGenerator[None]:
+    """Keep the pooled HTTP clients, curl sessions and Chromium browsers open inside the block.
+
+    ``load_url`` calls made inside the block reuse them instead of starting
+    their own, e.g. one Chromium launch for many browser-loaded URLs.
+    """
+    async with AsyncExitStack() as stack:
+        await stack.enter_async_context(http_client_session())
+        await stack.enter_async_context(curl_session_pool_session())
+        await stack.enter_async_context(browser_pool_session())
+        yield
+
+
+__all__ = ["loader_session"]
@@ -0,0 +1,98 @@
+"""On-disk store for YouTube transcripts.
+
+Captions and Whisper output never change for a given video, so both are kept
+on disk keyed by video ID, transcript source, and variant (the caption
+language preferences or the Whisper model). Keys use the parsed video ID, so
+``youtu.be``, ``m.youtube.com``, and ``music.youtube.com`` links to one video
+share an entry. Files are sharded by key digest and written atomically, which
+makes one store safe to share between processes.
+
+The store is off unless a loader is given one, ``configure_transcript_store``
+sets a default, or ``KABIGON_TRANSCRIPT_DIR`` names a directory.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+import tempfile
+from enum import StrEnum
+from pathlib import Path
+
+from kabigon.sources.applicability import NoVideoIDFoundError
+from kabigon.sources.applicability import UnsupportedURLNetlocError
+from kabigon.sources.applicability import UnsupportedURLSchemeError
+from kabigon.sources.applicability import VideoIDError
+from kabigon.sources.applicability import parse_youtube_video_target
+
+TRANSCRIPT_DIR_ENV = "KABIGON_TRANSCRIPT_DIR"
+
+logger = logging.getLogger(__name__)
+
+
+class TranscriptSource(StrEnum):
+    CAPTIONS = "captions"
+    WHISPER = "whisper"
+
+
+class TranscriptStore:
+    """Transcripts under ``root``, one file per video, source, and variant."""
+
+    def __init__(self, root: str | Path) -> None:
+        self.root = Path(root).expanduser()
+
+    def path_for(self, video_id: str, source: TranscriptSource, variant: str) -> Path:
+        # Video IDs are case-sensitive; hex digests keep them apart on
+        # case-insensitive filesystems too.
+        digest = hashlib.sha256(f"{video_id}\0{source}\0{variant}".encode()).hexdigest()
+        return self.root / digest[:2] / f"{digest[2:]}.txt"
+
+    def get(self, video_id: str, source: TranscriptSource, variant: str) -> str | None:
+        try:
+            return self.path_for(video_id, source, variant).read_text(encoding="utf-8")
+        except FileNotFoundError:
+            return None
+
+    def put(self, video_id: str, source: TranscriptSource, variant: str, text: str) -> None:
+        path = self.path_for(video_id, source, variant)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with tempfile.NamedTemporaryFile(
+            "w", encoding="utf-8", dir=path.parent, prefix=".tmp-", suffix=".txt", delete=False
+        ) as f:
+            f.write(text)
+        Path(f.name).replace(path)
+
+
+_default_store: TranscriptStore | None = None
+
+
+def configure_transcript_store(store: TranscriptStore | str | Path | None) -> None:
+    """Set the store used by loaders that were not given one; ``None`` unsets it."""
+    global _default_store
+    _default_store = store if store is None or isinstance(store, TranscriptStore) else TranscriptStore(store)
+
+
+def default_transcript_store() -> TranscriptStore | None:
+    if _default_store is not None:
+        return _default_store
+    root = os.getenv(TRANSCRIPT_DIR_ENV)
+    return TranscriptStore(root) if root else None
+
+
+def youtube_video_id(url: str) -> str | None:
+    """Return the video ID of a YouTube video URL, or ``None`` for other URLs."""
+    try:
+        return parse_youtube_video_target(url).video_id
+    except (UnsupportedURLSchemeError, UnsupportedURLNetlocError, NoVideoIDFoundError, VideoIDError):
+        return None
+
+
+__all__ = [
+    "TRANSCRIPT_DIR_ENV",
+    "TranscriptSource",
+    "TranscriptStore",
+    "configure_transcript_store",
+    "default_transcript_store",
+    "youtube_video_id",
+]
@@ -1,5 +1,33 @@
+import codecs
+import re
+
 import charset_normalizer
-from markdownify import markdownify
+
+from kabigon.executors import run_cpu
+from kabigon.timing import TimingStage
+from kabigon.timing import timed
+
+from .markdown import MarkdownConverter
+
+# Bytes are decoded and parsed in slices of this size, so the decoded document
+# never exists as one string next to the raw payload.
+DECODE_CHUNK_SIZE = 64 * 1024
+# How much of the payload statistical charset detection looks at first.
+DETECTION_SAMPLE_SIZE = 64 * 1024
+# Documents at least this large are converted in the CPU executor instead of on the event loop.
+OFFLOAD_MIN_BYTES = 256 * 1024
+# How far into the document a ``<meta charset>`` declaration is looked for.
+SNIFF_SIZE = 4 * 1024
+
+_BOMS = (
+    (codecs.BOM_UTF8, "utf-8-sig"),
+    (codecs.BOM_UTF32_LE, "utf-32"),
+    (codecs.BOM_UTF32_BE, "utf-32"),
+    (codecs.BOM_UTF16_LE, "utf-16"),
+    (codecs.BOM_UTF16_BE, "utf-16"),
+)
+_NON_ASCII = re.compile(rb"[\x80-\xff]")
+_META_CHARSET = re.compile(rb"""<meta[^>]+?charset\s*=\s*["']?\s*([\w.:-]+)""", re.IGNORECASE)
 
 
 def normalize_whitespace(text: str) -> str:
@@ -11,17 +39,125 @@ def normalize_whitespace(text: str) -> str:
     return "\n".join(lines)
 
 
-def html_to_markdown(content: str | bytes) -> str:
+def html_to_markdown(content: str | bytes, *, encoding: str | None = None) -> str:
     """Convert HTML content to markdown format.
 
     Args:
         content: HTML content as string or bytes
+        encoding: Charset declared for ``content`` bytes, e.g. by the
+            ``Content-Type`` header; tried before sniffing the document
 
     Returns:
         Converted markdown text with normalized whitespace
     """
-    if isinstance(content, bytes):
-        content = str(charset_normalizer.from_bytes(content).best())
+    with timed(TimingStage.CONVERT) as span:
+        span.record(bytes_in=content)
+        if isinstance(content, bytes):
+            result = _bytes_to_markdown(content, encoding)
+        else:
+            converter = MarkdownConverter()
+            converter.feed(content)
+            converter.close()
+            result = converter.markdown()
+        span.record(bytes_out=result)
+    return result
+
+
+async def html_to_markdown_async(content: str | bytes, *, encoding: str | None = None) -> str:
+    """Like ``html_to_markdown``, but converts large documents off the event loop."""
+    if len(content) < OFFLOAD_MIN_BYTES:
+        return html_to_markdown(content, encoding=encoding)
+    return await run_cpu(html_to_markdown, content, encoding=encoding)
+
+
+def _bytes_to_markdown(content: bytes, declared: str | None) -> str:
+    for candidate in _candidate_encodings(content, declared):
+        try:
+            return _decode_to_markdown(content, candidate, errors="strict")
+        except UnicodeDecodeError:
+            continue
+    return _decode_to_markdown(content, _detect_encoding(content), errors="replace")
+
+
+def _decode_to_markdown(content: bytes, encoding: str, *, errors: str) -> str:
+    converter = MarkdownConverter()
+    decoder = codecs.getincrementaldecoder(encoding)(errors=errors)
+    view = memoryview(content)
+    for start in range(0, len(view), DECODE_CHUNK_SIZE):
+        converter.feed(decoder.decode(view[start : start + DECODE_CHUNK_SIZE]))
+    converter.feed(decoder.decode(b"", final=True))
+    converter.close()
+    return converter.markdown()
+
+
+def _candidate_encodings(content: bytes, declared: str | None = None) -> list[str]:
+    """Encodings worth a strict decode before falling back to statistical detection.
+
+    Follows the HTML precedence: a byte order mark, then the declared charset,
+    then a ``<meta charset>`` in the first few KB, and finally UTF-8.
+    """
+    for bom, name in _BOMS:
+        if content.startswith(bom):
+            return [name]
+
+    candidates: list[str] = []
+    for name in (_codec_name(declared), _meta_charset(content), "utf-8"):
+        if name is not None and name not in candidates:
+            candidates.append(name)
+    return candidates
+
+
+def _meta_charset(content: bytes) -> str | None:
+    match = _META_CHARSET.search(content, 0, SNIFF_SIZE)
+    if match is None:
+        return None
+    name = _codec_name(match.group(1).decode("ascii"))
+    if name is not None and name.startswith(("utf-16", "utf-32")):
+        # The tag itself was readable as ASCII, so the page cannot be UTF-16/32.
+        return "utf-8"
+    return name
+
+
+def _codec_name(label: str | None) -> str | None:
+    if not label:
+        return None
+    try:
+        return codecs.lookup(label.strip()).name
+    except LookupError:
+        return None
+
+
+def _detect_encoding(content: bytes) -> str:
+    """Guess the charset from a sample, or from the whole payload if the sample is not conclusive.
+
+    A large inline script or style can make the sample pure ASCII, and a
+    sampled guess can still fail further in; both fall back to full detection.
+    """
+    if len(content) > DETECTION_SAMPLE_SIZE:
+        guess = _best_encoding(content[:DETECTION_SAMPLE_SIZE])
+        if guess is not None and _decodes(content, guess):
+            return guess
+    # Skip the ASCII head, which reads the same in every candidate charset but
+    # would otherwise make up most of what the detector samples.
+    first = _NON_ASCII.search(content)
+    # UTF-8 is a superset of an ASCII guess.
+    return _best_encoding(content[first.start() :] if first else content) or "utf-8"
+
+
+def _best_encoding(content: bytes) -> str | None:
+    best = charset_normalizer.from_bytes(content).best()
+    if best is None or best.encoding == "ascii":
+        return None
+    return best.encoding
+
 
-    md = markdownify(content, strip=["a", "img"])
-    return normalize_whitespace(md)
+def _decodes(content: bytes, encoding: str) -> bool:
+    decoder = codecs.getincrementaldecoder(encoding)()
+    view = memoryview(content)
+    try:
+        for start in range(0, len(view), DECODE_CHUNK_SIZE):
+            decoder.decode(view[start : start + DECODE_CHUNK_SIZE])
+        decoder.decode(b"", final=True)
+    except UnicodeDecodeError:
+        return False
+    return True
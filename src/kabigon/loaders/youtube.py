@@ -1,13 +1,17 @@
-import asyncio
 import logging
 
 from youtube_transcript_api import YouTubeTranscriptApi
 
 from kabigon.core.errors import LoaderContentError
 from kabigon.core.loader import Loader
+from kabigon.executors import run_io
 from kabigon.sources.applicability import parse_youtube_video_target
 from kabigon.sources.applicability import require_loader_applicability
 
+from .transcript_store import TranscriptSource
+from .transcript_store import TranscriptStore
+from .transcript_store import default_transcript_store
+
 logger = logging.getLogger(__name__)
 
 DEFAULT_LANGUAGES = [
@@ -76,8 +80,9 @@ def parse_video_id(url: str) -> str:
 
 
 class YoutubeLoader(Loader):
-    def __init__(self, languages: list[str] | None = None) -> None:
+    def __init__(self, languages: list[str] | None = None, store: TranscriptStore | None = None) -> None:
         self.languages = languages or DEFAULT_LANGUAGES
+        self.store = store
 
     def load_sync(self, url: str) -> str:
         logger.info("[YoutubeLoader] Processing URL: %s", url)
@@ -86,6 +91,14 @@ class YoutubeLoader(Loader):
 
         logger.debug("[YoutubeLoader] Extracted video ID: %s", video_id)
 
+        store = self.store or default_transcript_store()
+        variant = ",".join(self.languages)
+        if store is not None:
+            cached = store.get(video_id, TranscriptSource.CAPTIONS, variant)
+            if cached is not None:
+                logger.info("[YoutubeLoader] Using stored transcript for %s", video_id)
+                return cached
+
         try:
             logger.info("[YoutubeLoader] Fetching transcript")
             fetched = YouTubeTranscriptApi().fetch(video_id, self.languages)
@@ -113,7 +126,9 @@ class YoutubeLoader(Loader):
 
         logger.info("[YoutubeLoader] Extracted transcript content (%s chars)", len(result))
         logger.debug("[YoutubeLoader] Extracted %s transcript lines", len(lines))
+        if store is not None:
+            store.put(video_id, TranscriptSource.CAPTIONS, variant, result)
         return result
 
     async def load(self, url: str) -> str:
-        return await asyncio.to_thread(self.load_sync, url)
+        return await run_io(self.load_sync, url)
@@ -1,8 +1,8 @@
-import asyncio
 import logging
 from collections.abc import Callable
 
 from kabigon.core.loader import Loader
+from kabigon.executors import run_cpu
 from kabigon.sources.applicability import parse_youtube_video_target
 from kabigon.sources.applicability import require_loader_applicability
 
@@ -26,4 +26,4 @@ class YoutubeYtdlpLoader(Loader):
         return result
 
     async def load(self, url: str) -> str:
-        return await asyncio.to_thread(self.load_sync, url)
+        return await run_cpu(self.load_sync, url)
@@ -1,79 +1,438 @@
-import asyncio
-import contextlib
+import itertools
 import logging
+import multiprocessing
 import os
-import uuid
+import subprocess
+import sys
+import tempfile
+import threading
+from array import array
+from collections import OrderedDict
+from collections.abc import Iterable
+from concurrent.futures import Executor
+from concurrent.futures import ProcessPoolExecutor
+from enum import StrEnum
 from pathlib import Path
+from types import ModuleType
 from typing import Any
+from typing import Protocol
 from typing import cast
 
 import yt_dlp
 
+from kabigon.core.errors import LoaderContentError
 from kabigon.core.errors import WhisperNotInstalledError
 from kabigon.core.loader import Loader
+from kabigon.executors import run_cpu
+
+from .transcript_store import TranscriptSource
+from .transcript_store import TranscriptStore
+from .transcript_store import default_transcript_store
+from .transcript_store import youtube_video_id
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_WHISPER_MODEL = "tiny"
+DEFAULT_MAX_WHISPER_MODELS = 2
+SAMPLE_RATE = 16_000
+
+# Long audio is cut into chunks of about this length, each transcribed by a worker process.
+CHUNK_SECONDS = 300
+# How far either side of a chunk's nominal end to look for the quietest moment to cut at.
+SILENCE_SEARCH_SECONDS = 15
+# Audio shorter than this is transcribed in-process; splitting would not pay off.
+PARALLEL_MIN_SECONDS = 2 * CHUNK_SECONDS
+DEFAULT_WHISPER_WORKERS = max(1, min(4, (os.cpu_count() or 1) // 2))
+
+_FRAME_SAMPLES = SAMPLE_RATE * 30 // 1000
+# Loudness only needs a rough estimate; every 4th sample keeps the pure-Python scan fast.
+_ENERGY_STRIDE = 4
+
+
+class AudioMode(StrEnum):
+    """How ``YtdlpLoader`` turns a URL into PCM samples for Whisper.
+
+    ``STREAM`` lets ffmpeg read the best audio format straight from its media
+    URL and decode it in memory. ``SPILL`` downloads the original audio file
+    into a temporary directory first and decodes that. Neither re-encodes.
+    """
 
-def download_audio(url: str, outtmpl: str | None = None) -> None:
-    ydl_opts: dict[str, Any] = {
-        "format": "bestaudio/best",
-        "postprocessors": [
-            {
-                "key": "FFmpegExtractAudio",
-                "preferredcodec": "mp3",
-                "preferredquality": "192",
-            }
-        ],
-    }
+    STREAM = "stream"
+    SPILL = "spill"
 
-    if outtmpl is not None:
-        ydl_opts["outtmpl"] = outtmpl
 
+def _ytdlp_options() -> dict[str, Any]:
+    ydl_opts: dict[str, Any] = {"format": "bestaudio/best", "quiet": True, "noprogress": True}
     ffmpeg_path = os.getenv("FFMPEG_PATH")
     if ffmpeg_path is not None:
         ydl_opts["ffmpeg_location"] = ffmpeg_path
+    return ydl_opts
+
+
+def _ffmpeg_executable() -> str:
+    ffmpeg_path = os.getenv("FFMPEG_PATH")
+    if ffmpeg_path is None:
+        return "ffmpeg"
+    # yt-dlp accepts either the binary or its directory; support both.
+    path = Path(ffmpeg_path)
+    return str(path / "ffmpeg") if path.is_dir() else ffmpeg_path
+
+
+def download_audio(url: str, directory: str | Path) -> Path:
+    """Download the best audio format as-is into ``directory`` and return its path."""
+    ydl_opts = _ytdlp_options()
+    ydl_opts["outtmpl"] = str(Path(directory) / "audio.%(ext)s")
 
     logger.info("[YtdlpLoader] Downloading audio from URL: %s", url)
     logger.debug("[YtdlpLoader] yt-dlp options: %s", ydl_opts)
     with yt_dlp.YoutubeDL(cast(Any, ydl_opts)) as ydl:
-        ydl.download([url])
+        info = ydl.extract_info(url, download=True)
+        return Path(ydl.prepare_filename(info))
+
+
+def resolve_audio_stream(url: str) -> tuple[str, dict[str, str]]:
+    """Return the media URL of the best audio format and the headers needed to fetch it."""
+    with yt_dlp.YoutubeDL(cast(Any, _ytdlp_options())) as ydl:
+        info = ydl.extract_info(url, download=False)
+
+    media_url = info.get("url")
+    if not media_url:
+        raise LoaderContentError("YtdlpLoader", url, "yt-dlp returned no direct audio URL")
+    return media_url, dict(info.get("http_headers") or {})
+
+
+def decode_pcm(source: str, *, url: str, headers: dict[str, str] | None = None) -> bytes:
+    """Decode ``source`` (a file path or media URL) into 16 kHz mono s16le PCM.
+
+    ``url`` is the page being loaded and is only used for error reporting.
+    """
+    command = [_ffmpeg_executable(), "-nostdin", "-loglevel", "error"]
+    if headers:
+        command += ["-headers", "".join(f"{name}: {value}\r\n" for name, value in headers.items())]
+    command += ["-i", source, "-f", "s16le", "-ac", "1", "-acodec", "pcm_s16le", "-ar", str(SAMPLE_RATE), "-"]
+
+    try:
+        completed = subprocess.run(command, capture_output=True, check=True)
+    except FileNotFoundError as e:
+        raise LoaderContentError(
+            "YtdlpLoader",
+            url,
+            f"ffmpeg not found: {command[0]}",
+            "Install FFmpeg or point FFMPEG_PATH at the binary.",
+        ) from e
+    except subprocess.CalledProcessError as e:
+        message = e.stderr.decode("utf-8", errors="replace").strip()
+        raise LoaderContentError("YtdlpLoader", url, f"ffmpeg failed to decode audio: {message}") from e
+    return completed.stdout
+
+
+def pcm_to_audio(pcm: bytes) -> Any:  # noqa: ANN401
+    """Convert s16le PCM into the float32 array Whisper transcribes."""
+    import numpy as np
+
+    return np.frombuffer(pcm, np.int16).astype(np.float32) / 32768.0
+
+
+def _quietest_point(samples: array[int], lo: int, hi: int) -> int:
+    best = lo
+    best_energy: int | None = None
+    for start in range(lo, max(lo + 1, hi - _FRAME_SAMPLES), _FRAME_SAMPLES):
+        energy = sum(map(abs, samples[start : start + _FRAME_SAMPLES : _ENERGY_STRIDE]))
+        if best_energy is None or energy < best_energy:
+            best, best_energy = start + _FRAME_SAMPLES // 2, energy
+    return best
+
+
+def split_at_silence(
+    pcm: bytes,
+    *,
+    chunk_seconds: float = CHUNK_SECONDS,
+    search_seconds: float = SILENCE_SEARCH_SECONDS,
+) -> list[bytes]:
+    """Split s16le mono PCM into chunks of about ``chunk_seconds``, cutting at the quietest frame.
+
+    Each cut is placed within ``search_seconds`` of the chunk's nominal end, so
+    words are rarely split between chunks. The chunks concatenate back to ``pcm``.
+    """
+    samples = array("h")
+    samples.frombytes(pcm[: len(pcm) - len(pcm) % 2])
+    if sys.byteorder == "big":
+        samples.byteswap()
+
+    chunk = int(chunk_seconds * SAMPLE_RATE)
+    search = int(search_seconds * SAMPLE_RATE)
+    cuts = [0]
+    while len(samples) - cuts[-1] > chunk + search:
+        target = cuts[-1] + chunk
+        cuts.append(_quietest_point(samples, max(target - search, cuts[-1] + 1), target + search))
+    if len(cuts) == 1:
+        return [pcm]
+    cuts.append(len(pcm) // 2)
+    chunks = [pcm[2 * start : 2 * stop] for start, stop in itertools.pairwise(cuts)]
+    # A trailing odd byte is not a whole sample, but keep it so nothing is lost.
+    chunks[-1] += pcm[2 * cuts[-1] :]
+    return chunks
+
+
+class WhisperModel(Protocol):
+    def transcribe(self, audio: object) -> dict[str, Any]: ...
+
+
+class _SerializedModel:
+    """A cached model whose ``transcribe`` calls run one at a time.
+
+    Whisper installs kv-cache hooks on the model's decoder for every call, so
+    two transcriptions sharing one model in threads would corrupt each other.
+    """
+
+    def __init__(self, model: WhisperModel) -> None:
+        self.model = model
+        self._lock = threading.Lock()
+
+    def transcribe(self, audio: object) -> dict[str, Any]:
+        with self._lock:
+            return self.model.transcribe(audio)
+
+
+def _import_whisper() -> ModuleType:
+    try:
+        import whisper
+    except ImportError as e:
+        raise WhisperNotInstalledError from e
+    return whisper
+
+
+def _model_size(model: object) -> int:
+    parameters = getattr(model, "parameters", None)
+    if parameters is None:
+        return 0
+    return sum(parameter.numel() * parameter.element_size() for parameter in parameters())
+
+
+class WhisperModelCache:
+    """Process-wide LRU of loaded Whisper models keyed by model name.
+
+    Loading weights takes seconds even for ``tiny``, so every ``YtdlpLoader``
+    shares the models loaded here. The least-recently-used model is evicted once
+    more than ``max_models`` are loaded or their weights exceed ``max_bytes``;
+    the most recently used model is always kept. Each model transcribes one
+    audio at a time, since Whisper models are not safe to share across threads.
+    """
+
+    def __init__(self, max_models: int = DEFAULT_MAX_WHISPER_MODELS, max_bytes: int | None = None) -> None:
+        self.max_models = max_models
+        self.max_bytes = max_bytes
+        self._models: OrderedDict[str, tuple[WhisperModel, int]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._load_locks: dict[str, threading.Lock] = {}
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._models
+
+    def __len__(self) -> int:
+        return len(self._models)
+
+    def get(self, name: str) -> WhisperModel:
+        with self._lock:
+            cached = self._lookup(name)
+            if cached is not None:
+                return cached
+            load_lock = self._load_locks.setdefault(name, threading.Lock())
+
+        # Load outside the cache lock so other models stay available, but only once per name.
+        with load_lock:
+            with self._lock:
+                cached = self._lookup(name)
+            if cached is not None:
+                return cached
+
+            logger.info("[YtdlpLoader] Loading Whisper model: %s", name)
+            loaded = _import_whisper().load_model(name)
+            model = _SerializedModel(loaded)
+            with self._lock:
+                self._models[name] = (model, _model_size(loaded))
+                self._evict()
+            return model
+
+    def clear(self) -> None:
+        with self._lock:
+            self._models.clear()
+
+    def _lookup(self, name: str) -> WhisperModel | None:
+        stored = self._models.get(name)
+        if stored is None:
+            return None
+        self._models.move_to_end(name)
+        return stored[0]
+
+    def _evict(self) -> None:
+        while len(self._models) > 1 and (
+            len(self._models) > self.max_models
+            or (self.max_bytes is not None and sum(size for _, size in self._models.values()) > self.max_bytes)
+        ):
+            name, _ = self._models.popitem(last=False)
+            logger.info("[YtdlpLoader] Evicted Whisper model: %s", name)
+
+
+_model_cache = WhisperModelCache()
+
+
+def configure_whisper_cache(max_models: int = DEFAULT_MAX_WHISPER_MODELS, max_bytes: int | None = None) -> None:
+    """Replace the process-wide Whisper model cache, dropping loaded models."""
+    global _model_cache
+    _model_cache = WhisperModelCache(max_models=max_models, max_bytes=max_bytes)
+
+
+def load_whisper_model(name: str = DEFAULT_WHISPER_MODEL) -> WhisperModel:
+    return _model_cache.get(name)
+
+
+def _result_text(result: dict[str, Any]) -> str:
+    text = result.get("text", "")
+    if isinstance(text, str):
+        return text
+    return "\n".join(str(item) for item in text)
+
+
+def _init_whisper_worker(model: str, threads: int) -> None:
+    load_whisper_model(model)
+    # Whisper imports torch; keep the workers from oversubscribing the cores between them.
+    torch = sys.modules.get("torch")
+    if torch is not None:
+        torch.set_num_threads(threads)
+
+
+def _transcribe_chunk(model: str, pcm: bytes) -> str:
+    return _result_text(load_whisper_model(model).transcribe(pcm_to_audio(pcm))).strip()
+
+
+class WhisperEngine:
+    """Transcribe long audio in parallel worker processes that each load the model once.
+
+    Audio is split at silence into chunks of about ``chunk_seconds``; the chunk
+    transcripts are stitched back together in order.
+    """
+
+    def __init__(
+        self,
+        model: str = DEFAULT_WHISPER_MODEL,
+        *,
+        workers: int = DEFAULT_WHISPER_WORKERS,
+        chunk_seconds: float = CHUNK_SECONDS,
+        executor: Executor | None = None,
+    ) -> None:
+        self.model = model
+        self.workers = workers
+        self.chunk_seconds = chunk_seconds
+        self._executor = executor
+        self._lock = threading.Lock()
+
+    def _pool(self) -> Executor:
+        with self._lock:
+            if self._executor is None:
+                # A dedicated pool: its initializer loads the model once per worker,
+                # and its size bounds how many copies of the weights are in memory.
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                    initializer=_init_whisper_worker,
+                    initargs=(self.model, max(1, (os.cpu_count() or 1) // self.workers)),
+                )
+            return self._executor
+
+    def transcribe(self, pcm: bytes) -> str:
+        chunks = split_at_silence(pcm, chunk_seconds=self.chunk_seconds)
+        logger.info("[YtdlpLoader] Transcribing %s audio chunks across %s workers", len(chunks), self.workers)
+        pool = self._pool()
+        futures = [pool.submit(_transcribe_chunk, self.model, chunk) for chunk in chunks]
+        return " ".join(text for future in futures if (text := future.result()))
+
+    def close(self) -> None:
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(cancel_futures=True)
+                self._executor = None
+
+
+_engines: dict[str, WhisperEngine] = {}
+_engines_lock = threading.Lock()
+
+
+def whisper_engine(model: str = DEFAULT_WHISPER_MODEL) -> WhisperEngine:
+    """Return the process-wide parallel engine for ``model``."""
+    with _engines_lock:
+        engine = _engines.get(model)
+        if engine is None:
+            engine = _engines[model] = WhisperEngine(model)
+        return engine
+
+
+def preload_whisper_models(names: Iterable[str] = (DEFAULT_WHISPER_MODEL,)) -> None:
+    """Load models at startup so the first transcription does not pay for it."""
+    for name in names:
+        load_whisper_model(name)
 
 
 class YtdlpLoader(Loader):
-    def __init__(self, model: str = "tiny") -> None:
-        try:
-            import whisper
-        except ImportError as e:
-            raise WhisperNotInstalledError from e
+    def __init__(
+        self,
+        model: str = DEFAULT_WHISPER_MODEL,
+        audio_mode: AudioMode = AudioMode.STREAM,
+        temp_dir: str | Path | None = None,
+        store: TranscriptStore | None = None,
+        parallel: bool = True,
+    ) -> None:
+        _import_whisper()
+        self.model_name = model
+        self.audio_mode = audio_mode
+        self.temp_dir = temp_dir
+        self.store = store
+        self.parallel = parallel
+
+    @property
+    def model(self) -> WhisperModel:
+        # Resolved on use so a stored transcript never pays for loading weights.
+        return load_whisper_model(self.model_name)
 
-        self.model = whisper.load_model(model)
-        self.load_audio = whisper.load_audio
+    def _load_pcm(self, url: str) -> bytes:
+        if self.audio_mode == AudioMode.STREAM:
+            try:
+                media_url, headers = resolve_audio_stream(url)
+                logger.info("[YtdlpLoader] Decoding audio stream")
+                return decode_pcm(media_url, url=url, headers=headers)
+            except (LoaderContentError, yt_dlp.utils.DownloadError) as e:
+                logger.info("[YtdlpLoader] Streaming decode failed, downloading audio instead: %s", e)
+
+        # Spill files live in their own directory so concurrent workers never collide.
+        with tempfile.TemporaryDirectory(prefix="kabigon-audio-", dir=self.temp_dir) as directory:
+            path = download_audio(url, directory)
+            logger.debug("[YtdlpLoader] Audio file path: %s", path)
+            return decode_pcm(str(path), url=url)
 
     def load_sync(self, url: str) -> str:
         logger.info("[YtdlpLoader] Processing URL: %s", url)
-        outtmpl = uuid.uuid4().hex[:20]
-        path = str(Path(outtmpl).with_suffix(".mp3"))
-        download_audio(url, outtmpl=outtmpl)
-        result: dict[str, Any] = {"text": ""}
-
-        try:
-            audio = self.load_audio(path)
-            logger.info("[YtdlpLoader] Transcribing audio file")
-            logger.debug("[YtdlpLoader] Audio file path: %s", path)
-            result = self.model.transcribe(audio)
-        finally:
-            # Clean up the audio file
-            with contextlib.suppress(OSError):
-                Path(path).unlink(missing_ok=True)
-
-        text = result.get("text", "")
-        if isinstance(text, str):
-            logger.info("[YtdlpLoader] Extracted transcript content (%s chars)", len(text))
-            return text
-        joined_text = "\n".join(str(item) for item in text)
-        logger.info("[YtdlpLoader] Extracted transcript content (%s chars)", len(joined_text))
-        return joined_text
+        store = self.store or default_transcript_store()
+        video_id = youtube_video_id(url) if store is not None else None
+        if store is not None and video_id is not None:
+            cached = store.get(video_id, TranscriptSource.WHISPER, self.model_name)
+            if cached is not None:
+                logger.info("[YtdlpLoader] Using stored transcript for %s", video_id)
+                return cached
+
+        text = self._transcribe(url)
+        if store is not None and video_id is not None:
+            store.put(video_id, TranscriptSource.WHISPER, self.model_name, text)
+        return text
+
+    def _transcribe(self, url: str) -> str:
+        pcm = self._load_pcm(url)
+        if self.parallel and len(pcm) >= PARALLEL_MIN_SECONDS * SAMPLE_RATE * 2:
+            text = whisper_engine(self.model_name).transcribe(pcm)
+        else:
+            logger.info("[YtdlpLoader] Transcribing audio")
+            text = _result_text(self.model.transcribe(pcm_to_audio(pcm)))
+        logger.info("[YtdlpLoader] Extracted transcript content (%s chars)", len(text))
+        return text
 
     async def load(self, url: str) -> str:
-        return await asyncio.to_thread(self.load_sync, url)
+        return await run_cpu(self.load_sync, url)
@@ -1,15 +1,31 @@
 from __future__ import annotations
 
+import functools
 from collections.abc import Callable
 from dataclasses import dataclass
 from enum import StrEnum
+from urllib.parse import ParseResult
+from urllib.parse import urlparse
 
 import kabigon.loader_registry as loader_names
+from kabigon.sources.applicability import BBC_DOMAIN_SUFFIX
+from kabigon.sources.applicability import CNN_DOMAIN_SUFFIX
+from kabigon.sources.applicability import GITHUB_HOST
+from kabigon.sources.applicability import LTN_DOMAIN_SUFFIX
+from kabigon.sources.applicability import OPENAI_WEB_HOSTS
+from kabigon.sources.applicability import PTT_HOSTS
+from kabigon.sources.applicability import RAW_GITHUB_HOST
+from kabigon.sources.applicability import REDDIT_DOMAINS
+from kabigon.sources.applicability import REEL_PREFIX
+from kabigon.sources.applicability import TRUTHSOCIAL_DOMAINS
+from kabigon.sources.applicability import TWITTER_DOMAINS
+from kabigon.sources.applicability import YOUTUBE_ALLOWED_NETLOCS
 from kabigon.sources.applicability import is_bbc_url
 from kabigon.sources.applicability import is_cnn_url
 from kabigon.sources.applicability import is_github_url
 from kabigon.sources.applicability import is_ltn_url
 from kabigon.sources.applicability import is_openai_web_url
+from kabigon.sources.applicability import is_parsed_pdf_target
 from kabigon.sources.applicability import is_pdf_target
 from kabigon.sources.applicability import is_ptt_url
 from kabigon.sources.applicability import is_reddit_url
@@ -19,6 +35,7 @@ from kabigon.sources.applicability import is_twitter_url
 from kabigon.sources.applicability import is_youtube_video_url
 
 Matcher = Callable[[str], bool]
+ParsedMatcher = Callable[[str, ParseResult], bool]
 
 
 class ContentType(StrEnum):
@@ -35,96 +52,165 @@ class FallbackPolicy(StrEnum):
     NO_FALLBACK = "no_fallback"
 
 
+class ExecutionMode(StrEnum):
+    """How a Load chain walks its execution plan.
+
+    ``SEQUENTIAL`` tries one loader at a time. ``HEDGED`` starts the next
+    loader whenever the running ones have not finished within ``hedge_delay``.
+    ``RACE`` runs the first ``race_width`` loaders at once. In the concurrent
+    modes the first usable result wins and the other attempts are cancelled.
+    """
+
+    SEQUENTIAL = "sequential"
+    HEDGED = "hedged"
+    RACE = "race"
+
+
+DEFAULT_HEDGE_DELAY = 3.0
+DEFAULT_RACE_WIDTH = 2
+
+
 @dataclass(frozen=True)
 class Pipeline:
     name: str
     content_type: ContentType
     targeted_loaders: tuple[str, ...]
     fallback_policy: FallbackPolicy = FallbackPolicy.REMAINING_DEFAULT
+    execution_mode: ExecutionMode = ExecutionMode.SEQUENTIAL
+    hedge_delay: float = DEFAULT_HEDGE_DELAY
+    race_width: int = DEFAULT_RACE_WIDTH
+
+
+@dataclass(frozen=True)
+class _PipelineEntry:
+    """A Pipeline, its matcher and the hosts the matcher can accept.
+
+    ``hosts`` are exact netlocs and ``domain_suffixes`` cover a domain and its
+    subdomains, both compared lowercased. The compiled matcher only tries an
+    entry for URLs on those hosts; an entry without either is tried for every
+    URL. With ``host_decides`` an indexed host is a match on its own and
+    ``matches`` is not called.
+    """
+
+    pipeline: Pipeline
+    matches: Matcher
+    hosts: tuple[str, ...] = ()
+    domain_suffixes: tuple[str, ...] = ()
+    host_decides: bool = False
+    matches_parsed: ParsedMatcher | None = None
 
+    def check(self) -> ParsedMatcher:
+        if self.host_decides:
+            return _host_match
+        if self.matches_parsed is not None:
+            return self.matches_parsed
+        matches = self.matches
+        return lambda url, _parsed: matches(url)
 
-_PIPELINE_ENTRIES: tuple[tuple[Pipeline, Matcher], ...] = (
-    (
+
+def _host_match(url: str, parsed: ParseResult) -> bool:
+    return True
+
+
+_PIPELINE_ENTRIES: tuple[_PipelineEntry, ...] = (
+    _PipelineEntry(
         Pipeline(
             name=loader_names.PTT,
             content_type=ContentType.SOCIAL_POST,
             targeted_loaders=(loader_names.PTT,),
         ),
         is_ptt_url,
+        hosts=PTT_HOSTS,
+        host_decides=True,
     ),
-    (
+    _PipelineEntry(
         Pipeline(
             name=loader_names.TWITTER,
             content_type=ContentType.SOCIAL_POST,
             targeted_loaders=(loader_names.TWITTER,),
         ),
         is_twitter_url,
+        hosts=TWITTER_DOMAINS,
+        host_decides=True,
     ),
-    (
+    _PipelineEntry(
         Pipeline(
             name=loader_names.TRUTHSOCIAL,
             content_type=ContentType.SOCIAL_POST,
             targeted_loaders=(loader_names.TRUTHSOCIAL,),
         ),
         is_truthsocial_url,
+        hosts=TRUTHSOCIAL_DOMAINS,
+        host_decides=True,
     ),
-    (
+    _PipelineEntry(
         Pipeline(
             name=loader_names.REDDIT,
             content_type=ContentType.SOCIAL_POST,
             targeted_loaders=(loader_names.REDDIT,),
         ),
         is_reddit_url,
+        hosts=REDDIT_DOMAINS,
+        host_decides=True,
     ),
-    (
+    _PipelineEntry(
         Pipeline(
             name=loader_names.YOUTUBE,
             content_type=ContentType.YOUTUBE_VIDEO,
             targeted_loaders=(loader_names.YOUTUBE, loader_names.YOUTUBE_YTDLP),
         ),
         is_youtube_video_url,
+        hosts=tuple(sorted(YOUTUBE_ALLOWED_NETLOCS)),
     ),
-    (
+    _PipelineEntry(
         Pipeline(
             name=loader_names.REEL,
             content_type=ContentType.SOCIAL_POST,
             targeted_loaders=(loader_names.REEL,),
         ),
         is_reel_url,
+        hosts=(urlparse(REEL_PREFIX).netloc,),
     ),
-    (
+    _PipelineEntry(
         Pipeline(
             name=loader_names.GITHUB,
             content_type=ContentType.CODE_CONTENT,
             targeted_loaders=(loader_names.GITHUB,),
         ),
         is_github_url,
+        hosts=(GITHUB_HOST, RAW_GITHUB_HOST),
     ),
-    (
+    _PipelineEntry(
         Pipeline(
             name=loader_names.BBC,
             content_type=ContentType.NEWS_ARTICLE,
             targeted_loaders=(loader_names.BBC,),
         ),
         is_bbc_url,
+        domain_suffixes=(BBC_DOMAIN_SUFFIX,),
+        host_decides=True,
     ),
-    (
+    _PipelineEntry(
         Pipeline(
             name=loader_names.CNN,
             content_type=ContentType.NEWS_ARTICLE,
             targeted_loaders=(loader_names.CNN,),
         ),
         is_cnn_url,
+        domain_suffixes=(CNN_DOMAIN_SUFFIX,),
+        host_decides=True,
     ),
-    (
+    _PipelineEntry(
         Pipeline(
             name=loader_names.LTN,
             content_type=ContentType.NEWS_ARTICLE,
             targeted_loaders=(loader_names.LTN,),
         ),
         is_ltn_url,
+        domain_suffixes=(LTN_DOMAIN_SUFFIX,),
+        host_decides=True,
     ),
-    (
+    _PipelineEntry(
         Pipeline(
             name="openai_web",
             content_type=ContentType.GENERIC_WEB,
@@ -132,27 +218,163 @@ _PIPELINE_ENTRIES: tuple[tuple[Pipeline, Matcher], ...] = (
             fallback_policy=FallbackPolicy.NO_FALLBACK,
         ),
         is_openai_web_url,
+        hosts=OPENAI_WEB_HOSTS,
+        host_decides=True,
     ),
-    (
+    _PipelineEntry(
         Pipeline(
             name=loader_names.PDF,
             content_type=ContentType.DOCUMENT_PDF,
             targeted_loaders=(loader_names.PDF,),
         ),
         is_pdf_target,
+        matches_parsed=is_parsed_pdf_target,
     ),
 )
 
+# Candidate lists are cached per netloc; batches are dominated by a few hosts.
+_CANDIDATE_CACHE_SIZE = 4096
+
+type _Candidate = tuple[Pipeline, Matcher, ParsedMatcher]
+
+
+class _DomainTrie:
+    """Entry indices keyed by domain suffix, stored by reversed labels."""
+
+    def __init__(self) -> None:
+        self.children: dict[str, _DomainTrie] = {}
+        self.indices: list[int] = []
+
+    def add(self, domain_suffix: str, index: int) -> None:
+        node = self
+        for label in reversed(domain_suffix.lower().lstrip(".").split(".")):
+            node = node.children.setdefault(label, _DomainTrie())
+        node.indices.append(index)
+
+    def lookup(self, host: str) -> list[int]:
+        """Indices of every suffix that is ``host`` or one of its parent domains."""
+        indices: list[int] = []
+        node = self
+        for label in reversed(host.split(".")):
+            child = node.children.get(label)
+            if child is None:
+                break
+            node = child
+            indices.extend(node.indices)
+        return indices
+
+
+@dataclass(frozen=True)
+class CatalogMatch:
+    """The verdict of every catalog matcher on one URL, from a single parse."""
+
+    url: str
+    # Every Pipeline whose matcher accepts the URL, in catalog order.
+    pipelines: tuple[Pipeline, ...]
+    accepted: frozenset[Matcher]
+    known: frozenset[Matcher]
+
+    @property
+    def pipeline(self) -> Pipeline | None:
+        return self.pipelines[0] if self.pipelines else None
+
+    def accepts(self, matcher: Matcher) -> bool:
+        """``matcher(url)``, answered from the catalog's verdicts when it is a catalog matcher."""
+        if matcher in self.known:
+            return matcher in self.accepted
+        return matcher(self.url)
+
+
+class PipelineMatcher:
+    """First-match Pipeline lookup that parses each URL once.
+
+    The netloc selects candidate entries through an exact-host index and a
+    reversed-domain trie; entries without hosts are candidates for every URL.
+    Candidates keep their catalog order, so the first one whose check passes
+    is the Pipeline a linear walk over the catalog would have returned.
+    """
+
+    def __init__(self, entries: tuple[_PipelineEntry, ...] = _PIPELINE_ENTRIES) -> None:
+        self._checks: tuple[_Candidate, ...] = tuple(
+            (entry.pipeline, entry.matches, entry.check()) for entry in entries
+        )
+        self.matchers = frozenset(entry.matches for entry in entries)
+        self._by_host: dict[str, list[int]] = {}
+        self._suffixes = _DomainTrie()
+        self._any_host: list[int] = []
+        for index, entry in enumerate(entries):
+            for host in entry.hosts:
+                self._by_host.setdefault(host.lower(), []).append(index)
+            for domain_suffix in entry.domain_suffixes:
+                self._suffixes.add(domain_suffix, index)
+            if not entry.hosts and not entry.domain_suffixes:
+                self._any_host.append(index)
+        self._candidates = functools.lru_cache(maxsize=_CANDIDATE_CACHE_SIZE)(self._lookup)
+
+    def _lookup(self, netloc: str) -> tuple[_Candidate, ...]:
+        host = netloc.lower()
+        indices = {*self._by_host.get(host, ()), *self._suffixes.lookup(host), *self._any_host}
+        return tuple(self._checks[index] for index in sorted(indices))
+
+    def match(self, url: str) -> Pipeline | None:
+        parsed = urlparse(url)
+        for pipeline, _matches, check in self._candidates(parsed.netloc):
+            if check(url, parsed):
+                return pipeline
+        return None
+
+    def match_all(self, url: str) -> CatalogMatch:
+        parsed = urlparse(url)
+        accepted = [
+            (pipeline, matches) for pipeline, matches, check in self._candidates(parsed.netloc) if check(url, parsed)
+        ]
+        return CatalogMatch(
+            url=url,
+            pipelines=tuple(pipeline for pipeline, _matches in accepted),
+            accepted=frozenset(matches for _pipeline, matches in accepted),
+            known=self.matchers,
+        )
+
+
+_matcher = PipelineMatcher()
+
 
 def match_pipeline(url: str) -> Pipeline | None:
-    for pipeline, matches in _PIPELINE_ENTRIES:
-        if matches(url):
-            return pipeline
+    return _matcher.match(url)
+
+
+def catalog_matchers() -> frozenset[Matcher]:
+    return _matcher.matchers
+
+
+def match_catalog(url: str) -> CatalogMatch:
+    """Match ``url`` against every Pipeline, not just the first that accepts it."""
+    return _matcher.match_all(url)
+
+
+def _match_pipeline_linear(url: str) -> Pipeline | None:
+    # Reference implementation: every matcher in catalog order.
+    for entry in _PIPELINE_ENTRIES:
+        if entry.matches(url):
+            return entry.pipeline
     return None
 
 
 def list_pipelines() -> tuple[Pipeline, ...]:
-    return tuple(pipeline for pipeline, _matches in _PIPELINE_ENTRIES)
+    return tuple(entry.pipeline for entry in _PIPELINE_ENTRIES)
 
 
-__all__ = ["ContentType", "FallbackPolicy", "Pipeline", "list_pipelines", "match_pipeline"]
+__all__ = [
+    "DEFAULT_HEDGE_DELAY",
+    "DEFAULT_RACE_WIDTH",
+    "CatalogMatch",
+    "ContentType",
+    "ExecutionMode",
+    "FallbackPolicy",
+    "Pipeline",
+    "PipelineMatcher",
+    "catalog_matchers",
+    "list_pipelines",
+    "match_catalog",
+    "match_pipeline",
+]
@@ -3,6 +3,7 @@ from __future__ import annotations
 from collections.abc import Callable
 from dataclasses import dataclass
 from pathlib import Path
+from urllib.parse import ParseResult
 from urllib.parse import parse_qs
 from urllib.parse import urlparse
 from urllib.parse import urlunparse
@@ -202,24 +203,21 @@ def is_github_url(url: str) -> bool:
 
 
 def parse_pdf_target(target: str) -> str:
-    parsed = urlparse(target)
-    if parsed.scheme in {"http", "https"}:
-        path = parsed.path.lower()
-        if not path.endswith(".pdf") and not (parsed.netloc.lower() in ARXIV_HOSTS and path.startswith("/pdf/")):
-            raise InvalidURLError(target, "PDF")
-        return target
-
-    if Path(target).suffix.lower() != ".pdf":
+    if not is_parsed_pdf_target(target, urlparse(target)):
         raise InvalidURLError(target, "PDF")
     return target
 
 
+def is_parsed_pdf_target(target: str, parsed: ParseResult) -> bool:
+    """``is_pdf_target`` for a caller that has already parsed ``target``."""
+    if parsed.scheme in {"http", "https"}:
+        path = parsed.path.lower()
+        return path.endswith(".pdf") or (parsed.netloc.lower() in ARXIV_HOSTS and path.startswith("/pdf/"))
+    return Path(target).suffix.lower() == ".pdf"
+
+
 def is_pdf_target(target: str) -> bool:
-    try:
-        parse_pdf_target(target)
-    except InvalidURLError:
-        return False
-    return True
+    return is_parsed_pdf_target(target, urlparse(target))
 
 
 def _host(url: str) -> str:
@@ -390,6 +388,7 @@ __all__ = [
     "is_github_url",
     "is_ltn_url",
     "is_openai_web_url",
+    "is_parsed_pdf_target",
     "is_pdf_target",
     "is_ptt_url",
     "is_reddit_url",
@@ -0,0 +1,161 @@
+"""Structured timing events for Load chains.
+
+Each stage of a load — resolving the plan, every loader attempt, the network
+fetch, HTML-to-markdown conversion, and the content guard — emits a
+``TimingEvent`` to the hooks registered with ``timing_hook`` or
+``collect_timings``. Hooks live in a context variable, so they follow a load
+into its tasks and worker threads and stay scoped to the block that set them.
+With no hook registered, spans only cost a context-variable lookup.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections.abc import Callable
+from collections.abc import Generator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from enum import StrEnum
+
+logger = logging.getLogger(__name__)
+
+
+class TimingStage(StrEnum):
+    PLAN = "plan"
+    ATTEMPT = "attempt"
+    FETCH = "fetch"
+    CONVERT = "convert"
+    GUARD = "guard"
+
+
+class TimingOutcome(StrEnum):
+    OK = "ok"
+    ERROR = "error"
+    CANCELLED = "cancelled"
+
+
+@dataclass(frozen=True)
+class TimingEvent:
+    stage: TimingStage
+    url: str | None
+    loader: str | None
+    duration: float
+    outcome: TimingOutcome
+    bytes_in: int | None = None
+    bytes_out: int | None = None
+    error: str | None = None
+
+
+TimingHook = Callable[[TimingEvent], None]
+Payload = str | bytes | int
+
+_hooks: ContextVar[tuple[TimingHook, ...]] = ContextVar("kabigon_timing_hooks", default=())
+_current_url: ContextVar[str | None] = ContextVar("kabigon_timing_url", default=None)
+_current_loader: ContextVar[str | None] = ContextVar("kabigon_timing_loader", default=None)
+
+
+def _payload_size(payload: Payload | None) -> int | None:
+    if payload is None or isinstance(payload, int):
+        return payload
+    if isinstance(payload, str):
+        return len(payload.encode("utf-8"))
+    return len(payload)
+
+
+class TimingSpan:
+    """Handle for an in-progress stage; callers record what went in and out."""
+
+    def __init__(self) -> None:
+        self.bytes_in: Payload | None = None
+        self.bytes_out: Payload | None = None
+
+    def record(self, *, bytes_in: Payload | None = None, bytes_out: Payload | None = None) -> None:
+        """Remember payloads; sizes are only measured if the event is emitted."""
+        if bytes_in is not None:
+            self.bytes_in = bytes_in
+        if bytes_out is not None:
+            self.bytes_out = bytes_out
+
+
+@contextmanager
+def timing_hook(hook: TimingHook) -> Generator[None]:
+    """Call ``hook`` with every timing event emitted inside the block."""
+    token = _hooks.set((*_hooks.get(), hook))
+    try:
+        yield
+    finally:
+        _hooks.reset(token)
+
+
+@contextmanager
+def collect_timings() -> Generator[list[TimingEvent]]:
+    """Collect the timing events emitted inside the block into a list."""
+    events: list[TimingEvent] = []
+    with timing_hook(events.append):
+        yield events
+
+
+@contextmanager
+def timed(stage: TimingStage, *, url: str | None = None, loader: str | None = None) -> Generator[TimingSpan]:
+    """Time the enclosed stage and emit a ``TimingEvent`` when it ends.
+
+    ``url`` and ``loader`` default to those of the enclosing span, so fetches
+    and conversions inside a loader are attributed to its attempt.
+    """
+    span = TimingSpan()
+    url = url or _current_url.get()
+    loader = loader or _current_loader.get()
+    url_token = _current_url.set(url)
+    loader_token = _current_loader.set(loader)
+    start = time.perf_counter()
+    outcome = TimingOutcome.OK
+    error: str | None = None
+    try:
+        yield span
+    except BaseException as e:
+        outcome = TimingOutcome.CANCELLED if isinstance(e, asyncio.CancelledError) else TimingOutcome.ERROR
+        error = f"{type(e).__name__}: {e}"
+        raise
+    finally:
+        duration = time.perf_counter() - start
+        _current_loader.reset(loader_token)
+        _current_url.reset(url_token)
+        hooks = _hooks.get()
+        if hooks:
+            _emit(
+                hooks,
+                TimingEvent(
+                    stage=stage,
+                    url=url,
+                    loader=loader,
+                    duration=duration,
+                    outcome=outcome,
+                    bytes_in=_payload_size(span.bytes_in),
+                    bytes_out=_payload_size(span.bytes_out),
+                    error=error,
+                ),
+            )
+
+
+def _emit(hooks: tuple[TimingHook, ...], event: TimingEvent) -> None:
+    for hook in hooks:
+        try:
+            hook(event)
+        except Exception:
+            # A broken hook must never fail the load it is observing.
+            logger.exception("Timing hook failed for %s event", event.stage)
+
+
+__all__ = [
+    "TimingEvent",
+    "TimingHook",
+    "TimingOutcome",
+    "TimingSpan",
+    "TimingStage",
+    "collect_timings",
+    "timed",
+    "timing_hook",
+]
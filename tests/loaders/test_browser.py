@@ -3,8 +3,10 @@ import asyncio
 import pytest
 from playwright.async_api import TimeoutError
 
+import kabigon
 from kabigon.core.errors import LoaderTimeoutError
 from kabigon.loaders import browser
+from kabigon.loaders.session import loader_session
 
 
 class FakeRequest:
@@ -167,3 +169,203 @@ def test_fetch_browser_html_maps_timeout(monkeypatch: pytest.MonkeyPatch) -> Non
                 timeout_suggestion="try again",
             )
         )
+
+
+class PoolPage(FakePage):
+    def __init__(self) -> None:
+        super().__init__()
+        self.closed = False
+
+    async def close(self) -> None:
+        self.closed = True
+
+
+class PoolContext:
+    def __init__(self, user_agent: str | None) -> None:
+        self.user_agent = user_agent
+        self.pages: list[PoolPage] = []
+        self.closed = False
+
+    async def new_page(self) -> PoolPage:
+        page = PoolPage()
+        self.pages.append(page)
+        return page
+
+    async def close(self) -> None:
+        self.closed = True
+
+
+class PoolBrowser:
+    def __init__(self) -> None:
+        self.contexts: list[PoolContext] = []
+        self.connected = True
+        self.closed = False
+
+    def is_connected(self) -> bool:
+        return self.connected
+
+    async def new_context(self, **kwargs) -> PoolContext:
+        context = PoolContext(kwargs.get("user_agent"))
+        self.contexts.append(context)
+        return context
+
+    async def close(self) -> None:
+        self.closed = True
+
+
+class PoolChromium:
+    def __init__(self) -> None:
+        self.browsers: list[PoolBrowser] = []
+
+    async def launch(self, headless: bool) -> PoolBrowser:
+        browser_ = PoolBrowser()
+        self.browsers.append(browser_)
+        return browser_
+
+
+class PoolPlaywright:
+    def __init__(self) -> None:
+        self.chromium = PoolChromium()
+        self.stopped = False
+
+    async def stop(self) -> None:
+        self.stopped = True
+
+
+class PoolPlaywrightStarter:
+    def __init__(self, playwright: PoolPlaywright) -> None:
+        self.playwright = playwright
+
+    async def start(self) -> PoolPlaywright:
+        return self.playwright
+
+
+def _set_pool_playwright(monkeypatch: pytest.MonkeyPatch) -> PoolPlaywright:
+    playwright = PoolPlaywright()
+    monkeypatch.setattr(browser, "async_playwright", lambda: PoolPlaywrightStarter(playwright))
+    return playwright
+
+
+async def _fetch(url: str = "https://example.com", user_agent: str | None = None) -> str:
+    return await browser.fetch_browser_html(
+        url,
+        loader_name="TestLoader",
+        timeout_ms=1_000,
+        timeout_suggestion="try again",
+        user_agent=user_agent,
+    )
+
+
+def test_fetch_browser_html_reuses_pooled_browser_and_context(monkeypatch: pytest.MonkeyPatch) -> None:
+    playwright = _set_pool_playwright(monkeypatch)
+
+    async def run() -> None:
+        async with browser.browser_pool_session():
+            await _fetch()
+            await _fetch()
+
+    asyncio.run(run())
+
+    assert len(playwright.chromium.browsers) == 1
+    pooled_browser = playwright.chromium.browsers[0]
+    assert len(pooled_browser.contexts) == 1
+    assert len(pooled_browser.contexts[0].pages) == 2
+    assert all(page.closed for page in pooled_browser.contexts[0].pages)
+    assert pooled_browser.contexts[0].closed is True
+    assert pooled_browser.closed is True
+    assert playwright.stopped is True
+
+
+def test_browser_pool_keeps_contexts_per_user_agent(monkeypatch: pytest.MonkeyPatch) -> None:
+    playwright = _set_pool_playwright(monkeypatch)
+
+    async def run() -> None:
+        async with browser.browser_pool_session():
+            await _fetch(user_agent="agent-a")
+            await _fetch(user_agent="agent-b")
+            await _fetch(user_agent="agent-a")
+
+    asyncio.run(run())
+
+    contexts = playwright.chromium.browsers[0].contexts
+    assert [context.user_agent for context in contexts] == ["agent-a", "agent-b"]
+    assert len(contexts[0].pages) == 2
+
+
+def test_browser_pool_recycles_context_after_max_pages(monkeypatch: pytest.MonkeyPatch) -> None:
+    playwright = _set_pool_playwright(monkeypatch)
+    config = browser.BrowserPoolConfig(max_pages_per_context=2)
+
+    async def run() -> None:
+        async with browser.browser_pool_session(config):
+            for _ in range(3):
+                await _fetch()
+
+    asyncio.run(run())
+
+    contexts = playwright.chromium.browsers[0].contexts
+    assert [len(context.pages) for context in contexts] == [2, 1]
+
+
+def test_browser_pool_relaunches_disconnected_browser(monkeypatch: pytest.MonkeyPatch) -> None:
+    playwright = _set_pool_playwright(monkeypatch)
+
+    async def run() -> None:
+        async with browser.browser_pool_session():
+            await _fetch()
+            playwright.chromium.browsers[0].connected = False
+            await _fetch()
+
+    asyncio.run(run())
+
+    assert len(playwright.chromium.browsers) == 2
+    assert len(playwright.chromium.browsers[1].contexts[0].pages) == 1
+
+
+def test_browser_pool_bounds_concurrent_pages(monkeypatch: pytest.MonkeyPatch) -> None:
+    playwright = _set_pool_playwright(monkeypatch)
+    config = browser.BrowserPoolConfig(max_browsers=2, contexts_per_browser=1)
+    active = {"now": 0, "max": 0}
+
+    async def slow_extract(page) -> str:
+        active["now"] += 1
+        active["max"] = max(active["max"], active["now"])
+        await asyncio.sleep(0.01)
+        active["now"] -= 1
+        return "ok"
+
+    async def run() -> None:
+        async with browser.browser_pool_session(config):
+            await asyncio.gather(
+                *(
+                    browser.fetch_browser_html(
+                        "https://example.com",
+                        loader_name="TestLoader",
+                        timeout_ms=1_000,
+                        timeout_suggestion="try again",
+                        extract_content=slow_extract,
+                    )
+                    for _ in range(5)
+                )
+            )
+
+    asyncio.run(run())
+
+    assert active["max"] == 2
+    assert len(playwright.chromium.browsers) == 2
+
+
+def test_public_loader_session_keeps_browser_pool_across_load_chains(monkeypatch: pytest.MonkeyPatch) -> None:
+    playwright = _set_pool_playwright(monkeypatch)
+
+    async def run() -> None:
+        async with kabigon.loader_session():
+            for _ in range(2):
+                # Every Load chain opens its own nested session.
+                async with loader_session():
+                    await _fetch()
+
+    asyncio.run(run())
+
+    assert len(playwright.chromium.browsers) == 1
+    assert len(playwright.chromium.browsers[0].contexts[0].pages) == 2
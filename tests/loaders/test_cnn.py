@@ -54,6 +54,9 @@ def test_cnn_loader_uses_news_article_loading(monkeypatch: pytest.MonkeyPatch) -
             return
 
     class MockAsyncClient:
+        def __init__(self, **_: object) -> None:
+            return None
+
         async def __aenter__(self):
             return self
 
@@ -2,7 +2,9 @@ import pytest
 
 from kabigon.core.errors import LoaderContentError
 from kabigon.loaders.content_guard import BLOCKED_MARKERS
+from kabigon.loaders.content_guard import HEAD_WINDOW
 from kabigon.loaders.content_guard import MIN_CONTENT_LENGTH
+from kabigon.loaders.content_guard import assess_block_page
 from kabigon.loaders.content_guard import ensure_usable_content
 
 
@@ -17,6 +19,8 @@ def test_ensure_usable_content_passes_for_real_content() -> None:
 def test_ensure_usable_content_rejects_short_content() -> None:
     with pytest.raises(LoaderContentError, match="too short"):
         ensure_usable_content("hi", loader_name="X", url="https://example.com")
+    with pytest.raises(LoaderContentError, match=r"too short \(2 chars"):
+        ensure_usable_content(" " * 1000 + "hi\n\n", loader_name="X", url="https://example.com")
 
 
 def test_ensure_usable_content_honors_custom_min_length() -> None:
@@ -35,3 +39,24 @@ def test_cloudflare_just_a_moment_is_rejected() -> None:
     payload = "Just a moment...\nEnable JavaScript and cookies to continue\n" * 20
     with pytest.raises(LoaderContentError):
         ensure_usable_content(payload, loader_name="X", url="https://example.com")
+
+
+def test_markers_past_the_head_window_are_ignored() -> None:
+    article = _long_text(HEAD_WINDOW * 2) + "\nThe court ruled that access denied to the archive was unlawful."
+
+    assessment = ensure_usable_content(article, loader_name="X", url="https://example.com")
+
+    assert assessment.confidence == 0.0
+    assert not assessment.blocked
+
+
+def test_assess_block_page_scores_title_and_combined_markers_higher() -> None:
+    generic_in_body = assess_block_page(_long_text() + "\n403 Forbidden")
+    generic_in_title = assess_block_page("403 Forbidden\n" + _long_text())
+    challenge = assess_block_page("Just a moment...\nChecking your browser before accessing the site.")
+
+    assert generic_in_body.markers == ("403 forbidden",)
+    assert generic_in_body.blocked
+    assert generic_in_body.confidence < generic_in_title.confidence < challenge.confidence < 1.0
+    assert challenge.markers[0] == "just a moment..."
+    assert assess_block_page(_long_text()).confidence == 0.0
@@ -6,13 +6,14 @@ from typing import Any
 import pytest
 
 from kabigon.core.errors import LoaderContentError
-from kabigon.loaders import curl_cffi as curl_cffi_module
+from kabigon.loaders import curl_session
 from kabigon.loaders.curl_cffi import CurlCffiLoader
 
 
 class _FakeResponse:
-    def __init__(self, content: bytes) -> None:
+    def __init__(self, content: bytes, charset_encoding: str | None = None) -> None:
         self.content = content
+        self.charset_encoding = charset_encoding
 
     def raise_for_status(self) -> None:
         return None
@@ -37,7 +38,7 @@ class _FakeSession:
 def _install_fake_session(monkeypatch: pytest.MonkeyPatch, response: _FakeResponse) -> _FakeSession:
     fake = _FakeSession(response)
     monkeypatch.setattr(
-        curl_cffi_module.curl_requests,
+        curl_session.curl_requests,
         "AsyncSession",
         lambda **_kwargs: fake,
     )
@@ -58,3 +59,11 @@ def test_curl_cffi_loader_rejects_cloudflare_challenge(monkeypatch: pytest.Monke
 
     with pytest.raises(LoaderContentError):
         asyncio.run(CurlCffiLoader().load("https://example.com/blocked"))
+
+
+def test_curl_cffi_loader_decodes_with_declared_charset(monkeypatch: pytest.MonkeyPatch) -> None:
+    html = ("<html><body>" + ("<p>自由時報即時新聞內容</p>" * 50) + "</body></html>").encode("big5")
+    _install_fake_session(monkeypatch, _FakeResponse(html, charset_encoding="big5"))
+
+    result = asyncio.run(CurlCffiLoader().load("https://example.com/article"))
+    assert "自由時報即時新聞內容" in result
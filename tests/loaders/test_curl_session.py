@@ -0,0 +1,121 @@
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+
+import pytest
+
+from kabigon.loaders import curl_session
+from kabigon.loaders.curl_cffi import CurlCffiLoader
+from kabigon.loaders.curl_session import CurlSessionPool
+from kabigon.loaders.curl_session import CurlSessionPoolConfig
+from kabigon.loaders.session import loader_session
+
+HTML = b"<html><body>" + (b"<p>real news paragraph</p>" * 50) + b"</body></html>"
+
+
+class _FakeResponse:
+    content = HTML
+    charset_encoding = None
+
+    def raise_for_status(self) -> None:
+        return None
+
+
+class _FakeMulti:
+    def __init__(self) -> None:
+        self.options: dict[int, int] = {}
+
+    def setopt(self, option: int, value: int) -> None:
+        self.options[option] = value
+
+
+class _FakeSession:
+    def __init__(self, **kwargs: Any) -> None:
+        self.kwargs = kwargs
+        self.acurl = _FakeMulti()
+        self.requests = 0
+        self.closed = False
+
+    async def __aenter__(self) -> _FakeSession:
+        return self
+
+    async def __aexit__(self, *_: object) -> None:
+        await self.close()
+
+    async def get(self, url: str, **_: Any) -> _FakeResponse:
+        self.requests += 1
+        return _FakeResponse()
+
+    async def close(self) -> None:
+        self.closed = True
+
+
+@pytest.fixture
+def opened(monkeypatch: pytest.MonkeyPatch) -> list[_FakeSession]:
+    sessions: list[_FakeSession] = []
+
+    def open_session(**kwargs: Any) -> _FakeSession:
+        session = _FakeSession(**kwargs)
+        sessions.append(session)
+        return session
+
+    monkeypatch.setattr(curl_session.curl_requests, "AsyncSession", open_session)
+    return sessions
+
+
+async def _borrow(pool: CurlSessionPool, impersonate: str) -> object:
+    async with pool.session(impersonate) as session:
+        return session
+
+
+def test_pool_keeps_one_session_per_profile(opened: list[_FakeSession]) -> None:
+    async def main() -> None:
+        pool = CurlSessionPool(CurlSessionPoolConfig(max_clients=8, max_connections_per_host=3))
+        first = await _borrow(pool, "chrome")
+        assert await _borrow(pool, "chrome") is first
+        assert await _borrow(pool, "safari") is not first
+        assert len(pool) == 2
+        await pool.close()
+
+    asyncio.run(main())
+
+    assert [session.kwargs["impersonate"] for session in opened] == ["chrome", "safari"]
+    assert opened[0].kwargs["max_clients"] == 8
+    assert opened[0].acurl.options == {curl_session.CurlMOpt.MAX_HOST_CONNECTIONS: 3}
+    assert all(session.closed for session in opened)
+
+
+def test_pool_closes_idle_sessions_on_next_borrow(opened: list[_FakeSession]) -> None:
+    now = [0.0]
+
+    async def main() -> None:
+        pool = CurlSessionPool(CurlSessionPoolConfig(idle_timeout=10.0), clock=lambda: now[0])
+        await _borrow(pool, "chrome")
+        async with pool.session("safari"):
+            now[0] = 30.0
+            await _borrow(pool, "edge")
+        assert len(pool) == 2
+        await pool.close()
+
+    asyncio.run(main())
+
+    chrome, safari, edge = opened
+    assert chrome.closed
+    assert safari.closed
+    assert edge.closed
+
+
+def test_curl_cffi_loader_reuses_session_inside_loader_session(opened: list[_FakeSession]) -> None:
+    async def main() -> None:
+        async with loader_session():
+            loader = CurlCffiLoader()
+            for index in range(3):
+                await loader.load(f"https://example.com/article-{index}")
+            assert not opened[0].closed
+
+    asyncio.run(main())
+
+    [session] = opened
+    assert session.requests == 3
+    assert session.closed
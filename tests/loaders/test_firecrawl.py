@@ -1,69 +1,166 @@
-from types import SimpleNamespace
+import asyncio
+import json
 
+import httpx
 import pytest
 
+from kabigon import batch
 from kabigon.core.errors import FirecrawlAPIKeyNotSetError
 from kabigon.core.errors import LoaderError
+from kabigon.loaders import firecrawl
+from kabigon.loaders import http_client
+from kabigon.loaders.firecrawl import FirecrawlClient
 from kabigon.loaders.firecrawl import FirecrawlLoader
 
 
-def test_firecrawl_loader_prefers_scrape_url(monkeypatch: pytest.MonkeyPatch) -> None:
-    class FakeApp:
-        def __init__(self, api_key: str) -> None:
-            self.api_key = api_key
-            self.called = ""
+class StubFirecrawl:
+    """Answers the Firecrawl REST endpoints the loader uses."""
+
+    def __init__(self, *, batch_statuses: tuple[str, ...] = ("completed",)) -> None:
+        self.requests: list[httpx.Request] = []
+        self.batch_statuses = list(batch_statuses)
+        self.batch_urls: list[str] = []
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        path = request.url.path
+        if path == "/v1/scrape":
+            url = json.loads(request.content)["url"]
+            return httpx.Response(200, json={"success": True, "data": {"markdown": f"# single {url}"}})
+        if path == "/v1/batch/scrape":
+            self.batch_urls = json.loads(request.content)["urls"]
+            return httpx.Response(200, json={"success": True, "id": "job-1"})
+        if path == "/v1/batch/scrape/job-1":
+            return self._batch_status()
+        if path == "/v1/batch/scrape/job-1/page-2":
+            return httpx.Response(200, json={"status": "completed", "data": self._pages(self.batch_urls[1:])})
+        return httpx.Response(404, json={"success": False, "error": "not found"})
+
+    def _batch_status(self) -> httpx.Response:
+        status = self.batch_statuses.pop(0) if len(self.batch_statuses) > 1 else self.batch_statuses[0]
+        if status != "completed":
+            return httpx.Response(200, json={"status": status, "data": []})
+        # Split the results over two pages to exercise pagination.
+        return httpx.Response(
+            200,
+            json={
+                "status": "completed",
+                "data": self._pages(self.batch_urls[:1]),
+                "next": "https://firecrawl.test/v1/batch/scrape/job-1/page-2",
+            },
+        )
+
+    def _pages(self, urls: list[str]) -> list[dict[str, object]]:
+        return [{"markdown": f"# batch {url}", "metadata": {"sourceURL": url}} for url in urls]
+
+    def paths(self) -> list[str]:
+        return [request.url.path for request in self.requests]
+
+
+def _client(handler: object) -> httpx.AsyncClient:
+    return httpx.AsyncClient(transport=httpx.MockTransport(handler))  # ty: ignore[invalid-argument-type]
+
+
+def test_firecrawl_loader_scrapes_over_rest_api(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("FIRECRAWL_API_KEY", "test-key")
+    monkeypatch.setenv("FIRECRAWL_API_URL", "https://firecrawl.test/")
+    stub = StubFirecrawl()
+
+    loader = FirecrawlLoader(timeout=123, client=_client(stub))
+    content = asyncio.run(loader.load("https://example.com"))
+
+    assert content == "# single https://example.com"
+    [request] = stub.requests
+    assert str(request.url) == "https://firecrawl.test/v1/scrape"
+    assert request.headers["Authorization"] == "Bearer test-key"
+    assert json.loads(request.content) == {"url": "https://example.com", "formats": ["markdown"], "timeout": 123}
+
+
+def test_firecrawl_loader_requires_api_key(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.delenv("FIRECRAWL_API_KEY", raising=False)
+
+    with pytest.raises(FirecrawlAPIKeyNotSetError):
+        FirecrawlLoader()
+
+
+def test_firecrawl_loader_raises_when_markdown_missing(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("FIRECRAWL_API_KEY", "test-key")
+    client = _client(lambda request: httpx.Response(200, json={"success": True, "data": {}}))
+
+    with pytest.raises(LoaderError, match="did not include markdown"):
+        asyncio.run(FirecrawlLoader(client=client).load("https://example.com"))
 
-        def scrape_url(self, url: str, formats: list[str], timeout: int | None) -> object:
-            self.called = f"scrape_url:{url}:{formats}:{timeout}"
-            return SimpleNamespace(success=True, markdown="# ok")
 
+def test_firecrawl_loader_surfaces_api_errors(monkeypatch: pytest.MonkeyPatch) -> None:
     monkeypatch.setenv("FIRECRAWL_API_KEY", "test-key")
-    monkeypatch.setattr("kabigon.loaders.firecrawl.FirecrawlApp", FakeApp)
+    client = _client(lambda request: httpx.Response(402, json={"success": False, "error": "Payment required"}))
+
+    with pytest.raises(LoaderError, match=r"Firecrawl API error \(402\): Payment required"):
+        asyncio.run(FirecrawlLoader(client=client).load("https://example.com"))
+
+
+def test_batch_scrape_polls_until_completed_and_follows_pages() -> None:
+    stub = StubFirecrawl(batch_statuses=("scraping", "completed"))
+    urls = ["https://a.example", "https://b.example", "https://c.example"]
+    api = FirecrawlClient("test-key", api_url="https://firecrawl.test", client=_client(stub), poll_interval=0)
+
+    results = asyncio.run(api.batch_scrape(urls))
 
-    loader = FirecrawlLoader(timeout=123)
-    content = loader.load_sync("https://example.com")
+    assert results == {url: f"# batch {url}" for url in urls}
+    assert stub.paths() == [
+        "/v1/batch/scrape",
+        "/v1/batch/scrape/job-1",
+        "/v1/batch/scrape/job-1",
+        "/v1/batch/scrape/job-1/page-2",
+    ]
 
-    assert content == "# ok"
-    assert loader.app.called == "scrape_url:https://example.com:['markdown']:123"
 
+def test_batch_scrape_raises_when_job_fails() -> None:
+    stub = StubFirecrawl(batch_statuses=("failed",))
+    api = FirecrawlClient("test-key", api_url="https://firecrawl.test", client=_client(stub), poll_interval=0)
 
-def test_firecrawl_loader_falls_back_to_scrape(monkeypatch: pytest.MonkeyPatch) -> None:
-    class FakeApp:
-        def __init__(self, api_key: str) -> None:
-            self.api_key = api_key
-            self.called = ""
+    with pytest.raises(LoaderError, match="batch scrape failed"):
+        asyncio.run(api.batch_scrape(["https://a.example", "https://b.example"]))
 
-        def scrape(self, url: str, formats: list[str], timeout: int | None) -> object:
-            self.called = f"scrape:{url}:{formats}:{timeout}"
-            return SimpleNamespace(markdown="# fallback")
 
+def test_load_urls_batches_firecrawl_pipeline_urls(monkeypatch: pytest.MonkeyPatch) -> None:
     monkeypatch.setenv("FIRECRAWL_API_KEY", "test-key")
-    monkeypatch.setattr("kabigon.loaders.firecrawl.FirecrawlApp", FakeApp)
+    monkeypatch.setenv("FIRECRAWL_API_URL", "https://firecrawl.test")
+    monkeypatch.setattr(firecrawl, "BATCH_POLL_INTERVAL", 0)
+    stub = StubFirecrawl(batch_statuses=("scraping", "completed"))
+    monkeypatch.setattr(http_client, "create_http_client", lambda config=None: _client(stub))
+    urls = [f"https://openai.com/index/post-{i}" for i in range(3)]
 
-    loader = FirecrawlLoader(timeout=456)
-    content = loader.load_sync("https://example.com")
+    results = batch.load_urls_sync(urls)
 
-    assert content == "# fallback"
-    assert loader.app.called == "scrape:https://example.com:['markdown']:456"
+    assert [result.text for result in results] == [f"# batch {url}" for url in urls]
+    assert stub.batch_urls == urls
+    assert stub.paths().count("/v1/batch/scrape") == 1
+    assert "/v1/scrape" not in stub.paths()
 
 
-def test_firecrawl_loader_raises_without_api_key(monkeypatch: pytest.MonkeyPatch) -> None:
-    monkeypatch.delenv("FIRECRAWL_API_KEY", raising=False)
-    with pytest.raises(FirecrawlAPIKeyNotSetError):
-        FirecrawlLoader()
+def test_load_urls_scrapes_individually_when_batch_job_never_completes(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("FIRECRAWL_API_KEY", "test-key")
+    monkeypatch.setenv("FIRECRAWL_API_URL", "https://firecrawl.test")
+    monkeypatch.setattr(firecrawl, "BATCH_POLL_INTERVAL", 0.01)
+    monkeypatch.setattr(firecrawl, "BATCH_TIMEOUT", 0.1)
+    stub = StubFirecrawl(batch_statuses=("scraping",))
+    monkeypatch.setattr(http_client, "create_http_client", lambda config=None: _client(stub))
+    urls = [f"https://openai.com/index/post-{i}" for i in range(2)]
 
+    results = batch.load_urls_sync(urls)
 
-def test_firecrawl_loader_raises_when_no_markdown(monkeypatch: pytest.MonkeyPatch) -> None:
-    class FakeApp:
-        def __init__(self, api_key: str) -> None:
-            self.api_key = api_key
+    assert [result.text for result in results] == [f"# single {url}" for url in urls]
+    assert stub.paths().count("/v1/scrape") == 2
 
-        def scrape(self, url: str, formats: list[str], timeout: int | None) -> object:
-            return SimpleNamespace(success=True)
 
+def test_load_urls_scrapes_single_firecrawl_url_directly(monkeypatch: pytest.MonkeyPatch) -> None:
     monkeypatch.setenv("FIRECRAWL_API_KEY", "test-key")
-    monkeypatch.setattr("kabigon.loaders.firecrawl.FirecrawlApp", FakeApp)
+    monkeypatch.setenv("FIRECRAWL_API_URL", "https://firecrawl.test")
+    stub = StubFirecrawl()
+    monkeypatch.setattr(http_client, "create_http_client", lambda config=None: _client(stub))
 
-    loader = FirecrawlLoader()
-    with pytest.raises(LoaderError, match="did not include markdown"):
-        loader.load_sync("https://example.com")
+    [result] = batch.load_urls_sync(["https://openai.com/index/post"])
+
+    assert result.text == "# single https://openai.com/index/post"
+    assert stub.paths() == ["/v1/scrape"]
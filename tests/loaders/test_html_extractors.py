@@ -0,0 +1,37 @@
+from kabigon.loaders.html_extractors import SubtreeHTMLExtractor
+from kabigon.loaders.html_extractors import extract_first_tag_subtree
+
+
+def test_extract_first_tag_subtree_prefers_priority_over_document_order() -> None:
+    html = "<body><article>related</article><div><main><p>primary</p></main></div></body>"
+
+    assert extract_first_tag_subtree(html, ("main", "article")) == "<main><p>primary</p></main>"
+    assert extract_first_tag_subtree(html, ("article", "main")) == "<article>related</article>"
+
+
+def test_extract_first_tag_subtree_captures_nested_candidates() -> None:
+    html = "<article><h1>Title</h1><main><p>Body</p></main></article>"
+
+    assert extract_first_tag_subtree(html, ("main", "article")) == "<main><p>Body</p></main>"
+    assert extract_first_tag_subtree(html, ("section", "article")) == html
+
+
+def test_extract_first_tag_subtree_drops_whole_ignored_regions() -> None:
+    html = "<main><noscript><div>hidden</div></noscript><p>shown</p></main><p>after</p>"
+
+    assert extract_first_tag_subtree(html, ("main",), ignored_tags={"noscript"}) == "<main><p>shown</p></main>"
+
+
+def test_subtree_extractor_stops_once_first_priority_subtree_closes() -> None:
+    seen: list[str] = []
+
+    class RecordingExtractor(SubtreeHTMLExtractor):
+        def handle_data(self, data: str) -> None:
+            seen.append(data)
+            super().handle_data(data)
+
+    parser = RecordingExtractor(("main", "article"))
+    parser.feed("<article>early</article><main>keep</main><p>after</p>")
+
+    assert parser.get_html() == "<main>keep</main>"
+    assert seen == ["early", "keep"]
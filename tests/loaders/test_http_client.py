@@ -0,0 +1,85 @@
+import asyncio
+import logging
+
+import httpx
+
+from kabigon.loaders import http_client
+from kabigon.loaders.http_client import HttpClientConfig
+from kabigon.loaders.http_client import borrow_http_client
+from kabigon.loaders.http_client import http_client_session
+
+
+def test_borrow_http_client_reuses_session_client() -> None:
+    async def run() -> tuple[httpx.AsyncClient, httpx.AsyncClient, httpx.AsyncClient]:
+        async with (
+            http_client_session() as session_client,
+            borrow_http_client() as first,
+            borrow_http_client() as second,
+        ):
+            return session_client, first, second
+
+    session_client, first, second = asyncio.run(run())
+
+    assert first is session_client
+    assert second is session_client
+    assert session_client.is_closed
+
+
+def test_nested_http_client_session_reuses_outer_client() -> None:
+    async def run() -> bool:
+        async with http_client_session() as outer, http_client_session() as inner:
+            return inner is outer
+
+    assert asyncio.run(run()) is True
+
+
+def test_borrow_http_client_prefers_injected_client() -> None:
+    async def run() -> bool:
+        async with httpx.AsyncClient() as injected, http_client_session(), borrow_http_client(injected) as borrowed:
+            return borrowed is injected
+
+    assert asyncio.run(run()) is True
+
+
+def test_borrow_http_client_without_session_closes_short_lived_client() -> None:
+    async def run() -> httpx.AsyncClient:
+        async with borrow_http_client() as client:
+            assert not client.is_closed
+            return client
+
+    assert asyncio.run(run()).is_closed
+
+
+def test_create_http_client_applies_limits(monkeypatch) -> None:
+    captured: dict[str, object] = {}
+
+    class RecordingClient:
+        def __init__(self, **kwargs: object) -> None:
+            captured.update(kwargs)
+
+    monkeypatch.setattr(http_client.httpx, "AsyncClient", RecordingClient)
+    monkeypatch.setattr(http_client, "_http2_available", lambda: False)
+
+    http_client.create_http_client(HttpClientConfig(max_connections=7, timeout=9.0))
+
+    limits = captured["limits"]
+    assert isinstance(limits, httpx.Limits)
+    assert limits.max_connections == 7
+    assert captured["timeout"] == 9.0
+    assert captured["http2"] is False
+
+
+def test_create_http_client_warns_once_when_http2_is_unavailable(monkeypatch, caplog) -> None:
+    captured: list[object] = []
+    monkeypatch.setattr(http_client.httpx, "AsyncClient", lambda **kwargs: captured.append(kwargs["http2"]))
+    monkeypatch.setattr(http_client, "_http2_available", lambda: False)
+    http_client._warn_http2_unavailable.cache_clear()
+
+    with caplog.at_level(logging.WARNING, logger=http_client.__name__):
+        http_client.create_http_client(HttpClientConfig(http2=True))
+        http_client.create_http_client(HttpClientConfig(http2=True))
+
+    assert captured == [False, False]
+    assert [record.message for record in caplog.records if "HTTP/2" in record.message] == [
+        "[HttpClient] HTTP/2 is configured but the h2 package is missing; falling back to HTTP/1.1"
+    ]
@@ -88,6 +88,9 @@ def test_ltn_loader_uses_ltn_article_container(monkeypatch: pytest.MonkeyPatch)
             return
 
     class MockAsyncClient:
+        def __init__(self, **_: object) -> None:
+            return None
+
         async def __aenter__(self):
             return self
 
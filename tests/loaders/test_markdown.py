@@ -0,0 +1,144 @@
+import pytest
+
+from kabigon.loaders import utils
+from kabigon.loaders.markdown import MarkdownConverter
+from kabigon.loaders.markdown import convert_html
+from kabigon.loaders.utils import html_to_markdown
+
+
+def test_convert_html_renders_blocks_and_inline_formatting() -> None:
+    html = """
+    <html><head><title>Page</title><style>.a {}</style><script>var x = 1;</script></head>
+    <body>
+      <h1>Title</h1><h2>Sub</h2><h3>Third</h3>
+      <p>Hello <b>bold</b> <i>it</i> <a href="/x">link</a> <img src="y.png" alt="z"> <code>a  b</code></p>
+      <ul><li>one</li><li>two<ul><li>nested</li></ul></li></ul>
+      <ol start="3"><li>c</li><li>d</li></ol>
+      <blockquote><p>quote</p></blockquote>
+      <p>a &amp; b<br>next</p><hr>
+    </body></html>
+    """
+
+    assert convert_html(html).splitlines() == [
+        "Page",
+        "Title",
+        "=====",
+        "Sub",
+        "---",
+        "### Third",
+        "Hello **bold** *it* link `a b`",
+        "* one",
+        "* two",
+        "+ nested",
+        "3. c",
+        "4. d",
+        "> quote",
+        "a & b",
+        "next",
+        "---",
+    ]
+
+
+def test_convert_html_keeps_pre_lines_and_escapes_text() -> None:
+    html = "<p>**star** _u_</p><pre><code>x = 1\n\n  y = 2</code></pre>"
+
+    assert convert_html(html).splitlines() == [r"\*\*star\*\* \_u\_", "```", "x = 1", "y = 2", "```"]
+
+
+def test_convert_html_renders_tables() -> None:
+    html = (
+        "<table><tr><th>A</th><th>B</th></tr><tr><td>1<br>x</td><td><p>2</p></td></tr></table>"
+        "<table><tr><td>3</td><td>4</td></tr></table>"
+    )
+
+    assert convert_html(html).splitlines() == [
+        "| A | B |",
+        "| --- | --- |",
+        "| 1 x | 2 |",
+        "|  |  |",
+        "| --- | --- |",
+        "| 3 | 4 |",
+    ]
+
+
+def test_convert_html_moves_whitespace_outside_emphasis_and_drops_empty() -> None:
+    assert convert_html("<p>a<b> spaced </b>end<b></b><em>  </em></p>") == "a **spaced** end"
+
+
+def test_markdown_converter_accepts_chunked_input() -> None:
+    html = "<p>Hello <b>world</b></p><ul><li>item</li></ul>"
+    converter = MarkdownConverter()
+    for index in range(0, len(html), 3):
+        converter.feed(html[index : index + 3])
+    converter.close()
+
+    assert converter.markdown() == convert_html(html)
+
+
+def test_html_to_markdown_decodes_bytes_across_chunk_boundaries(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(utils, "DECODE_CHUNK_SIZE", 5)
+    html = "<html><body><p>自由時報 新聞內容</p></body></html>"
+
+    assert html_to_markdown(html.encode("utf-8")) == "自由時報 新聞內容"
+
+
+def _fail_detection(content: bytes) -> str:
+    raise AssertionError("statistical detection should not run")
+
+
+def test_html_to_markdown_trusts_declared_encoding(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(utils, "_detect_encoding", _fail_detection)
+    html = "<html><body><p>自由時報 新聞內容</p></body></html>"
+
+    assert html_to_markdown(html.encode("big5"), encoding="Big5") == "自由時報 新聞內容"
+
+
+def test_html_to_markdown_sniffs_meta_charset(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(utils, "_detect_encoding", _fail_detection)
+    html = '<html><head><meta http-equiv="Content-Type" content="text/html; charset=shift_jis"></head>'
+    html += "<body><p>日本語のページ</p></body></html>"
+
+    assert html_to_markdown(html.encode("shift_jis")) == "日本語のページ"
+
+
+def test_html_to_markdown_falls_back_to_detection_when_decoding_fails(monkeypatch: pytest.MonkeyPatch) -> None:
+    detected: list[bytes] = []
+
+    def detect(content: bytes) -> str:
+        detected.append(content)
+        return "cp1252"
+
+    monkeypatch.setattr(utils, "_detect_encoding", detect)
+    html = "<html><body><p>Café “quoted”</p></body></html>".encode("cp1252")
+
+    assert html_to_markdown(html, encoding="utf-8") == "Café “quoted”"
+    assert detected == [html]
+
+
+def test_candidate_encodings_follow_html_precedence() -> None:
+    meta = b'<meta charset="ISO-8859-1"><p>x</p>'
+
+    assert utils._candidate_encodings(meta, "big5") == ["big5", "iso8859-1", "utf-8"]
+    assert utils._candidate_encodings(meta, "not-a-charset") == ["iso8859-1", "utf-8"]
+    assert utils._candidate_encodings(b'\xef\xbb\xbf<meta charset="big5">', "big5") == ["utf-8-sig"]
+    assert utils._candidate_encodings(b'<meta charset="utf-16">') == ["utf-8"]
+
+
+@pytest.mark.parametrize(
+    ("encoding", "text"),
+    [
+        ("big5", "自由時報即時新聞 台北市政府今天宣布新的交通政策"),
+        ("gb18030", "新华社北京电 国务院总理今天主持召开国务院常务会议"),
+        ("shift_jis", "日本語のニュース記事の本文です。東京都は新しい政策を発表しました。"),
+    ],
+)
+def test_html_to_markdown_detects_charset_behind_large_ascii_head(encoding: str, text: str) -> None:
+    # No declared charset, and an inline script fills the whole detection sample with ASCII.
+    head = "<html><head><script>" + "var x = 1;\n" * 8000 + "</script></head><body>"
+    html = (head + f"<p>{text}</p>" * 5 + "</body></html>").encode(encoding)
+    assert html[: utils.DETECTION_SAMPLE_SIZE].isascii()
+
+    markdown = html_to_markdown(html)
+
+    assert text in markdown
+    assert "�" not in markdown
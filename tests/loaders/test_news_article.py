@@ -67,6 +67,9 @@ def test_load_news_article_prefers_json_ld_body(monkeypatch: pytest.MonkeyPatch)
             return
 
     class MockAsyncClient:
+        def __init__(self, **_: object) -> None:
+            return None
+
         async def __aenter__(self):
             return self
 
@@ -99,6 +102,9 @@ def test_load_news_article_rejects_non_html(monkeypatch: pytest.MonkeyPatch) ->
             return
 
     class MockAsyncClient:
+        def __init__(self, **_: object) -> None:
+            return None
+
         async def __aenter__(self):
             return self
 
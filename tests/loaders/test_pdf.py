@@ -0,0 +1,150 @@
+import asyncio
+import io
+import itertools
+from collections.abc import AsyncIterator
+from pathlib import Path
+
+import httpx
+import pytest
+from pypdf import PdfWriter
+from pypdf.generic import ContentStream
+from pypdf.generic import DictionaryObject
+from pypdf.generic import NameObject
+
+from kabigon.core.errors import LoaderContentError
+from kabigon.core.errors import LoaderNotApplicableError
+from kabigon.loaders import pdf
+from kabigon.loaders.pdf import PDFLoader
+from kabigon.loaders.pdf import read_pdf_content
+
+
+def _make_pdf(page_count: int) -> bytes:
+    writer = PdfWriter()
+    for number in range(1, page_count + 1):
+        page = writer.add_blank_page(612, 792)
+        font = DictionaryObject(
+            {
+                NameObject("/Type"): NameObject("/Font"),
+                NameObject("/Subtype"): NameObject("/Type1"),
+                NameObject("/BaseFont"): NameObject("/Helvetica"),
+            }
+        )
+        page[NameObject("/Resources")] = DictionaryObject(
+            {NameObject("/Font"): DictionaryObject({NameObject("/F1"): font})}
+        )
+        stream = ContentStream(None, writer)
+        stream.set_data(f"BT /F1 12 Tf 72 720 Td (Page {number}) Tj ET".encode())
+        page.replace_contents(stream)
+
+    buffer = io.BytesIO()
+    writer.write(buffer)
+    return buffer.getvalue()
+
+
+def test_read_pdf_content_extracts_pages_in_order() -> None:
+    assert read_pdf_content(io.BytesIO(_make_pdf(3))) == "Page 1\nPage 2\nPage 3"
+
+
+def test_read_pdf_content_honours_page_range_and_max_pages() -> None:
+    data = _make_pdf(6)
+
+    assert read_pdf_content(io.BytesIO(data), pages=range(2, 6)) == "Page 3\nPage 4\nPage 5\nPage 6"
+    assert read_pdf_content(io.BytesIO(data), pages=range(1, 6), max_pages=2) == "Page 2\nPage 3"
+    assert read_pdf_content(io.BytesIO(data), max_pages=1) == "Page 1"
+
+
+def test_read_pdf_content_parallel_matches_serial(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    monkeypatch.setattr(pdf, "PARALLEL_MIN_PAGES", 4)
+    monkeypatch.setattr(pdf, "MIN_PAGES_PER_TASK", 2)
+    monkeypatch.setattr(pdf.os, "cpu_count", lambda: 2)
+    path = tmp_path / "report.pdf"
+    path.write_bytes(_make_pdf(9))
+
+    parallel = read_pdf_content(path)
+    serial = read_pdf_content(path, parallel=False)
+
+    assert parallel == serial
+    assert parallel.splitlines() == [f"Page {number}" for number in range(1, 10)]
+
+
+def test_page_chunks_cover_selection_in_order() -> None:
+    chunks = pdf._page_chunks(range(3, 40), workers=2)
+
+    assert chunks[0][0] == 3
+    assert chunks[-1][1] == 40
+    assert all(previous[1] == current[0] for previous, current in itertools.pairwise(chunks))
+
+
+def test_pdf_loader_reads_local_file_with_page_limit(tmp_path: Path) -> None:
+    path = tmp_path / "report.pdf"
+    path.write_bytes(_make_pdf(4))
+
+    assert asyncio.run(PDFLoader(max_pages=2).load(str(path))) == "Page 1\nPage 2"
+
+
+class StreamedBody(httpx.AsyncByteStream):
+    def __init__(self, chunks: list[bytes]) -> None:
+        self.chunks = chunks
+        self.sent = 0
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        for chunk in self.chunks:
+            self.sent += 1
+            yield chunk
+
+
+def _loader_for(response: httpx.Response, max_bytes: int = pdf.DEFAULT_MAX_PDF_BYTES) -> PDFLoader:
+    client = httpx.AsyncClient(transport=httpx.MockTransport(lambda request: response))
+    return PDFLoader(client=client, max_bytes=max_bytes)
+
+
+def test_pdf_loader_streams_remote_pdf() -> None:
+    data = _make_pdf(2)
+    body = StreamedBody([data[:100], data[100:]])
+    response = httpx.Response(200, headers={"content-type": "application/pdf"}, stream=body)
+
+    assert asyncio.run(_loader_for(response).load("https://example.com/report.pdf")) == "Page 1\nPage 2"
+    assert body.sent == 2
+
+
+def test_pdf_loader_rejects_non_pdf_before_reading_body() -> None:
+    body = StreamedBody([b"<html></html>"])
+    response = httpx.Response(200, headers={"content-type": "text/html"}, stream=body)
+
+    with pytest.raises(LoaderNotApplicableError, match="Not a PDF"):
+        asyncio.run(_loader_for(response).load("https://example.com/report.pdf"))
+    assert body.sent == 0
+
+
+def test_pdf_loader_rejects_declared_oversized_pdf_before_reading_body() -> None:
+    body = StreamedBody([b"x" * 10])
+    response = httpx.Response(
+        200,
+        headers={"content-type": "application/pdf", "content-length": "5000"},
+        stream=body,
+    )
+
+    with pytest.raises(LoaderContentError, match="exceeds size limit"):
+        asyncio.run(_loader_for(response, max_bytes=1000).load("https://example.com/report.pdf"))
+    assert body.sent == 0
+
+
+def test_pdf_loader_stops_streaming_past_max_bytes() -> None:
+    body = StreamedBody([b"x" * 600, b"x" * 600, b"x" * 600])
+    response = httpx.Response(200, headers={"content-type": "application/pdf"}, stream=body)
+
+    with pytest.raises(LoaderContentError, match="exceeds size limit"):
+        asyncio.run(_loader_for(response, max_bytes=1000).load("https://example.com/report.pdf"))
+    assert body.sent == 2
+
+
+def test_worker_source_spills_large_streams_to_a_named_file(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(pdf, "SPOOL_MAX_MEMORY_BYTES", 4)
+
+    with pdf._worker_source(io.BytesIO(b"large pdf")) as source:
+        assert isinstance(source, str)
+        assert Path(source).read_bytes() == b"large pdf"
+    assert not Path(source).exists()
+
+    with pdf._worker_source(io.BytesIO(b"pdf")) as source:
+        assert source == b"pdf"
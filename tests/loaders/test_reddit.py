@@ -77,7 +77,7 @@ class RssOnlyClient:
     async def __aexit__(self, _exc_type: object, _exc: object, _tb: object) -> None:
         return None
 
-    async def get(self, url: str, headers: dict[str, str] | None = None) -> RedditResponse:
+    async def get(self, url: str, headers: dict[str, str] | None = None, **_: object) -> RedditResponse:
         assert url == "https://www.reddit.com/r/python/comments/abc/demo/.rss"
         assert headers is None
         return RedditResponse(url)
@@ -93,7 +93,7 @@ class Rss403ThenJsonClient:
     async def __aexit__(self, _exc_type: object, _exc: object, _tb: object) -> None:
         return None
 
-    async def get(self, url: str, headers: dict[str, str] | None = None) -> RedditResponse:
+    async def get(self, url: str, headers: dict[str, str] | None = None, **_: object) -> RedditResponse:
         if url.endswith("/.rss"):
             assert headers is None
             return RedditResponse(url, status_code=403)
@@ -114,7 +114,7 @@ class RssAndJson403Client:
     async def __aexit__(self, _exc_type: object, _exc: object, _tb: object) -> None:
         return None
 
-    async def get(self, url: str, headers: dict[str, str] | None = None) -> RedditResponse:
+    async def get(self, url: str, headers: dict[str, str] | None = None, **_: object) -> RedditResponse:
         if url.endswith(".json"):
             assert headers is not None
             assert headers["Accept"] == "application/json"
@@ -178,3 +178,101 @@ def test_reddit_loader_uses_old_reddit_when_rss_and_json_http_error(monkeypatch:
 
     result = asyncio.run(RedditLoader().load("https://www.reddit.com/r/python/comments/abc/demo/"))
     assert result == "fallback:https://www.reddit.com/r/python/comments/abc/demo/"
+
+
+def _install_strategies(
+    monkeypatch: pytest.MonkeyPatch,
+    calls: list[str],
+    *,
+    rss: str | None,
+    json: str | None,
+    rss_delay: float = 0.0,
+    json_delay: float = 0.0,
+) -> None:
+    def strategy(name: str, result: str | None, delay: float):
+        async def load(_self: RedditLoader, url: str) -> str:
+            calls.append(f"start:{name}")
+            await asyncio.sleep(delay)
+            if result is None:
+                raise reddit.LoaderContentError("RedditLoader", url, f"{name} failed")
+            calls.append(f"done:{name}")
+            return result
+
+        return load
+
+    monkeypatch.setattr(RedditLoader, "_load_via_rss", strategy("rss", rss, rss_delay))
+    monkeypatch.setattr(RedditLoader, "_load_via_json", strategy("json", json, json_delay))
+    monkeypatch.setattr(RedditLoader, "_load_via_old_reddit", strategy("old_reddit", "old", 0.0))
+
+
+def test_reddit_loader_concurrent_mode_prefers_json_without_waiting_for_rss(monkeypatch: pytest.MonkeyPatch) -> None:
+    calls: list[str] = []
+    _install_strategies(monkeypatch, calls, rss="rss", json="json", rss_delay=5.0)
+
+    result = asyncio.run(RedditLoader(concurrent=True).load("https://www.reddit.com/r/python/comments/abc/demo/"))
+
+    assert result == "json"
+    assert calls == ["start:json", "start:rss", "done:json"]
+
+
+def test_reddit_loader_concurrent_mode_uses_rss_when_json_fails(monkeypatch: pytest.MonkeyPatch) -> None:
+    calls: list[str] = []
+    _install_strategies(monkeypatch, calls, rss="rss", json=None, json_delay=0.01)
+
+    result = asyncio.run(RedditLoader(concurrent=True).load("https://www.reddit.com/r/python/comments/abc/demo/"))
+
+    assert result == "rss"
+    assert "start:old_reddit" not in calls
+
+
+def test_reddit_loader_concurrent_mode_does_not_wait_for_hanging_json(monkeypatch: pytest.MonkeyPatch) -> None:
+    calls: list[str] = []
+    _install_strategies(monkeypatch, calls, rss="rss", json="json", json_delay=60.0)
+    monkeypatch.setattr(reddit, "_FEED_GRACE_PERIOD", 0.05)
+
+    async def run() -> str:
+        return await asyncio.wait_for(
+            RedditLoader(concurrent=True).load("https://www.reddit.com/r/python/comments/abc/demo/"),
+            timeout=5.0,
+        )
+
+    result = asyncio.run(run())
+
+    assert result == "rss"
+    assert "done:json" not in calls
+
+
+def test_reddit_loader_concurrent_mode_prefers_json_within_grace_period(monkeypatch: pytest.MonkeyPatch) -> None:
+    calls: list[str] = []
+    _install_strategies(monkeypatch, calls, rss="rss", json="json", json_delay=0.05)
+    monkeypatch.setattr(reddit, "_FEED_GRACE_PERIOD", 5.0)
+
+    result = asyncio.run(RedditLoader(concurrent=True).load("https://www.reddit.com/r/python/comments/abc/demo/"))
+
+    assert result == "json"
+    assert calls == ["start:json", "start:rss", "done:rss", "done:json"]
+
+
+def test_reddit_loader_concurrent_mode_escalates_to_browser_after_both_fail(monkeypatch: pytest.MonkeyPatch) -> None:
+    calls: list[str] = []
+    _install_strategies(monkeypatch, calls, rss=None, json=None)
+
+    result = asyncio.run(RedditLoader(concurrent=True).load("https://www.reddit.com/r/python/comments/abc/demo/"))
+
+    assert result == "old"
+    assert calls[-1] == "done:old_reddit"
+
+
+def test_reddit_loader_runs_only_selected_strategies(monkeypatch: pytest.MonkeyPatch) -> None:
+    calls: list[str] = []
+    _install_strategies(monkeypatch, calls, rss="rss", json=None)
+    loader = RedditLoader(strategies=["json"])
+
+    with pytest.raises(reddit.LoaderContentError, match="json failed"):
+        asyncio.run(loader.load("https://www.reddit.com/r/python/comments/abc/demo/"))
+    assert calls == ["start:json"]
+
+
+def test_reddit_loader_rejects_empty_strategies() -> None:
+    with pytest.raises(ValueError, match="at least one strategy"):
+        RedditLoader(strategies=[])
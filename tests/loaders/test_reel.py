@@ -1,5 +1,9 @@
+import asyncio
+import time
+
 import pytest
 
+from kabigon.core.errors import LoaderError
 from kabigon.core.errors import LoaderNotApplicableError
 from kabigon.core.loader import Loader
 from kabigon.loaders.reel import ReelLoader
@@ -18,3 +22,72 @@ def test_reel_loader_checks_source_applicability_before_heavy_setup() -> None:
 
     with pytest.raises(LoaderNotApplicableError):
         loader.load_sync("https://example.com/not-a-reel")
+
+
+class FakeLoader(Loader):
+    def __init__(self, text: str | Exception, started: list[str], delay: float = 0.05) -> None:
+        self.text = text
+        self.started = started
+        self.delay = delay
+
+    async def load(self, url: str) -> str:
+        self.started.append(str(self.text))
+        await asyncio.sleep(self.delay)
+        if isinstance(self.text, Exception):
+            raise self.text
+        return self.text
+
+
+REEL_URL = "https://www.instagram.com/reel/abc123/"
+
+
+def test_reel_loader_runs_audio_and_html_concurrently() -> None:
+    started: list[str] = []
+    loader = ReelLoader(
+        ytdlp_loader_factory=lambda: FakeLoader("transcript", started, delay=0.2),
+        httpx_loader_factory=lambda: FakeLoader("page", started, delay=0.2),
+    )
+
+    start = time.perf_counter()
+    content = loader.load_sync(REEL_URL)
+
+    assert content == "transcript\n\npage"
+    assert time.perf_counter() - start < 0.35
+
+
+def test_reel_loader_returns_partial_result_when_one_side_fails() -> None:
+    started: list[str] = []
+    loader = ReelLoader(
+        ytdlp_loader_factory=lambda: FakeLoader(RuntimeError("no audio"), started),
+        httpx_loader_factory=lambda: FakeLoader("page", started),
+    )
+
+    assert loader.load_sync(REEL_URL) == "page"
+
+
+def test_reel_loader_raises_when_both_sides_fail() -> None:
+    started: list[str] = []
+    loader = ReelLoader(
+        ytdlp_loader_factory=lambda: FakeLoader(RuntimeError("no audio"), started),
+        httpx_loader_factory=lambda: FakeLoader(RuntimeError("blocked"), started),
+    )
+
+    with pytest.raises(LoaderError, match=r"audio: RuntimeError: no audio"):
+        loader.load_sync(REEL_URL)
+
+
+def test_reel_loader_builds_sub_loaders_once() -> None:
+    built: list[str] = []
+    started: list[str] = []
+
+    def factory(text: str) -> Loader:
+        built.append(text)
+        return FakeLoader(text, started, delay=0)
+
+    loader = ReelLoader(
+        ytdlp_loader_factory=lambda: factory("transcript"), httpx_loader_factory=lambda: factory("page")
+    )
+    loader.load_sync(REEL_URL)
+    loader.load_sync(REEL_URL)
+
+    assert built == ["transcript", "page"]
@@ -0,0 +1,78 @@
+from pathlib import Path
+from types import SimpleNamespace
+from typing import ClassVar
+
+import pytest
+
+from kabigon.loaders import transcript_store
+from kabigon.loaders import youtube
+from kabigon.loaders.transcript_store import TRANSCRIPT_DIR_ENV
+from kabigon.loaders.transcript_store import TranscriptSource
+from kabigon.loaders.transcript_store import TranscriptStore
+from kabigon.loaders.transcript_store import configure_transcript_store
+from kabigon.loaders.transcript_store import default_transcript_store
+from kabigon.loaders.youtube import YoutubeLoader
+
+
+class FakeTranscriptApi:
+    fetched: ClassVar[list[tuple[str, list[str]]]] = []
+
+    def fetch(self, video_id: str, languages: list[str]) -> SimpleNamespace:
+        self.fetched.append((video_id, languages))
+        return SimpleNamespace(snippets=[SimpleNamespace(text=" hello "), SimpleNamespace(text="world")])
+
+
+def test_transcript_store_keys_on_video_source_and_variant(tmp_path: Path) -> None:
+    store = TranscriptStore(tmp_path)
+    store.put("dQw4w9WgXcQ", TranscriptSource.WHISPER, "tiny", "tiny text")
+
+    assert store.get("dQw4w9WgXcQ", TranscriptSource.WHISPER, "tiny") == "tiny text"
+    assert store.get("dQw4w9WgXcQ", TranscriptSource.WHISPER, "base") is None
+    assert store.get("dQw4w9WgXcQ", TranscriptSource.CAPTIONS, "tiny") is None
+    assert store.get("DQW4W9WGXCQ", TranscriptSource.WHISPER, "tiny") is None
+
+    path = store.path_for("dQw4w9WgXcQ", TranscriptSource.WHISPER, "tiny")
+    assert path.parent.parent == tmp_path
+    assert [p.name for p in path.parent.iterdir()] == [path.name]
+
+
+def test_youtube_loader_shares_stored_captions_across_url_variants(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    monkeypatch.setattr(FakeTranscriptApi, "fetched", [])
+    monkeypatch.setattr(youtube, "YouTubeTranscriptApi", FakeTranscriptApi)
+    loader = YoutubeLoader(languages=["en"], store=TranscriptStore(tmp_path))
+
+    results = [
+        loader.load_sync(url)
+        for url in (
+            "https://www.youtube.com/watch?v=dQw4w9WgXcQ",
+            "https://youtu.be/dQw4w9WgXcQ",
+            "https://m.youtube.com/watch?v=dQw4w9WgXcQ",
+            "https://music.youtube.com/watch?v=dQw4w9WgXcQ",
+        )
+    ]
+
+    assert results == ["hello\nworld"] * 4
+    assert FakeTranscriptApi.fetched == [("dQw4w9WgXcQ", ["en"])]
+
+    YoutubeLoader(languages=["ja"], store=TranscriptStore(tmp_path)).load_sync("https://youtu.be/dQw4w9WgXcQ")
+    assert len(FakeTranscriptApi.fetched) == 2
+
+
+def test_default_transcript_store_comes_from_configuration_or_environment(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    monkeypatch.setattr(transcript_store, "_default_store", None)
+    monkeypatch.delenv(TRANSCRIPT_DIR_ENV, raising=False)
+    assert default_transcript_store() is None
+
+    monkeypatch.setenv(TRANSCRIPT_DIR_ENV, str(tmp_path / "env"))
+    store = default_transcript_store()
+    assert store is not None
+    assert store.root == tmp_path / "env"
+
+    configure_transcript_store(tmp_path / "configured")
+    store = default_transcript_store()
+    assert store is not None
+    assert store.root == tmp_path / "configured"
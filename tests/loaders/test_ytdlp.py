@@ -0,0 +1,302 @@
+import subprocess
+import sys
+import threading
+import time
+from array import array
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from types import ModuleType
+
+import pytest
+
+from kabigon.core.errors import LoaderContentError
+from kabigon.loaders import ytdlp
+from kabigon.loaders.transcript_store import TranscriptSource
+from kabigon.loaders.transcript_store import TranscriptStore
+from kabigon.loaders.ytdlp import SAMPLE_RATE
+from kabigon.loaders.ytdlp import AudioMode
+from kabigon.loaders.ytdlp import WhisperEngine
+from kabigon.loaders.ytdlp import WhisperModelCache
+from kabigon.loaders.ytdlp import YtdlpLoader
+from kabigon.loaders.ytdlp import split_at_silence
+
+
+class FakeParameter:
+    def __init__(self, size: int) -> None:
+        self.size = size
+
+    def numel(self) -> int:
+        return self.size
+
+    def element_size(self) -> int:
+        return 1
+
+
+class FakeModel:
+    def __init__(self, name: str, size: int = 10) -> None:
+        self.name = name
+        self.size = size
+
+    def parameters(self) -> list[FakeParameter]:
+        return [FakeParameter(self.size)]
+
+    def transcribe(self, audio: object) -> dict[str, object]:
+        return {"text": f"transcript of {audio!r}"}
+
+
+class FakeWhisper(ModuleType):
+    def __init__(self, sizes: dict[str, int]) -> None:
+        super().__init__("whisper")
+        self.sizes = sizes
+        self.loaded: list[str] = []
+
+    def load_model(self, name: str) -> FakeModel:
+        self.loaded.append(name)
+        return FakeModel(name, self.sizes.get(name, 10))
+
+    def load_audio(self, path: str) -> str:
+        return path
+
+
+def _install_fake_whisper(monkeypatch: pytest.MonkeyPatch, sizes: dict[str, int] | None = None) -> list[str]:
+    whisper = FakeWhisper(sizes or {})
+    monkeypatch.setitem(sys.modules, "whisper", whisper)
+    return whisper.loaded
+
+
+def test_ytdlp_loaders_share_cached_whisper_model(monkeypatch: pytest.MonkeyPatch) -> None:
+    loaded = _install_fake_whisper(monkeypatch)
+    monkeypatch.setattr(ytdlp, "_model_cache", WhisperModelCache())
+
+    first = YtdlpLoader()
+    second = YtdlpLoader()
+
+    assert first.model is second.model
+    assert loaded == ["tiny"]
+
+
+def test_whisper_model_cache_evicts_least_recently_used(monkeypatch: pytest.MonkeyPatch) -> None:
+    loaded = _install_fake_whisper(monkeypatch)
+    cache = WhisperModelCache(max_models=2)
+
+    cache.get("tiny")
+    cache.get("base")
+    cache.get("tiny")
+    cache.get("small")
+
+    assert "tiny" in cache
+    assert "base" not in cache
+    assert loaded == ["tiny", "base", "small"]
+
+
+def test_whisper_model_cache_bounds_weight_bytes(monkeypatch: pytest.MonkeyPatch) -> None:
+    _install_fake_whisper(monkeypatch, sizes={"tiny": 40, "medium": 100})
+    cache = WhisperModelCache(max_models=4, max_bytes=120)
+
+    cache.get("tiny")
+    cache.get("medium")
+
+    assert "tiny" not in cache
+    assert "medium" in cache
+
+
+def test_preload_whisper_models_fills_cache(monkeypatch: pytest.MonkeyPatch) -> None:
+    loaded = _install_fake_whisper(monkeypatch)
+    monkeypatch.setattr(ytdlp, "_model_cache", WhisperModelCache())
+
+    ytdlp.preload_whisper_models(["tiny", "base"])
+    ytdlp.load_whisper_model("base")
+
+    assert loaded == ["tiny", "base"]
+
+
+class ConcurrencyTrackingModel(FakeModel):
+    def __init__(self, name: str) -> None:
+        super().__init__(name)
+        self.active = 0
+        self.max_active = 0
+        self._lock = threading.Lock()
+
+    def transcribe(self, audio: object) -> dict[str, object]:
+        with self._lock:
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        time.sleep(0.05)
+        with self._lock:
+            self.active -= 1
+        return super().transcribe(audio)
+
+
+def test_cached_whisper_model_transcribes_one_audio_at_a_time(monkeypatch: pytest.MonkeyPatch) -> None:
+    _install_fake_whisper(monkeypatch)
+    model = ConcurrencyTrackingModel("tiny")
+    monkeypatch.setattr(sys.modules["whisper"], "load_model", lambda name: model)
+    monkeypatch.setattr(ytdlp, "_model_cache", WhisperModelCache())
+    monkeypatch.setattr(ytdlp, "pcm_to_audio", lambda pcm: pcm)
+    monkeypatch.setattr(YtdlpLoader, "_load_pcm", lambda self, url: url.encode())
+    loaders = [YtdlpLoader(parallel=False), YtdlpLoader(parallel=False)]
+
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        texts = list(pool.map(lambda args: args[0]._transcribe(args[1]), zip(loaders, ["a", "b"], strict=True)))
+
+    assert texts == ["transcript of b'a'", "transcript of b'b'"]
+    assert model.max_active == 1
+
+
+def _record_ffmpeg(monkeypatch: pytest.MonkeyPatch) -> list[list[str]]:
+    commands: list[list[str]] = []
+
+    def run(command: list[str], **_: object) -> subprocess.CompletedProcess[bytes]:
+        commands.append(command)
+        return subprocess.CompletedProcess(command, 0, stdout=b"pcm", stderr=b"")
+
+    monkeypatch.setattr(ytdlp.subprocess, "run", run)
+    monkeypatch.setattr(ytdlp, "pcm_to_audio", lambda pcm: pcm)
+    return commands
+
+
+def test_ytdlp_loader_streams_audio_into_pcm(monkeypatch: pytest.MonkeyPatch) -> None:
+    _install_fake_whisper(monkeypatch)
+    commands = _record_ffmpeg(monkeypatch)
+    monkeypatch.delenv("FFMPEG_PATH", raising=False)
+    monkeypatch.setattr(
+        ytdlp,
+        "resolve_audio_stream",
+        lambda url: ("https://media.example/audio.webm", {"User-Agent": "test"}),
+    )
+    monkeypatch.setattr(ytdlp, "download_audio", lambda *_: pytest.fail("stream mode should not download"))
+
+    text = YtdlpLoader().load_sync("https://video.example/watch")
+
+    assert text == "transcript of b'pcm'"
+    [command] = commands
+    assert command[0] == "ffmpeg"
+    assert command[command.index("-i") + 1] == "https://media.example/audio.webm"
+    assert command[command.index("-headers") + 1] == "User-Agent: test\r\n"
+    assert command[command.index("-ar") + 1] == "16000"
+    assert command[-1] == "-"
+
+
+def test_ytdlp_loader_spills_to_temp_dir_when_streaming_fails(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+) -> None:
+    _install_fake_whisper(monkeypatch)
+    commands = _record_ffmpeg(monkeypatch)
+    spilled: list[Path] = []
+
+    def resolve_audio_stream(url: str) -> tuple[str, dict[str, str]]:
+        raise LoaderContentError("YtdlpLoader", url, "no direct URL")
+
+    def download_audio(url: str, directory: str) -> Path:
+        path = Path(directory) / "audio.m4a"
+        path.write_bytes(b"raw audio")
+        spilled.append(path)
+        return path
+
+    monkeypatch.setattr(ytdlp, "resolve_audio_stream", resolve_audio_stream)
+    monkeypatch.setattr(ytdlp, "download_audio", download_audio)
+
+    loader = YtdlpLoader(temp_dir=tmp_path)
+    assert loader.load_sync("https://video.example/watch") == "transcript of b'pcm'"
+
+    [path] = spilled
+    assert path.parent.parent == tmp_path
+    assert not path.exists()
+    assert commands[0][commands[0].index("-i") + 1] == str(path)
+
+
+def test_ytdlp_loader_spill_mode_skips_streaming(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    _install_fake_whisper(monkeypatch)
+    _record_ffmpeg(monkeypatch)
+    monkeypatch.setattr(ytdlp, "resolve_audio_stream", lambda url: pytest.fail("spill mode should not stream"))
+    monkeypatch.setattr(ytdlp, "download_audio", lambda url, directory: Path(directory) / "audio.opus")
+
+    loader = YtdlpLoader(audio_mode=AudioMode.SPILL, temp_dir=tmp_path)
+
+    assert loader.load_sync("https://video.example/watch") == "transcript of b'pcm'"
+
+
+def test_decode_pcm_reports_ffmpeg_failure(monkeypatch: pytest.MonkeyPatch) -> None:
+    def run(command: list[str], **_: object) -> subprocess.CompletedProcess[bytes]:
+        raise subprocess.CalledProcessError(1, command, stderr=b"Invalid data found")
+
+    monkeypatch.setattr(ytdlp.subprocess, "run", run)
+
+    with pytest.raises(LoaderContentError, match="Invalid data found"):
+        ytdlp.decode_pcm("audio.webm", url="https://video.example/watch")
+
+
+def test_ytdlp_loader_reuses_stored_whisper_transcripts(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    loaded = _install_fake_whisper(monkeypatch)
+    monkeypatch.setattr(ytdlp, "_model_cache", WhisperModelCache())
+    commands = _record_ffmpeg(monkeypatch)
+    monkeypatch.setattr(ytdlp, "resolve_audio_stream", lambda url: ("https://media.example/audio.webm", {}))
+    store = TranscriptStore(tmp_path)
+
+    first = YtdlpLoader(store=store).load_sync("https://www.youtube.com/watch?v=dQw4w9WgXcQ")
+    second = YtdlpLoader(store=store).load_sync("https://youtu.be/dQw4w9WgXcQ")
+
+    assert first == second == "transcript of b'pcm'"
+    assert len(commands) == 1
+    assert loaded == ["tiny"]
+    assert store.get("dQw4w9WgXcQ", TranscriptSource.WHISPER, "tiny") == first
+
+
+def _speech_with_pauses(*sections: tuple[float, bool]) -> bytes:
+    samples = array("h")
+    for seconds, loud in sections:
+        count = int(seconds * SAMPLE_RATE)
+        samples.extend([8000, -8000] * (count // 2) if loud else [0] * count)
+    return samples.tobytes()
+
+
+PAUSED_SPEECH = [(1.0, True), (0.2, False), (1.0, True), (0.2, False), (1.0, True)]
+
+
+def test_split_at_silence_cuts_inside_pauses() -> None:
+    pcm = _speech_with_pauses(*PAUSED_SPEECH)
+
+    chunks = split_at_silence(pcm, chunk_seconds=1.0, search_seconds=0.3)
+
+    assert b"".join(chunks) == pcm
+    assert len(chunks) == 3
+    first_cut = len(chunks[0]) // 2
+    second_cut = first_cut + len(chunks[1]) // 2
+    assert int(1.0 * SAMPLE_RATE) <= first_cut < int(1.2 * SAMPLE_RATE)
+    assert int(2.2 * SAMPLE_RATE) <= second_cut < int(2.4 * SAMPLE_RATE)
+    assert split_at_silence(pcm[:1000]) == [pcm[:1000]]
+
+
+def test_whisper_engine_stitches_chunk_transcripts_in_order(monkeypatch: pytest.MonkeyPatch) -> None:
+    _install_fake_whisper(monkeypatch)
+    monkeypatch.setattr(ytdlp, "_model_cache", WhisperModelCache())
+    monkeypatch.setattr(ytdlp, "pcm_to_audio", len)
+    pcm = _speech_with_pauses(*PAUSED_SPEECH)
+    chunks = split_at_silence(pcm, chunk_seconds=1.0)
+
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        text = WhisperEngine(chunk_seconds=1.0, executor=executor).transcribe(pcm)
+
+    assert text == " ".join(f"transcript of {len(chunk)}" for chunk in chunks)
+
+
+def test_ytdlp_loader_sends_long_audio_to_the_parallel_engine(monkeypatch: pytest.MonkeyPatch) -> None:
+    _install_fake_whisper(monkeypatch)
+    _record_ffmpeg(monkeypatch)
+    monkeypatch.setattr(ytdlp, "resolve_audio_stream", lambda url: ("https://media.example/audio.webm", {}))
+    monkeypatch.setattr(ytdlp, "PARALLEL_MIN_SECONDS", 0)
+    engines: list[str] = []
+
+    class RecordingEngine:
+        def __init__(self, model: str) -> None:
+            engines.append(model)
+
+        def transcribe(self, pcm: bytes) -> str:
+            return f"parallel {pcm!r}"
+
+    monkeypatch.setattr(ytdlp, "whisper_engine", RecordingEngine)
+
+    assert YtdlpLoader(model="base").load_sync("https://video.example/watch") == "parallel b'pcm'"
+    assert YtdlpLoader(parallel=False).load_sync("https://video.example/watch") == "transcript of b'pcm'"
+    assert engines == ["base"]
@@ -2,7 +2,12 @@ import pytest
 
 from kabigon.pipelines.catalog import ContentType
 from kabigon.pipelines.catalog import FallbackPolicy
+from kabigon.pipelines.catalog import PipelineMatcher
+from kabigon.pipelines.catalog import _match_pipeline_linear
+from kabigon.pipelines.catalog import match_catalog
 from kabigon.pipelines.catalog import match_pipeline
+from kabigon.sources.applicability import is_bbc_url
+from kabigon.sources.applicability import is_pdf_target
 
 
 def test_match_pipeline_youtube() -> None:
@@ -138,3 +143,58 @@ def test_match_pipeline_openai_web(url: str) -> None:
 
 def test_match_pipeline_developers_openai_is_not_openai_web() -> None:
     assert match_pipeline("https://developers.openai.com/codex/pricing") is None
+
+
+@pytest.mark.parametrize(
+    "url",
+    [
+        "https://WWW.PTT.CC/bbs/Gossiping/index.html",
+        "https://www.ptt.cc:443/bbs/Gossiping/index.html",
+        "https://X.com/user/status/1",
+        "https://youtu.be/dQw4w9WgXcQ",
+        "https://YOUTU.BE/dQw4w9WgXcQ",
+        "ftp://www.youtube.com/watch?v=dQw4w9WgXcQ",
+        "https://www.youtube.com/watch?v=short",
+        "https://www.instagram.com/reel/abc/",
+        "https://www.instagram.com/p/abc/",
+        "https://GitHub.com/a/b/blob/main/demo.pdf",
+        "https://github.com/a/b/blob/main/demo.pdf",
+        "https://bbc.com/news",
+        "https://news.bbc.com/a.pdf",
+        "https://notbbc.com/news",
+        "https://bbc.com.evil.test/news",
+        "https://edition.cnn.com:8080/world",
+        "https://news.ltn.com.tw/news/1",
+        "https://ltn.com.tw./news/1",
+        "https://help.openai.com/en/article",
+        "https://example.com/paper.PDF",
+        "https://example.com/paper.pdf;params",
+        "https://www.arxiv.org/pdf/2603.20617",
+        "/tmp/demo.pdf",
+        "",
+        "not-a-valid-url",
+    ],
+)
+def test_compiled_matcher_agrees_with_linear_walk(url: str) -> None:
+    assert match_pipeline(url) == _match_pipeline_linear(url)
+
+
+def test_pipeline_matcher_keeps_catalog_order_across_indexes() -> None:
+    # The GitHub host entry comes before the host-independent PDF entry.
+    matcher = PipelineMatcher()
+
+    github = matcher.match("https://github.com/a/b/blob/main/demo.pdf")
+    pdf = matcher.match("https://example.github.com/demo.pdf")
+
+    assert github is not None
+    assert github.name == "github"
+    assert pdf is not None
+    assert pdf.name == "pdf"
+
+
+def test_match_catalog_reports_every_matching_pipeline() -> None:
+    match = match_catalog("https://github.com/a/b/blob/main/demo.pdf")
+
+    assert [pipeline.name for pipeline in match.pipelines] == ["github", "pdf"]
+    assert match.accepts(is_pdf_target)
+    assert not match.accepts(is_bbc_url)
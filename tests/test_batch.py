@@ -0,0 +1,111 @@
+import asyncio
+
+import pytest
+
+from kabigon import batch
+from kabigon.core.errors import LoaderError
+
+
+class FakeLoadChain:
+    def __init__(self, url: str, tracker: dict[str, int], delay: float = 0.01) -> None:
+        self.url = url
+        self.tracker = tracker
+        self.delay = delay
+
+    async def load(self) -> str:
+        host = batch._host_key(self.url)
+        self.tracker["active"] += 1
+        self.tracker[host] = self.tracker.get(host, 0) + 1
+        self.tracker["max_active"] = max(self.tracker["max_active"], self.tracker["active"])
+        self.tracker[f"max:{host}"] = max(self.tracker.get(f"max:{host}", 0), self.tracker[host])
+        try:
+            await asyncio.sleep(self.delay)
+            if "fail" in self.url:
+                raise LoaderError(self.url, details=["fake: failed"])
+            return f"loaded {self.url}"
+        finally:
+            self.tracker["active"] -= 1
+            self.tracker[host] -= 1
+
+
+def _install_fake_chain(monkeypatch: pytest.MonkeyPatch) -> dict[str, int]:
+    tracker = {"active": 0, "max_active": 0}
+    monkeypatch.setattr(batch, "resolve_load_chain", lambda url, **_: FakeLoadChain(url, tracker))
+    return tracker
+
+
+def test_load_urls_returns_results_in_input_order(monkeypatch: pytest.MonkeyPatch) -> None:
+    _install_fake_chain(monkeypatch)
+    urls = [f"https://site{i}.example/page" for i in range(10)]
+
+    results = batch.load_urls_sync(urls, concurrency=3)
+
+    assert [result.url for result in results] == urls
+    assert [result.index for result in results] == list(range(10))
+    assert all(result.ok for result in results)
+    assert results[4].text == "loaded https://site4.example/page"
+
+
+def test_load_urls_keeps_failures_as_results(monkeypatch: pytest.MonkeyPatch) -> None:
+    _install_fake_chain(monkeypatch)
+
+    results = batch.load_urls_sync(["https://a.example/ok", "https://b.example/fail", "https://c.example/ok"])
+
+    assert [result.ok for result in results] == [True, False, True]
+    assert isinstance(results[1].error, LoaderError)
+    assert results[1].error.details == ["fake: failed"]
+    assert results[1].text is None
+
+
+def test_load_urls_reports_malformed_url_without_aborting_batch(monkeypatch: pytest.MonkeyPatch) -> None:
+    _install_fake_chain(monkeypatch)
+
+    results = batch.load_urls_sync(["https://a.example/ok", "http://[bad", "https://c.example/ok"])
+
+    assert [result.ok for result in results] == [True, False, True]
+    assert isinstance(results[1].error, ValueError)
+    assert results[2].text == "loaded https://c.example/ok"
+
+
+def test_load_urls_bounds_global_and_per_host_concurrency(monkeypatch: pytest.MonkeyPatch) -> None:
+    tracker = _install_fake_chain(monkeypatch)
+    urls = [f"https://busy.example/{i}" for i in range(8)] + [f"https://other{i}.example/" for i in range(8)]
+
+    batch.load_urls_sync(urls, concurrency=4, per_host_limit=2)
+
+    assert tracker["max_active"] <= 4
+    assert tracker["max:busy.example"] <= 2
+
+
+def test_load_urls_starts_other_hosts_while_a_busy_host_waits(monkeypatch: pytest.MonkeyPatch) -> None:
+    tracker = {"active": 0, "max_active": 0}
+    started: list[str] = []
+
+    def resolve(url: str, **_: object) -> FakeLoadChain:
+        started.append(batch._host_key(url))
+        return FakeLoadChain(url, tracker)
+
+    monkeypatch.setattr(batch, "resolve_load_chain", resolve)
+    urls = [f"https://busy.example/{i}" for i in range(20)] + [f"https://other{i}.example/" for i in range(20)]
+
+    results = batch.load_urls_sync(urls, concurrency=4, per_host_limit=1)
+
+    assert all(result.ok for result in results)
+    assert started[:4] == ["busy.example", "other0.example", "other1.example", "other2.example"]
+    assert tracker["max:busy.example"] == 1
+
+
+def test_iter_load_urls_streams_as_results_finish(monkeypatch: pytest.MonkeyPatch) -> None:
+    tracker = {"active": 0, "max_active": 0}
+    delays = {"https://slow.example/": 0.2, "https://fast.example/": 0.0}
+    monkeypatch.setattr(batch, "resolve_load_chain", lambda url, **_: FakeLoadChain(url, tracker, delays[url]))
+
+    async def collect() -> list[str]:
+        return [result.url async for result in batch.iter_load_urls(["https://slow.example/", "https://fast.example/"])]
+
+    assert asyncio.run(collect()) == ["https://fast.example/", "https://slow.example/"]
+
+
+def test_load_urls_rejects_invalid_limits() -> None:
+    with pytest.raises(ValueError, match="concurrency"):
+        batch.load_urls_sync(["https://example.com"], concurrency=0)
@@ -0,0 +1,138 @@
+import threading
+from dataclasses import replace
+from pathlib import Path
+
+from kabigon.cache import CacheEntry
+from kabigon.cache import MemoryCache
+from kabigon.cache import SQLiteCache
+from kabigon.cache import normalize_cache_key
+from kabigon.core.loader import Loader
+from kabigon.load_chain import resolve_explicit_load_chain
+from kabigon.pipelines.catalog import ContentType
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 1_000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class CountingLoader(Loader):
+    calls = 0
+
+    async def load(self, url: str) -> str:
+        CountingLoader.calls += 1
+        return f"loaded {url}"
+
+
+def test_normalize_cache_key_collapses_equivalent_urls() -> None:
+    assert normalize_cache_key("HTTPS://Example.COM:443/a?b=2&a=1&utm_source=x#frag") == (
+        "https://example.com/a?a=1&b=2"
+    )
+    assert normalize_cache_key("https://example.com") == "https://example.com/"
+    assert normalize_cache_key("http://example.com:8080/") == "http://example.com:8080/"
+    assert normalize_cache_key("docs/report.pdf") == "docs/report.pdf"
+
+
+def test_memory_cache_expires_entries_by_content_type_ttl() -> None:
+    clock = FakeClock()
+    cache = MemoryCache(ttls={ContentType.SOCIAL_POST: 10, ContentType.DOCUMENT_PDF: 100}, clock=clock)
+
+    cache.put("https://x.com/a", "post", loader="twitter", content_type=ContentType.SOCIAL_POST)
+    cache.put("https://example.com/a.pdf", "pdf", loader="pdf", content_type=ContentType.DOCUMENT_PDF)
+    clock.now += 50
+
+    assert cache.get("https://x.com/a") is None
+    entry = cache.get("https://example.com/a.pdf")
+    assert entry is not None
+    assert entry.loader == "pdf"
+
+
+def test_memory_cache_skips_content_types_without_ttl() -> None:
+    cache = MemoryCache(ttls={})
+
+    assert cache.put("https://example.com", "text", loader="httpx", content_type=ContentType.GENERIC_WEB) is None
+    assert len(cache) == 0
+
+
+def test_memory_cache_evicts_least_recently_used() -> None:
+    cache = MemoryCache(max_entries=2)
+
+    for name in ("a", "b"):
+        cache.put(f"https://example.com/{name}", name, loader="httpx", content_type=ContentType.GENERIC_WEB)
+    cache.get("https://example.com/a")
+    cache.put("https://example.com/c", "c", loader="httpx", content_type=ContentType.GENERIC_WEB)
+
+    assert cache.get("https://example.com/a") is not None
+    assert cache.get("https://example.com/b") is None
+    assert cache.get("https://example.com/c") is not None
+
+
+def test_memory_cache_evicts_by_total_size() -> None:
+    cache = MemoryCache(max_bytes=10)
+
+    cache.put("https://example.com/a", "x" * 6, loader="httpx", content_type=ContentType.GENERIC_WEB)
+    cache.put("https://example.com/b", "y" * 6, loader="httpx", content_type=ContentType.GENERIC_WEB)
+
+    assert cache.get("https://example.com/a") is None
+    assert cache.total_bytes == 6
+
+
+def test_sqlite_cache_persists_and_evicts_by_size(tmp_path: Path) -> None:
+    clock = FakeClock()
+    path = tmp_path / "cache.sqlite3"
+    cache = SQLiteCache(path, max_bytes=10, clock=clock)
+
+    cache.put("https://example.com/a", "x" * 6, loader="httpx", content_type=ContentType.GENERIC_WEB)
+    clock.now += 1
+    cache.put("https://example.com/b", "y" * 6, loader="curl-cffi", content_type=ContentType.GENERIC_WEB)
+    cache.close()
+
+    reopened = SQLiteCache(path, max_bytes=10, clock=clock)
+    assert reopened.get("https://example.com/a") is None
+    entry = reopened.get("https://example.com/b#section")
+    assert entry is not None
+    assert entry.text == "y" * 6
+    assert entry.loader == "curl-cffi"
+    assert entry.content_type == ContentType.GENERIC_WEB
+
+    clock.now += 3_600
+    assert reopened.get("https://example.com/b") is None
+    reopened.close()
+
+
+def test_load_chain_serves_cached_content_without_running_loaders() -> None:
+    CountingLoader.calls = 0
+    cache = MemoryCache()
+    chain = resolve_explicit_load_chain("https://example.com", ("counting",), {"counting": CountingLoader}.__getitem__)
+    cached_chain = replace(chain, cache=cache)
+
+    assert cached_chain.load_sync() == "loaded https://example.com"
+    assert cached_chain.load_sync() == "loaded https://example.com"
+
+    assert CountingLoader.calls == 1
+    entry = cache.get("https://example.com/")
+    assert entry is not None
+    assert entry.loader == "counting"
+
+
+def test_load_chain_reads_and_writes_cache_off_the_event_loop_thread() -> None:
+    threads: list[int] = []
+
+    class RecordingCache(MemoryCache):
+        def get(self, url: str) -> CacheEntry | None:
+            threads.append(threading.get_ident())
+            return super().get(url)
+
+        def put(self, url: str, text: str, *, loader: str, content_type: ContentType) -> CacheEntry | None:
+            threads.append(threading.get_ident())
+            return super().put(url, text, loader=loader, content_type=content_type)
+
+    chain = resolve_explicit_load_chain("https://example.com", ("counting",), {"counting": CountingLoader}.__getitem__)
+
+    assert replace(chain, cache=RecordingCache()).load_sync() == "loaded https://example.com"
+
+    assert len(threads) == 2
+    assert threading.get_ident() not in threads
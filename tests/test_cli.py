@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+import io
+import json
+import sys
 from collections.abc import Callable
 
 import pytest
@@ -94,3 +97,42 @@ def test_cli_loader_selection_reports_missing_requirements(monkeypatch: pytest.M
 
     with pytest.raises(MissingRequirementError, match="FIRECRAWL_API_KEY"):
         cli.main(["--loader", "firecrawl", "https://example.com"])
+
+
+def test_cli_plan_writes_json_lines(tmp_path, capsys: pytest.CaptureFixture[str]) -> None:
+    urls = tmp_path / "urls.txt"
+    urls.write_text("https://www.youtube.com/watch?v=dQw4w9WgXcQ\n\n  https://example.com/hello  \n")
+
+    cli.main(["plan", str(urls)])
+
+    plans = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    assert [plan["url"] for plan in plans] == [
+        "https://www.youtube.com/watch?v=dQw4w9WgXcQ",
+        "https://example.com/hello",
+    ]
+    assert [plan["content_type"] for plan in plans] == ["youtube_video", "generic_web"]
+    assert plans[0]["execution_plan"][:2] == ["youtube", "youtube-ytdlp"]
+
+
+def test_cli_plan_reads_stdin(monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]) -> None:
+    monkeypatch.setattr(sys, "stdin", io.StringIO("https://openai.com/pricing\n"))
+
+    cli.main(["plan"])
+
+    [plan] = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    assert plan["pipeline"] == "openai_web"
+
+
+def test_cli_plan_reports_bad_urls_and_exits_non_zero(tmp_path, capsys: pytest.CaptureFixture[str]) -> None:
+    urls = tmp_path / "urls.txt"
+    urls.write_text("http://[bad\nhttps://example.com/hello\n")
+
+    with pytest.raises(SystemExit) as exc_info:
+        cli.main(["plan", str(urls)])
+
+    assert exc_info.value.code == 1
+    bad, good = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    assert bad["url"] == "http://[bad"
+    assert bad["error"]
+    assert good["url"] == "https://example.com/hello"
+    assert good["content_type"] == "generic_web"
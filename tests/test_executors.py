@@ -0,0 +1,96 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from kabigon import executors
+from kabigon.core.errors import ExecutorSaturatedError
+from kabigon.executors import ExecutorConfig
+from kabigon.executors import ExecutorKind
+from kabigon.executors import configure_executors
+from kabigon.executors import executor_stats
+from kabigon.executors import run_cpu
+from kabigon.executors import run_io
+from kabigon.timing import TimingStage
+from kabigon.timing import collect_timings
+from kabigon.timing import timed
+
+
+@pytest.fixture(autouse=True)
+def fresh_executors(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(executors, "_configs", dict(executors.DEFAULT_EXECUTOR_CONFIGS))
+    monkeypatch.setattr(executors, "_pools", {})
+
+
+def _timed_work(value: int) -> int:
+    with timed(TimingStage.CONVERT):
+        return value * 2
+
+
+def test_run_cpu_carries_context_into_the_worker() -> None:
+    async def main() -> int:
+        with collect_timings() as events:
+            result = await run_cpu(_timed_work, 21)
+        assert [event.stage for event in events] == [TimingStage.CONVERT]
+        return result
+
+    assert asyncio.run(main()) == 42
+    stats = executor_stats()[ExecutorKind.CPU]
+    assert (stats.completed, stats.running, stats.queued) == (1, 0, 0)
+    assert executor_stats()[ExecutorKind.IO].completed == 0
+
+
+def test_executor_bounds_concurrent_calls() -> None:
+    configure_executors(io=ExecutorConfig(workers=2))
+    active = 0
+    peak = 0
+    lock = threading.Lock()
+
+    def work() -> None:
+        nonlocal active, peak
+        with lock:
+            active += 1
+            peak = max(peak, active)
+        time.sleep(0.02)
+        with lock:
+            active -= 1
+
+    async def main() -> None:
+        await asyncio.gather(*(run_io(work) for _ in range(6)))
+
+    asyncio.run(main())
+    assert peak == 2
+    assert executor_stats()[ExecutorKind.IO].completed == 6
+
+
+def test_saturated_executor_rejects_new_calls() -> None:
+    configure_executors(cpu=ExecutorConfig(workers=1, max_queue=1))
+    started = threading.Event()
+    release = threading.Event()
+
+    def block() -> None:
+        started.set()
+        release.wait()
+
+    async def main() -> None:
+        running = asyncio.ensure_future(run_cpu(block))
+        waiting = asyncio.ensure_future(run_cpu(block))
+        await asyncio.to_thread(started.wait)
+
+        stats = executor_stats()[ExecutorKind.CPU]
+        assert (stats.running, stats.queued, stats.saturated) == (1, 1, True)
+        with pytest.raises(ExecutorSaturatedError, match="cpu executor is saturated"):
+            await run_cpu(block)
+
+        release.set()
+        await asyncio.gather(running, waiting)
+
+    asyncio.run(main())
+    stats = executor_stats()[ExecutorKind.CPU]
+    assert (stats.completed, stats.rejected, stats.queued) == (2, 1, 0)
+
+
+def test_configure_executors_rejects_empty_pools() -> None:
+    with pytest.raises(ValueError, match="at least 1"):
+        configure_executors(cpu=ExecutorConfig(workers=0))
@@ -1,16 +1,25 @@
+import asyncio
+from dataclasses import replace
+
 import pytest
 
+from kabigon import load_chain
 from kabigon.core.errors import LoaderContentError
 from kabigon.core.errors import LoaderError
 from kabigon.core.errors import LoaderNotApplicableError
 from kabigon.core.errors import LoaderTimeoutError
 from kabigon.core.errors import MissingRequirementError
 from kabigon.core.loader import Loader
-from kabigon.load_chain import DEFAULT_FALLBACK_LOADERS
+from kabigon.load_chain import LoadChain
+from kabigon.load_chain import LoadChainPlanner
 from kabigon.load_chain import explain_load_chain
 from kabigon.load_chain import resolve_explicit_load_chain
 from kabigon.load_chain import resolve_load_chain
 from kabigon.pipelines.catalog import ContentType
+from kabigon.pipelines.catalog import ExecutionMode
+
+# The default fallback tail without source-specific loaders, which the planner drops for other URLs.
+GENERIC_FALLBACK_LOADERS = ("curl-cffi", "playwright-networkidle", "playwright-fast", "httpx")
 
 
 class EmptyLoader(Loader):
@@ -55,15 +64,44 @@ class SourceApplicabilityLoader(Loader):
         return "should not load"
 
 
+class SlowLoader(Loader):
+    cancelled = False
+
+    async def load(self, url: str) -> str:
+        try:
+            await asyncio.sleep(5)
+        except asyncio.CancelledError:
+            SlowLoader.cancelled = True
+            raise
+        return "slow result"
+
+
+class BlockedPageLoader(Loader):
+    async def load(self, url: str) -> str:
+        return "Just a moment... checking your browser"
+
+
+def _concurrent_chain(loader_names: tuple[str, ...], mode: ExecutionMode, **options: float) -> LoadChain:
+    chain = resolve_explicit_load_chain(
+        "https://example.com",
+        loader_names,
+        {
+            "slow": SlowLoader,
+            "blocked": BlockedPageLoader,
+            "success": SuccessLoader,
+            "timeout": TimeoutLoader,
+        }.__getitem__,
+    )
+    return replace(chain, explanation=replace(chain.explanation, execution_mode=mode, **options))
+
+
 def test_load_chain_explains_youtube_decision() -> None:
     explanation = explain_load_chain("https://www.youtube.com/watch?v=dQw4w9WgXcQ")
 
     assert explanation.pipeline == "youtube"
     assert explanation.content_type == ContentType.YOUTUBE_VIDEO
     assert explanation.targeted_loaders == ("youtube", "youtube-ytdlp")
-    assert explanation.fallback_loaders == tuple(
-        loader_name for loader_name in DEFAULT_FALLBACK_LOADERS if loader_name not in explanation.targeted_loaders
-    )
+    assert explanation.fallback_loaders == GENERIC_FALLBACK_LOADERS
     assert explanation.execution_plan[:2] == ("youtube", "youtube-ytdlp")
     assert explanation.requirements == ()
 
@@ -74,8 +112,8 @@ def test_load_chain_explains_generic_web_default_order() -> None:
     assert explanation.pipeline is None
     assert explanation.content_type == ContentType.GENERIC_WEB
     assert explanation.targeted_loaders == ()
-    assert explanation.fallback_loaders == DEFAULT_FALLBACK_LOADERS
-    assert explanation.execution_plan == DEFAULT_FALLBACK_LOADERS
+    assert explanation.fallback_loaders == GENERIC_FALLBACK_LOADERS
+    assert explanation.execution_plan == GENERIC_FALLBACK_LOADERS
 
 
 def test_load_chain_deduplicates_targeted_loaders_from_fallback() -> None:
@@ -234,6 +272,20 @@ def test_explain_load_chain_does_not_build_loader_for_missing_requirement(monkey
     assert explanation.missing_requirements == ("FIRECRAWL_API_KEY",)
 
 
+def test_load_chain_planner_checks_requirements_once_per_plan(monkeypatch) -> None:
+    monkeypatch.delenv("FIRECRAWL_API_KEY", raising=False)
+    checked: list[str] = []
+    monkeypatch.setattr(load_chain.os, "getenv", lambda name: checked.append(name))
+    urls = [f"https://openai.com/index/post-{i}" for i in range(3)]
+
+    explanations = list(LoadChainPlanner().explain_all(urls))
+
+    assert [explanation.as_dict()["missing_requirements"] for explanation in explanations] == [
+        ["FIRECRAWL_API_KEY"]
+    ] * 3
+    assert checked.count("FIRECRAWL_API_KEY") == 1
+
+
 def test_resolve_load_chain_checks_requirements_before_building_loader(monkeypatch) -> None:
     monkeypatch.delenv("FIRECRAWL_API_KEY", raising=False)
 
@@ -253,4 +305,67 @@ def test_load_chain_explanation_as_dict_uses_public_shapes() -> None:
         "execution_plan": list(explanation.execution_plan),
         "requirements": [],
         "missing_requirements": [],
+        "execution_mode": ExecutionMode.SEQUENTIAL,
+        "hedge_delay": explanation.hedge_delay,
+        "race_width": explanation.race_width,
+        "pruned_loaders": [],
     }
+
+
+def test_load_chain_defaults_to_sequential_execution() -> None:
+    explanation = explain_load_chain("https://example.com/some-page")
+
+    assert explanation.execution_mode == ExecutionMode.SEQUENTIAL
+
+
+def test_resolve_load_chain_accepts_execution_mode_override() -> None:
+    chain = resolve_load_chain("https://example.com/some-page", execution_mode=ExecutionMode.HEDGED)
+
+    assert chain.explanation.execution_mode == ExecutionMode.HEDGED
+
+
+def test_hedged_load_chain_starts_next_loader_after_delay() -> None:
+    SlowLoader.cancelled = False
+    chain = _concurrent_chain(("slow", "success"), ExecutionMode.HEDGED, hedge_delay=0.01)
+
+    assert chain.load_sync() == "loaded https://example.com"
+    assert SlowLoader.cancelled
+
+
+def test_hedged_load_chain_moves_on_immediately_after_failure() -> None:
+    chain = _concurrent_chain(("timeout", "success"), ExecutionMode.HEDGED, hedge_delay=60.0)
+
+    assert asyncio.run(asyncio.wait_for(chain.load(), timeout=1.0)) == "loaded https://example.com"
+
+
+def test_race_load_chain_skips_blocked_pages() -> None:
+    chain = _concurrent_chain(("blocked", "slow", "success"), ExecutionMode.RACE, race_width=2)
+
+    assert asyncio.run(asyncio.wait_for(chain.load(), timeout=1.0)) == "loaded https://example.com"
+
+
+def test_race_load_chain_reports_every_failed_attempt() -> None:
+    chain = _concurrent_chain(("blocked", "timeout"), ExecutionMode.RACE, race_width=2)
+
+    with pytest.raises(LoaderError) as exc_info:
+        chain.load_sync()
+
+    assert sorted(exc_info.value.details) == [
+        "BlockedPageLoader: Content extraction failed - Detected block/challenge marker: 'just a moment...'",
+        "TimeoutLoader: Timeout after 3.0s",
+    ]
+
+
+def test_explain_load_chain_keeps_applicable_source_loaders_in_fallback() -> None:
+    explanation = explain_load_chain("https://www.youtube.com/watch?v=dQw4w9WgXcQ&list=PL1")
+
+    assert "reel" not in explanation.fallback_loaders
+    assert "pdf" not in explanation.fallback_loaders
+    assert explain_load_chain("https://example.com/report.pdf").execution_plan[0] == "pdf"
+
+
+def test_load_chain_checks_applicability_before_building_loader() -> None:
+    chain = resolve_explicit_load_chain("https://example.com/page", ("reel", "httpx"))
+    chain = replace(chain, get_factory={"reel": ConstructorFailLoader, "httpx": SuccessLoader}.__getitem__)
+
+    assert chain.load_sync() == "loaded https://example.com/page"
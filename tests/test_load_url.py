@@ -1,9 +1,10 @@
 import pytest
 
 import kabigon
-from kabigon.load_chain import DEFAULT_FALLBACK_LOADERS
 from kabigon.load_chain import explain_load_chain
 
+GENERIC_FALLBACK_LOADERS = ("curl-cffi", "playwright-networkidle", "playwright-fast", "httpx")
+
 
 def test_load_url_function_exists() -> None:
     """Test that load_url_sync function exists and is callable."""
@@ -34,17 +35,17 @@ def test_build_execution_plan_for_url_youtube_is_targeted_then_fallback() -> Non
 def test_build_execution_plan_for_youtube_playlist_uses_default_order() -> None:
     execution_plan = explain_load_chain("https://www.youtube.com/playlist?list=PL123").execution_plan
 
-    assert execution_plan == DEFAULT_FALLBACK_LOADERS
+    assert execution_plan == GENERIC_FALLBACK_LOADERS
 
 
 def test_build_execution_plan_for_url_unknown_uses_default_order() -> None:
     execution_plan = explain_load_chain("https://example.com/hello").execution_plan
-    assert execution_plan == DEFAULT_FALLBACK_LOADERS
+    assert execution_plan == GENERIC_FALLBACK_LOADERS
 
 
 def test_build_execution_plan_for_non_pdf_file_uses_default_order() -> None:
     execution_plan = explain_load_chain("not-a-valid-url").execution_plan
-    assert execution_plan == DEFAULT_FALLBACK_LOADERS
+    assert execution_plan == GENERIC_FALLBACK_LOADERS
 
 
 def test_targeted_loaders_are_prefix_of_execution_plan() -> None:
@@ -69,6 +70,27 @@ def test_explain_plan_includes_openai_web_requirements() -> None:
     assert "missing_requirements" in plan
 
 
+def test_explain_plans_matches_explain_plan_per_url() -> None:
+    urls = [
+        "https://www.youtube.com/watch?v=dQw4w9WgXcQ",
+        "https://github.com/a/b/blob/main/demo.pdf",
+        "https://openai.com/pricing",
+        "https://example.com/report.pdf",
+        "https://example.com/hello",
+        "not-a-valid-url",
+    ]
+
+    assert list(kabigon.explain_plans(urls)) == [kabigon.explain_plan(url) for url in urls]
+
+
+def test_explain_plans_reports_malformed_url_and_keeps_going() -> None:
+    plans = list(kabigon.explain_plans(["https://example.com/a", "http://[bad", "https://openai.com/pricing"]))
+
+    assert [plan["url"] for plan in plans] == ["https://example.com/a", "http://[bad", "https://openai.com/pricing"]
+    assert plans[1] == {"url": "http://[bad", "error": "Invalid IPv6 URL"}
+    assert plans[2]["pipeline"] == "openai_web"
+
+
 def test_load_url_invalid_url() -> None:
     """Test that load_url raises exception for invalid URLs."""
     # Invalid URL should fail in all loaders and raise an exception
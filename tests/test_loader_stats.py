@@ -0,0 +1,188 @@
+import json
+from dataclasses import replace
+
+from kabigon.core.errors import LoaderContentError
+from kabigon.core.loader import Loader
+from kabigon.load_chain import LoadChain
+from kabigon.load_chain import explain_load_chain
+from kabigon.loader_stats import DEFAULT_HALF_LIFE
+from kabigon.loader_stats import LoaderStats
+from kabigon.loader_stats import stats_host
+
+URL = "https://www.example.com/article"
+
+
+class Clock:
+    def __init__(self) -> None:
+        self.now = 1_000_000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _fail(stats: LoaderStats, loader: str, times: int = 3) -> None:
+    for _ in range(times):
+        stats.record(URL, loader, success=False)
+
+
+def test_stats_host_ignores_www_and_case() -> None:
+    assert stats_host("https://WWW.Example.com:8443/a") == "example.com"
+    assert stats_host("not-a-url") == ""
+
+
+def test_plan_prunes_failing_loaders_and_promotes_working_ones() -> None:
+    stats = LoaderStats()
+    _fail(stats, "ptt")
+    _fail(stats, "curl-cffi")
+    stats.record(URL, "httpx", success=True)
+
+    plan = stats.plan(URL, ("ptt", "twitter", "curl-cffi", "playwright", "httpx"))
+
+    assert plan.loaders == ("httpx", "twitter", "playwright")
+    assert plan.pruned == ("ptt", "curl-cffi")
+
+
+def test_plan_keeps_loaders_with_too_little_evidence() -> None:
+    stats = LoaderStats()
+    _fail(stats, "ptt", times=2)
+
+    assert stats.plan(URL, ("ptt", "httpx")).loaders == ("ptt", "httpx")
+
+
+def test_plan_never_prunes_every_loader() -> None:
+    stats = LoaderStats()
+    _fail(stats, "curl-cffi")
+    _fail(stats, "httpx")
+
+    plan = stats.plan(URL, ("curl-cffi", "httpx"))
+
+    assert plan.loaders == ("curl-cffi", "httpx")
+    assert plan.pruned == ()
+
+
+def test_failures_age_out_so_pruned_loaders_return() -> None:
+    clock = Clock()
+    stats = LoaderStats(clock=clock)
+    _fail(stats, "curl-cffi")
+    assert stats.plan(URL, ("curl-cffi", "httpx")).pruned == ("curl-cffi",)
+
+    clock.now += 2 * DEFAULT_HALF_LIFE
+
+    assert stats.plan(URL, ("curl-cffi", "httpx")).pruned == ()
+
+
+def test_stats_persist_to_json(tmp_path) -> None:
+    path = tmp_path / "stats" / "loaders.json"
+    stats = LoaderStats(path)
+    _fail(stats, "curl-cffi")
+    stats.record(URL, "httpx", success=True)
+    stats.flush()
+
+    reloaded = LoaderStats(path)
+
+    assert json.loads(path.read_text())["version"] == 1
+    assert reloaded.plan(URL, ("curl-cffi", "playwright", "httpx")).loaders == ("httpx", "playwright")
+
+
+def test_flush_drops_decayed_records_from_memory() -> None:
+    clock = Clock()
+    stats = LoaderStats(clock=clock)
+    stats.record(URL, "httpx", success=True)
+    clock.now += 20 * DEFAULT_HALF_LIFE
+    stats.record("https://fresh.example/", "httpx", success=True)
+
+    assert stats.get(URL, "httpx") is not None
+    stats.flush()
+
+    assert stats.get(URL, "httpx") is None
+    assert stats.get("https://fresh.example/", "httpx") is not None
+
+
+def test_flush_if_due_throttles_writes(tmp_path) -> None:
+    path = tmp_path / "loaders.json"
+    clock = Clock()
+    stats = LoaderStats(path, flush_interval=30.0, clock=clock)
+    stats.record(URL, "httpx", success=True)
+    stats.flush_if_due()
+    written = path.read_text()
+
+    stats.record(URL, "httpx", success=False)
+    clock.now += 10
+    stats.flush_if_due()
+    assert path.read_text() == written
+
+    clock.now += 30
+    stats.flush_if_due()
+    assert path.read_text() != written
+
+
+def test_failed_flush_is_logged_and_retried(tmp_path, caplog) -> None:
+    blocker = tmp_path / "not-a-directory"
+    blocker.write_text("")
+    stats = LoaderStats(blocker / "loaders.json")
+    stats.record(URL, "httpx", success=True)
+
+    with caplog.at_level("WARNING", logger="kabigon.loader_stats"):
+        stats.flush()
+
+    assert "Could not write loader statistics" in caplog.text
+    blocker.unlink()
+    stats.flush()
+    assert LoaderStats(blocker / "loaders.json").get(URL, "httpx") is not None
+
+
+def test_unreadable_stats_file_is_ignored(tmp_path) -> None:
+    path = tmp_path / "loaders.json"
+    path.write_text("{not json")
+
+    assert LoaderStats(path).plan(URL, ("httpx",)).loaders == ("httpx",)
+
+
+def test_explain_load_chain_shows_learned_plan() -> None:
+    stats = LoaderStats()
+    _fail(stats, "curl-cffi")
+    stats.record(URL, "httpx", success=True)
+
+    explanation = explain_load_chain(URL, stats=stats)
+
+    assert explanation.execution_plan == ("httpx", "playwright-networkidle", "playwright-fast")
+    assert explanation.pruned_loaders == ("curl-cffi",)
+    assert explanation.as_dict()["pruned_loaders"] == ["curl-cffi"]
+
+
+def test_load_chain_records_attempt_outcomes() -> None:
+    class FailingLoader(Loader):
+        async def load(self, url: str) -> str:
+            raise LoaderContentError("FailingLoader", url, "blocked")
+
+    class WorkingLoader(Loader):
+        async def load(self, url: str) -> str:
+            return "loaded"
+
+    stats = LoaderStats(clock=Clock())
+    explanation = replace(explain_load_chain(URL, stats=stats), execution_plan=("failing", "working", "unused"))
+    factories = {"failing": FailingLoader, "working": WorkingLoader}
+    chain = LoadChain(get_factory=factories.__getitem__, explanation=explanation, stats=stats)
+
+    assert chain.load_sync() == "loaded"
+    failing = stats.get(URL, "failing")
+    working = stats.get(URL, "working")
+    assert failing is not None
+    assert failing.failures == 1
+    assert working is not None
+    assert working.successes == 1
+    assert stats.get(URL, "unused") is None
+
+
+def test_load_chain_succeeds_when_stats_cannot_be_written(tmp_path) -> None:
+    class WorkingLoader(Loader):
+        async def load(self, url: str) -> str:
+            return "loaded"
+
+    blocker = tmp_path / "not-a-directory"
+    blocker.write_text("")
+    stats = LoaderStats(blocker / "loaders.json", clock=Clock())
+    explanation = replace(explain_load_chain(URL, stats=stats), execution_plan=("working",))
+    chain = LoadChain(get_factory={"working": WorkingLoader}.__getitem__, explanation=explanation, stats=stats)
+
+    assert chain.load_sync() == "loaded"
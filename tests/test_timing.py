@@ -0,0 +1,101 @@
+import asyncio
+
+import pytest
+
+from kabigon.core.errors import LoaderError
+from kabigon.core.loader import Loader
+from kabigon.load_chain import LoadChain
+from kabigon.load_chain import resolve_explicit_load_chain
+from kabigon.loaders.content_guard import ensure_usable_content
+from kabigon.loaders.utils import html_to_markdown
+from kabigon.timing import TimingEvent
+from kabigon.timing import TimingOutcome
+from kabigon.timing import TimingStage
+from kabigon.timing import collect_timings
+from kabigon.timing import timed
+from kabigon.timing import timing_hook
+
+HTML = "<html><body><p>" + "Real article text. " * 30 + "</p></body></html>"
+
+
+class ConvertingLoader(Loader):
+    async def load(self, url: str) -> str:
+        with timed(TimingStage.FETCH) as span:
+            span.record(bytes_out=HTML.encode())
+        result = html_to_markdown(HTML)
+        ensure_usable_content(result, loader_name="ConvertingLoader", url=url)
+        return result
+
+
+class FailingLoader(Loader):
+    async def load(self, url: str) -> str:
+        raise RuntimeError("boom")
+
+
+def _chain(*loader_names: str) -> LoadChain:
+    return resolve_explicit_load_chain(
+        "https://example.com/article",
+        loader_names,
+        {"converting": ConvertingLoader, "failing": FailingLoader}.__getitem__,
+    )
+
+
+def test_load_chain_emits_stage_events_attributed_to_the_attempt() -> None:
+    with collect_timings() as events:
+        text = _chain("failing", "converting").load_sync()
+
+    assert [(event.stage, event.loader, event.outcome) for event in events] == [
+        (TimingStage.ATTEMPT, "failing", TimingOutcome.ERROR),
+        (TimingStage.FETCH, "converting", TimingOutcome.OK),
+        (TimingStage.CONVERT, "converting", TimingOutcome.OK),
+        (TimingStage.GUARD, "converting", TimingOutcome.OK),
+        (TimingStage.ATTEMPT, "converting", TimingOutcome.OK),
+    ]
+    assert all(event.url == "https://example.com/article" for event in events)
+    assert events[0].error == "RuntimeError: boom"
+    assert events[1].bytes_out == len(HTML.encode())
+    assert events[2].bytes_in == len(HTML)
+    assert events[-1].bytes_out == len(text.encode())
+    assert all(event.duration >= 0 for event in events)
+
+
+def test_failed_chain_still_reports_attempts() -> None:
+    with collect_timings() as events, pytest.raises(LoaderError):
+        _chain("failing").load_sync()
+
+    assert [event.outcome for event in events] == [TimingOutcome.ERROR]
+
+
+def test_timed_reports_cancellation() -> None:
+    async def run() -> None:
+        async def slow() -> None:
+            with timed(TimingStage.FETCH, url="https://example.com", loader="slow"):
+                await asyncio.sleep(5)
+
+        task = asyncio.create_task(slow())
+        await asyncio.sleep(0)
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+
+    with collect_timings() as events:
+        asyncio.run(run())
+
+    assert [event.outcome for event in events] == [TimingOutcome.CANCELLED]
+
+
+def test_broken_timing_hook_does_not_fail_the_load() -> None:
+    def broken(event: TimingEvent) -> None:
+        raise ValueError("hook failed")
+
+    with timing_hook(broken):
+        assert _chain("converting").load_sync().startswith("Real article text.")
+
+
+def test_no_events_outside_hook_blocks() -> None:
+    with collect_timings() as events:
+        pass
+
+    with timed(TimingStage.PLAN, url="https://example.com"):
+        pass
+
+    assert events == []